@@ -0,0 +1,7 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Offline benchmarks for py_france_rte, run them with
+"python -m benchmarks.<benchmark_name>" from the repository root
+"""
@@ -0,0 +1,106 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Parse time and memory of one year of 15 minutes generation mix,
+as parsed dicts and as columnar NumPy series
+
+Run with "python -m benchmarks.bench_columnar"
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import time
+import tracemalloc
+
+from benchmarks.stub_server import make_values
+from py_france_rte.columnar import to_columnar
+
+START = datetime.datetime.fromisoformat("2019-01-01T00:00:00+01:00")
+END = datetime.datetime.fromisoformat("2020-01-01T00:00:00+01:00")
+
+
+def make_response(series_count: int) -> bytes:
+    """
+    Generate one year of 15 minutes values for series_count series
+    """
+
+    values_ = make_values(START, END, datetime.timedelta(minutes=15))
+    return json.dumps({"generation_mix_15min_time_scale": [
+        {"start_date": START.isoformat(),
+         "end_date": END.isoformat(),
+         "production_type": f"TYPE_{index_}",
+         "values": values_}
+        for index_ in range(series_count)]}).encode("utf-8")
+
+
+def parse_dicts(response: dict) -> list:
+    """
+    Parse each value of a decoded response in a Python loop,
+    the same dates and values as to_columnar
+    """
+
+    return [[(datetime.datetime.fromisoformat(value_["start_date"]),
+              datetime.datetime.fromisoformat(value_["end_date"]),
+              float(value_["value"]),
+              datetime.datetime.fromisoformat(value_["updated_date"])
+              if value_.get("updated_date") else None)
+             for value_ in series_["values"]]
+            for series_ in response["generation_mix_15min_time_scale"]]
+
+
+def measure(parse, body: bytes) -> "tuple[float, int, int]":
+    """
+    Returns parse time once decoded, peak and retained memory
+    of decoding a response and parsing it with a parse function
+    """
+
+    gc.collect()
+    response_ = json.loads(body)
+    start_ = time.perf_counter()
+    result_ = parse(response_)
+    duration_ = time.perf_counter() - start_
+    del result_, response_
+
+    # Memory is traced in a second run, tracing slows allocations down
+    gc.collect()
+    tracemalloc.start()
+    result_ = parse(json.loads(body))
+    gc.collect()
+    (retained_, peak_) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result_
+    return (duration_, peak_, retained_)
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results
+    """
+
+    parser_ = argparse.ArgumentParser(description=__doc__)
+    parser_.add_argument("--series", type=int, default=10)
+    args_ = parser_.parse_args()
+
+    body_ = make_response(args_.series)
+    start_ = time.perf_counter()
+    json.loads(body_)
+    print(f"{args_.series} series, {len(body_) / 2 ** 20:.1f} MiB of json "
+          f"decoded in {time.perf_counter() - start_:.2f} s")
+
+    durations_ = {}
+    for (name_, parse_) in (("dicts", parse_dicts),
+                            ("columnar", to_columnar)):
+        (duration_, peak_, retained_) = measure(parse_, body_)
+        durations_[name_] = duration_
+        print(f"  {name_:<10} {duration_:>7.2f} s  "
+              f"peak {peak_ / 2 ** 20:>8.1f} MiB  "
+              f"retained {retained_ / 2 ** 20:>8.1f} MiB")
+    print(f"  columnar parse speedup "
+          f"{durations_['dicts'] / durations_['columnar']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
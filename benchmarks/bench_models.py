@@ -0,0 +1,92 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Memory held by one year of hourly per unit generation, as decoded
+dicts and as compact Series models, each measured in its own process
+
+Run with "python -m benchmarks.bench_models"
+"""
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import tracemalloc
+
+from benchmarks.stub_server import make_payload
+
+START_DATE = "2019-01-01T00:00:00+01:00"
+END_DATE = "2020-01-01T00:00:00+01:00"
+
+
+def current_rss_mib() -> float:
+    """
+    Current resident memory of the process, 0 where unavailable
+    """
+
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as file_:
+            pages_ = int(file_.read().split()[1])
+    except OSError:
+        return 0.
+    return pages_ * 4096 / 2 ** 20
+
+
+def hold(form: str, units: int) -> None:
+    """
+    Decode the dataset in a form and print the memory it holds
+    """
+
+    body_ = make_payload(
+        "/actual_generations_per_unit",
+        f"start_date={START_DATE}&end_date={END_DATE}".replace("+", "%2B"),
+        units)
+    # Each unit holds its own values, as in real responses
+    body_ = json.dumps(json.loads(body_)).encode("utf-8")
+    gc.collect()
+    rss_ = current_rss_mib()
+    tracemalloc.start()
+
+    if form == "dicts":
+        held_ = json.loads(body_)
+    else:
+        from py_france_rte.models import to_models
+        held_ = to_models(json.loads(body_))
+    del body_
+    gc.collect()
+
+    (traced_, _) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(json.dumps({"traced_mib": traced_ / 2 ** 20,
+                      "rss_mib": current_rss_mib() - rss_,
+                      "held": len(held_)}))
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results
+    """
+
+    parser_ = argparse.ArgumentParser(description=__doc__)
+    parser_.add_argument("--units", type=int, default=50)
+    parser_.add_argument("--child", help=argparse.SUPPRESS)
+    args_ = parser_.parse_args()
+
+    if args_.child:
+        hold(args_.child, args_.units)
+        return
+
+    print(f"{args_.units} units, {args_.units * 8760} hourly values")
+    for form_ in ("dicts", "models"):
+        result_ = json.loads(subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_models",
+             "--units", str(args_.units), "--child", form_],
+            check=True, capture_output=True, text=True).stdout)
+        print(f"  {form_:<8} traced {result_['traced_mib']:>8.1f} MiB  "
+              f"RSS {result_['rss_mib']:>8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Duration of a chunked per unit backfill against a latency-injecting
+local stub server, from 1 to N workers
+
+Run with "python -m benchmarks.bench_parallel"
+"""
+
+import argparse
+import time
+
+from benchmarks.stub_server import serve, stub_application
+from py_france_rte.application import Application
+
+START_DATE = "2019-01-01T00:00:00+01:00"
+END_DATE = "2021-01-01T00:00:00+01:00"
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results
+    """
+
+    parser_ = argparse.ArgumentParser(description=__doc__)
+    parser_.add_argument("--latency", type=float, default=0.05)
+    parser_.add_argument("--workers", type=int, nargs="+",
+                         default=[1, 2, 4, 8, 16])
+    args_ = parser_.parse_args()
+
+    with serve(latency=args_.latency, series_count=1) as server_:
+        reference_ = None
+        for workers_ in args_.workers:
+            application_ = stub_application(
+                Application, server_, "client", "secret",
+                ["Actual Generation"],
+                pool_size=max(workers_, 10),
+                max_workers=workers_)
+            start_ = time.perf_counter()
+            response_ = application_.request_chunked(
+                "actual_generation_per_unit", START_DATE, END_DATE)
+            duration_ = time.perf_counter() - start_
+            application_.close()
+
+            reference_ = reference_ or duration_
+            series_ = response_["actual_generations_per_unit"][0]
+            values_ = len(series_["values"])
+            print(f"{workers_:>3} worker(s) {duration_:>8.2f} s "
+                  f"speedup x{reference_ / duration_:<6.2f} "
+                  f"({values_} values)")
+
+
+if __name__ == "__main__":
+    main()
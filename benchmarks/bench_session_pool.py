@@ -0,0 +1,76 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Requests per second against a local stub server,
+with bare requests calls and with the application connection pool
+
+Run with "python -m benchmarks.bench_session_pool"
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks.stub_server import redirect_session, serve
+from py_france_rte.base_application import create_session
+from py_france_rte.modules.ecowatt import ECOWATT_URL
+
+
+def requests_per_second(get, count: int, threads: int) -> float:
+    """
+    Send count GET requests on ECOWATT_URL with the given callable
+    """
+
+    start_ = time.perf_counter()
+    if threads == 1:
+        for _ in range(count):
+            get(ECOWATT_URL).raise_for_status()
+    else:
+        with ThreadPoolExecutor(threads) as executor_:
+            for response_ in executor_.map(get, [ECOWATT_URL] * count):
+                response_.raise_for_status()
+    return count / (time.perf_counter() - start_)
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results
+    """
+
+    parser_ = argparse.ArgumentParser(description=__doc__)
+    parser_.add_argument("--count", type=int, default=500)
+    parser_.add_argument("--threads", type=int, default=8)
+    args_ = parser_.parse_args()
+
+    with serve() as server_:
+
+        def bare_get(url: str) -> requests.Response:
+            return requests.get(
+                url.replace(
+                    "https://digital.iservices.rte-france.com",
+                    server_.url),
+                timeout=10)
+
+        no_pool_ = create_session(pool_size=args_.threads, keep_alive=False)
+        redirect_session(no_pool_, server_.url, args_.threads)
+        pool_ = create_session(pool_size=args_.threads)
+        redirect_session(pool_, server_.url, args_.threads)
+
+        cases_ = {
+            "bare requests.get": bare_get,
+            "session, no keep-alive": no_pool_.get,
+            "pooled session": pool_.get,
+        }
+
+        for threads_ in (1, args_.threads):
+            print(f"{threads_} thread(s), {args_.count} requests")
+            for (name_, get_) in cases_.items():
+                rps_ = requests_per_second(get_, args_.count, threads_)
+                print(f"  {name_:<24} {rps_:>10.1f} req/s")
+
+
+if __name__ == "__main__":
+    main()
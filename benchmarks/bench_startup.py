@@ -0,0 +1,60 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Startup cost of the package : time to import Application in a new
+interpreter, and time to construct an Application subscribed to all
+supported APIs
+
+Run with "python -m benchmarks.bench_startup"
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+CHILD = """
+import json, sys, time
+start_ = time.perf_counter()
+from py_france_rte.application import Application
+imported_ = time.perf_counter() - start_
+modules_ = sorted(name_ for name_ in sys.modules
+                  if name_.startswith("py_france_rte"))
+print(json.dumps({"import_s": imported_, "modules": modules_}))
+"""
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results
+    """
+
+    parser_ = argparse.ArgumentParser(description=__doc__)
+    parser_.add_argument("--runs", type=int, default=10)
+    parser_.add_argument("--constructions", type=int, default=1000)
+    args_ = parser_.parse_args()
+
+    imports_ = []
+    for _ in range(args_.runs):
+        result_ = json.loads(subprocess.run(
+            [sys.executable, "-c", CHILD],
+            check=True, capture_output=True, text=True).stdout)
+        imports_.append(result_["import_s"])
+
+    from py_france_rte.application import Application
+    from py_france_rte.utils import SUPPORTED_APIS
+
+    start_ = time.perf_counter()
+    for _ in range(args_.constructions):
+        Application("client", "secret", SUPPORTED_APIS).close()
+    construction_ = (time.perf_counter() - start_) / args_.constructions
+
+    print(f"  import        {min(imports_) * 1e3:>8.2f} ms (best of "
+          f"{args_.runs}), {len(result_['modules'])} package modules")
+    print(f"  construction  {construction_ * 1e6:>8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Time to query two years of 15 minutes values of one production type,
+from json blobs and from a local SeriesStore
+
+Run with "python -m benchmarks.bench_store"
+"""
+
+import datetime
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.stub_server import make_values
+from py_france_rte.store import SeriesStore
+
+START = datetime.datetime.fromisoformat("2018-01-01T00:00:00+01:00")
+END = datetime.datetime.fromisoformat("2020-01-01T00:00:00+01:00")
+ENDPOINT = "generation_mix_15min_time_scale"
+TYPES = ("HYDRO_PUMPED_STORAGE", "NUCLEAR", "SOLAR", "WIND_ONSHORE")
+
+
+def make_blobs() -> "list[bytes]":
+    """
+    Generate monthly json blobs of all production types
+    """
+
+    blobs_ = []
+    month_ = START
+    while month_ < END:
+        next_ = (month_ + datetime.timedelta(days=32)).replace(day=1)
+        values_ = make_values(month_, next_, datetime.timedelta(minutes=15))
+        blobs_.append(json.dumps({ENDPOINT: [
+            {"start_date": month_.isoformat(),
+             "end_date": next_.isoformat(),
+             "production_type": type_,
+             "values": values_}
+            for type_ in TYPES]}).encode("utf-8"))
+        month_ = next_
+    return blobs_
+
+
+def query_blobs(blobs: "list[bytes]") -> float:
+    """
+    Decode every blob and sum the values of one production type
+    """
+
+    return sum(value_["value"]
+               for blob_ in blobs
+               for series_ in json.loads(blob_)[ENDPOINT]
+               if series_["production_type"] == TYPES[0]
+               for value_ in series_["values"])
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results
+    """
+
+    blobs_ = make_blobs()
+    with tempfile.TemporaryDirectory() as root_:
+        store_ = SeriesStore(root_)
+        start_ = time.perf_counter()
+        for blob_ in blobs_:
+            store_.write(json.loads(blob_))
+        print(f"  write      {time.perf_counter() - start_:>7.3f} s  "
+              f"({sum(map(len, blobs_)) / 2 ** 20:.1f} MiB of json)")
+
+        start_ = time.perf_counter()
+        total_ = query_blobs(blobs_)
+        print(f"  json       {time.perf_counter() - start_:>7.3f} s  "
+              f"(sum {total_:.0f})")
+
+        start_ = time.perf_counter()
+        series_ = store_.read(ENDPOINT, TYPES[0])
+        total_ = series_.values.sum()
+        print(f"  store      {time.perf_counter() - start_:>7.3f} s  "
+              f"(sum {total_:.0f}, {len(series_)} values)")
+
+        size_ = sum(os.path.getsize(os.path.join(path_, name_))
+                    for (path_, _, names_) in os.walk(root_)
+                    for name_ in names_)
+        print(f"  store size {size_ / 2 ** 20:>7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
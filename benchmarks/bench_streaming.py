@@ -0,0 +1,83 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Peak memory and duration of a large per unit response,
+decoded at once and streamed one unit at a time
+
+Run with "python -m benchmarks.bench_streaming"
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks.stub_server import make_payload, serve, stub_application
+from py_france_rte.application import Application
+
+START_DATE = "2020-01-01T00:00:00+01:00"
+END_DATE = "2020-01-08T00:00:00+01:00"
+
+
+def decoded(application: Application) -> int:
+    """
+    Decode the whole response, then count its values
+    """
+
+    response_ = application.request_actual_generation_per_unit(
+        START_DATE, END_DATE)
+    return sum(len(series_["values"])
+               for series_ in response_["actual_generations_per_unit"])
+
+
+def streamed(application: Application) -> int:
+    """
+    Count values of the response one unit at a time
+    """
+
+    return sum(len(series_["values"])
+               for series_ in application.stream_actual_generation_per_unit(
+                   START_DATE, END_DATE))
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results
+    """
+
+    parser_ = argparse.ArgumentParser(description=__doc__)
+    parser_.add_argument("--units", type=int, default=500)
+    args_ = parser_.parse_args()
+
+    # Generated once, so that the in-process server does not count
+    # in traced memory
+    payload_ = make_payload(
+        "/actual_generations_per_unit",
+        f"start_date={START_DATE}&end_date={END_DATE}".replace("+", "%2B"),
+        args_.units)
+    print(f"{args_.units} units, {len(payload_) / 2 ** 20:.1f} MiB of json")
+
+    with serve(payload=payload_) as server_:
+        application_ = stub_application(
+            Application, server_, "client", "secret",
+            ["Actual Generation"])
+        # Warm up the token and the connection
+        decoded(application_)
+
+        for (name_, run_) in (("decoded", decoded), ("streamed", streamed)):
+            gc.collect()
+            tracemalloc.start()
+            start_ = time.perf_counter()
+            values_ = run_(application_)
+            duration_ = time.perf_counter() - start_
+            (_, peak_) = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  {name_:<10} {duration_:>7.2f} s  "
+                  f"peak {peak_ / 2 ** 20:>8.1f} MiB  ({values_} values)")
+
+        application_.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Time to validate ten thousand candidate windows of one day, one at a
+time with verify_dates and in one pass with DateRules.check_dates
+
+Run with "python -m benchmarks.bench_validation"
+"""
+
+import datetime
+import time
+
+from py_france_rte.registry import DATE_LIMITS
+from py_france_rte.utils import verify_dates
+from py_france_rte.validation import date_rules
+
+START = datetime.datetime.fromisoformat("2015-01-01T00:00:00+01:00")
+COUNT = 10000
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results
+    """
+
+    limits_ = DATE_LIMITS["actual_generation_per_type"]
+    windows_ = [((START + datetime.timedelta(hours=index_)).isoformat(),
+                 (START + datetime.timedelta(hours=index_ + 24)).isoformat())
+                for index_ in range(COUNT)]
+
+    start_ = time.perf_counter()
+    for (start_date_, end_date_) in windows_:
+        verify_dates(start_date_, end_date_, *limits_)
+    one_by_one_ = time.perf_counter() - start_
+
+    start_ = time.perf_counter()
+    diagnostics_ = date_rules(*limits_).check_dates(windows_)
+    batch_ = time.perf_counter() - start_
+    assert diagnostics_ == [None] * COUNT
+
+    print(f"{COUNT} windows")
+    print(f"  verify_dates  {one_by_one_ * 1e6 / COUNT:>8.2f} us/window")
+    print(f"  check_dates   {batch_ * 1e6 / COUNT:>8.2f} us/window")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable=C0103
+
+"""
+This file contains a local stand-in for the RTE servers,
+used to benchmark the client without credentials nor network
+"""
+
+import collections
+import contextlib
+import datetime
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from requests.adapters import HTTPAdapter
+
+from py_france_rte.modules.actual_generation import (PRODUCTION_SUBTYPES,
+                                                     PRODUCTION_TYPES)
+
+RTE_HOST_URL = "https://digital.iservices.rte-france.com"
+
+TOKEN_PATH = "/token/oauth"
+
+TOKEN_PAYLOAD = json.dumps({
+    "access_token": "stub_token",
+    "token_type": "Bearer",
+    "expires_in": 7200}).encode("utf-8")
+
+ERROR_PAYLOAD = json.dumps({
+    "error": "STUB_ERROR",
+    "error_description": "Error injected by the stub server"}).encode("utf-8")
+
+# path suffix: (response key, time step of values)
+ACTUAL_GENERATION_ENDPOINTS = {
+    "actual_generations_per_production_type": (
+        "actual_generations_per_production_type",
+        datetime.timedelta(hours=1)),
+    "actual_generations_per_unit": (
+        "actual_generations_per_unit",
+        datetime.timedelta(hours=1)),
+    "water_reserves": (
+        "water_reserves",
+        datetime.timedelta(days=7)),
+    "generation_mix_15min_time_scale": (
+        "generation_mix_15min_time_scale",
+        datetime.timedelta(minutes=15)),
+}
+
+
+def make_values(
+        start: datetime.datetime,
+        end: datetime.datetime,
+        step: datetime.timedelta) -> "list[dict]":
+    """
+    Generate the values of a series between start and end
+    """
+
+    values_ = []
+    date_ = start
+    while date_ < end:
+        values_.append({
+            "start_date": date_.isoformat(),
+            "end_date": (date_ + step).isoformat(),
+            "value": len(values_) % 1000,
+            "updated_date": end.isoformat()})
+        date_ += step
+    return values_
+
+
+def _series_template(
+        endpoint: str,
+        series_count: int) -> "list[dict]":
+    """
+    Fields of the series of an endpoint, as sent by RTE servers
+    """
+
+    if endpoint == "actual_generations_per_production_type":
+        return [{"production_type": type_} for type_ in PRODUCTION_TYPES]
+    if endpoint == "generation_mix_15min_time_scale":
+        return [{"production_type": type_, "production_subtype": subtype_}
+                for type_ in PRODUCTION_TYPES
+                for subtype_ in PRODUCTION_SUBTYPES.get(type_, ["TOTAL"])]
+    if endpoint == "water_reserves":
+        return [{}]
+    return [{"unit": {"eic_code": f"STUB{index_:012d}",
+                      "name": f"STUB UNIT {index_}",
+                      "production_type": PRODUCTION_TYPES[
+                          index_ % len(PRODUCTION_TYPES)]}}
+            for index_ in range(series_count)]
+
+
+def make_ecowatt_payload() -> bytes:
+    """
+    Generate Ecowatt signals of the next four days
+    """
+
+    today_ = datetime.datetime.now(datetime.timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0)
+    return json.dumps({"signals": [{
+        "GenerationFichier": today_.isoformat(),
+        "jour": (today_ + datetime.timedelta(days=day_)).isoformat(),
+        "dvalue": 1,
+        "message": "Pas d'alerte.",
+        "values": [{"pas": hour_, "hvalue": 1} for hour_ in range(24)]}
+        for day_ in range(4)]}).encode("utf-8")
+
+
+def make_payload(path: str, query: str, series_count: int = 5) -> bytes:
+    """
+    Generate a response for a data request, holding a value for each time
+    step of the requested window in each series. Per unit responses hold
+    series_count units, other endpoints their production types.
+    """
+
+    endpoint_ = path.rstrip("/").rsplit("/", 1)[-1]
+    if endpoint_ not in ACTUAL_GENERATION_ENDPOINTS:
+        return make_ecowatt_payload()
+
+    (key_, step_) = ACTUAL_GENERATION_ENDPOINTS[endpoint_]
+    parameters_ = parse_qs(query)
+    if "start_date" in parameters_:
+        start_ = datetime.datetime.fromisoformat(parameters_["start_date"][0])
+        end_ = datetime.datetime.fromisoformat(parameters_["end_date"][0])
+    else:
+        end_ = datetime.datetime.now(datetime.timezone.utc).replace(
+            minute=0, second=0, microsecond=0)
+        start_ = end_ - datetime.timedelta(days=1)
+
+    series_ = _series_template(endpoint_, series_count)
+    for (filter_, field_) in (("production_type", "production_type"),
+                              ("production_subtype", "production_subtype")):
+        if filter_ in parameters_:
+            series_ = [fields_ for fields_ in series_
+                       if fields_.get(field_) == parameters_[filter_][0]]
+    if "unit_eic_code" in parameters_:
+        series_ = [{"unit": {"eic_code": parameters_["unit_eic_code"][0],
+                             "name": "STUB UNIT",
+                             "production_type": "NUCLEAR"}}]
+
+    values_ = make_values(start_, end_, step_)
+    return json.dumps({key_: [
+        dict(fields_,
+             start_date=start_.isoformat(),
+             end_date=end_.isoformat(),
+             values=values_)
+        for fields_ in series_]}).encode("utf-8")
+
+
+def load_recordings(directory: str) -> "dict[str, bytes]":
+    """
+    Load recorded responses from a directory of json files named after
+    the last segment of their path, exemple : "signals.json"
+    """
+
+    recordings_ = {}
+    for name_ in sorted(os.listdir(directory)):
+        if name_.endswith(".json"):
+            with open(os.path.join(directory, name_), "rb") as file_:
+                recordings_[name_[:-len(".json")]] = file_.read()
+    return recordings_
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Answers oauth token requests with a token and data requests with
+    a recorded or generated json payload, or with an injected error
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        """
+        Serve oauth token requests
+        """
+        if urlsplit(self.path).path.rstrip("/") != TOKEN_PATH:
+            self._send(404, ERROR_PAYLOAD)
+        else:
+            self._send(200, TOKEN_PAYLOAD)
+
+    def do_GET(self) -> None:
+        """
+        Serve data requests
+        """
+        url_ = urlsplit(self.path)
+        endpoint_ = url_.path.rstrip("/").rsplit("/", 1)[-1]
+        status_ = self.server.draw_error()
+
+        if status_ is not None:
+            payload_ = ERROR_PAYLOAD
+        elif self.server.payload is not None:
+            payload_ = self.server.payload
+        elif endpoint_ in self.server.recordings:
+            payload_ = self.server.recordings[endpoint_]
+        elif endpoint_ in ACTUAL_GENERATION_ENDPOINTS \
+                or endpoint_ == "signals":
+            payload_ = make_payload(
+                url_.path,
+                url_.query,
+                self.server.series_count)
+        else:
+            (status_, payload_) = (404, ERROR_PAYLOAD)
+
+        if status_ is None and self.server.max_bytes is not None \
+                and len(payload_) > self.server.max_bytes:
+            (status_, payload_) = (413, ERROR_PAYLOAD)
+
+        if status_ is None:
+            # Responses are validated by an ETag of their body
+            etag_ = f'"{zlib.crc32(payload_):08x}"'
+            if self.headers.get("If-None-Match") == etag_:
+                self._send(304, b"", etag_)
+            else:
+                self._send(200, payload_, etag_)
+        else:
+            self._send(status_, payload_)
+
+    def _send(
+            self,
+            status: int,
+            payload: bytes,
+            etag: Optional[str] = None) -> None:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+        if status == 429:
+            self.send_header("Retry-After", str(self.server.retry_after))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Threaded http server holding the stub configuration
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(
+            self,
+            latency: float = 0.,
+            payload: Optional[bytes] = None,
+            series_count: int = 5,
+            errors: Optional["dict[int, float]"] = None,
+            max_bytes: Optional[int] = None,
+            recordings: Optional["dict[str, bytes]"] = None,
+            retry_after: float = 0.,
+            seed: int = 0) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.latency = latency
+        self.payload = payload
+        self.series_count = series_count
+        self.errors = dict(errors or {})
+        self.max_bytes = max_bytes
+        self.recordings = dict(recordings or {})
+        self.retry_after = retry_after
+        self.requests = collections.Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw_error(self) -> Optional[int]:
+        """
+        Draw the error status of a data request, None for a success
+        """
+        with self._lock:
+            draw_ = self._random.random()
+            for (status_, probability_) in self.errors.items():
+                if draw_ < probability_:
+                    self.requests[status_] += 1
+                    return status_
+                draw_ -= probability_
+            self.requests[200] += 1
+        return None
+
+    @property
+    def url(self) -> str:
+        """
+        Root url of the server
+        """
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@contextlib.contextmanager
+def serve(
+        latency: float = 0.,
+        payload: Optional[bytes] = None,
+        series_count: int = 5,
+        errors: Optional["dict[int, float]"] = None,
+        max_bytes: Optional[int] = None,
+        recordings: Optional["dict[str, bytes]"] = None,
+        retry_after: float = 0.,
+        seed: int = 0):
+    """
+    Run a stub server in a background thread for the duration of the context.
+
+    Data requests are answered with payload if provided, else with the
+    recording of their endpoint if any, else with a generated payload
+    matching the requested window and filters. errors gives the
+    probability of each injected error status, exemple :
+    {429: 0.05, 503: 0.01}, drawn from a random generator seeded by seed.
+    Responses larger than max_bytes are answered with 413.
+    """
+
+    server_ = StubServer(
+        latency,
+        payload,
+        series_count,
+        errors,
+        max_bytes,
+        recordings,
+        retry_after,
+        seed)
+    thread_ = threading.Thread(target=server_.serve_forever, daemon=True)
+    thread_.start()
+    try:
+        yield server_
+    finally:
+        server_.shutdown()
+        server_.server_close()
+
+
+class RedirectAdapter(HTTPAdapter):
+    """
+    Transport adapter sending requests aimed at RTE servers to the stub
+    """
+
+    def __init__(self, stub_url: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.stub_url = stub_url
+
+    def send(self, request, **kwargs):
+        request.url = request.url.replace(RTE_HOST_URL, self.stub_url, 1)
+        return super().send(request, **kwargs)
+
+
+def redirect_session(session, stub_url: str, pool_size: int = 10) -> None:
+    """
+    Send all requests of a session aimed at RTE servers to the stub
+    """
+
+    session.mount(
+        RTE_HOST_URL,
+        RedirectAdapter(
+            stub_url,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size))
+
+
+def stub_application(application_class, server: StubServer, *args, **kwargs):
+    """
+    Create an application sending all its requests to the stub server
+    """
+
+    application_ = application_class(*args, **kwargs)
+    redirect_session(
+        application_.session,
+        server.url,
+        kwargs.get("pool_size", 10))
+    return application_
@@ -0,0 +1,276 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Offline benchmark suite against the local stub server, reporting
+requests per second, p50/p99 latency and peak RSS of each scenario.
+Each scenario runs in its own process so that peak RSS is its own.
+
+Run with "python -m benchmarks.suite", save results with
+"--save results.json" and check for regressions against saved
+results with "--compare results.json"
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from benchmarks.stub_server import serve, stub_application
+from py_france_rte.application import Application
+from py_france_rte.conditional import ValidatorCache
+from py_france_rte.retry import RetryPolicy
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+START_DATE = "2020-01-01T00:00:00+01:00"
+# metric: True if higher is better
+METRICS = {
+    "rps": True,
+    "p50_ms": False,
+    "p99_ms": False,
+    "peak_rss_mib": False,
+}
+
+
+def percentile(durations: "list[float]", fraction: float) -> float:
+    """
+    Get a percentile of durations in milliseconds, by nearest rank
+    """
+
+    sorted_ = sorted(durations)
+    index_ = min(len(sorted_) - 1, max(0, round(fraction * len(sorted_)) - 1))
+    return sorted_[index_] * 1000.
+
+
+def measure(
+        request: Callable[[], dict],
+        count: int,
+        threads: int) -> "dict[str, float]":
+    """
+    Send count requests from threads threads, timing each of them
+    """
+
+    def timed(_) -> float:
+        start_ = time.perf_counter()
+        request()
+        return time.perf_counter() - start_
+
+    start_ = time.perf_counter()
+    if threads == 1:
+        durations_ = [timed(index_) for index_ in range(count)]
+    else:
+        with ThreadPoolExecutor(threads) as executor_:
+            durations_ = list(executor_.map(timed, range(count)))
+    elapsed_ = time.perf_counter() - start_
+
+    return {
+        "rps": count / elapsed_,
+        "p50_ms": percentile(durations_, 0.5),
+        "p99_ms": percentile(durations_, 0.99),
+    }
+
+
+def peak_rss_mib() -> Optional[float]:
+    """
+    Peak resident memory of the process, None where unavailable
+    """
+
+    if resource is None:
+        return None
+    peak_ = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak_ / (2 ** 20 if sys.platform == "darwin" else 2 ** 10)
+
+
+def ecowatt_small() -> "dict[str, float]":
+    """
+    Small Ecowatt responses over a pooled session from 8 threads
+    """
+
+    with serve(latency=0.002) as server_:
+        application_ = stub_application(
+            Application, server_, "client", "secret", ["Ecowatt"])
+        application_.request_ecowatt_signals()
+        result_ = measure(application_.request_ecowatt_signals, 2000, 8)
+        application_.close()
+    return result_
+
+
+def per_type_year() -> "dict[str, float]":
+    """
+    One year of hourly generation per type, requested in windows
+    """
+
+    with serve(latency=0.005) as server_:
+        application_ = stub_application(
+            Application, server_, "client", "secret",
+            ["Actual Generation"], max_workers=4)
+        result_ = measure(
+            lambda: application_.request_chunked(
+                "actual_generation_per_type",
+                START_DATE, "2021-01-01T00:00:00+01:00"),
+            20, 1)
+        application_.close()
+    return result_
+
+
+def per_unit_large() -> "dict[str, float]":
+    """
+    A week of hourly generation of 1000 units, a large response
+    """
+
+    with serve(series_count=1000) as server_:
+        application_ = stub_application(
+            Application, server_, "client", "secret",
+            ["Actual Generation"])
+        result_ = measure(
+            lambda: application_.request_actual_generation_per_unit(
+                START_DATE, "2020-01-08T00:00:00+01:00"),
+            5, 1)
+        application_.close()
+    return result_
+
+
+def mix_window(
+        validators: Optional[ValidatorCache] = None) -> "dict[str, float]":
+    """
+    Polling of the trailing 14 days of the 15 minutes generation mix
+    """
+
+    with serve(series_count=20) as server_:
+        application_ = stub_application(
+            Application, server_, "client", "secret",
+            ["Actual Generation"], validator_cache=validators)
+        result_ = measure(
+            lambda: application_.request_generation_mix_15min(
+                START_DATE, "2020-01-15T00:00:00+01:00"),
+            50, 1)
+        application_.close()
+    return result_
+
+
+def mix_window_conditional() -> "dict[str, float]":
+    """
+    Polling of the trailing window with conditional requests,
+    all answered by 304 but the first one
+    """
+
+    return mix_window(ValidatorCache())
+
+
+def retried_errors() -> "dict[str, float]":
+    """
+    Ecowatt requests with 10% of 503 and 5% of 429 errors, retried
+    """
+
+    with serve(errors={503: 0.1, 429: 0.05}) as server_:
+        application_ = stub_application(
+            Application, server_, "client", "secret", ["Ecowatt"],
+            retry_policy=RetryPolicy(max_attempts=10, backoff_factor=0.001))
+        result_ = measure(application_.request_ecowatt_signals, 1000, 4)
+        application_.close()
+    return result_
+
+
+SCENARIOS = {
+    "ecowatt_small": ecowatt_small,
+    "per_type_year": per_type_year,
+    "per_unit_large": per_unit_large,
+    "mix_window": mix_window,
+    "mix_window_conditional": mix_window_conditional,
+    "retried_errors": retried_errors,
+}
+
+
+def run_scenario(name: str) -> "dict[str, float]":
+    """
+    Run a scenario in a new process and get its results
+    """
+
+    output_ = subprocess.run(
+        [sys.executable, "-m", "benchmarks.suite", "--child", name],
+        check=True,
+        capture_output=True,
+        text=True).stdout
+    return json.loads(output_)
+
+
+def find_regressions(
+        results: "dict[str, dict]",
+        baseline: "dict[str, dict]",
+        tolerance: float) -> "list[str]":
+    """
+    Compare results with a baseline, a metric regresses when it is
+    worse than the baseline by more than tolerance
+    """
+
+    regressions_ = []
+    for (scenario_, metrics_) in results.items():
+        for (metric_, higher_is_better_) in METRICS.items():
+            value_ = metrics_.get(metric_)
+            reference_ = baseline.get(scenario_, {}).get(metric_)
+            if value_ is None or not reference_:
+                continue
+            change_ = (value_ - reference_) / reference_
+            if higher_is_better_:
+                change_ = -change_
+            if change_ > tolerance:
+                regressions_.append(
+                    f"{scenario_} {metric_}: {value_:.1f} against "
+                    f"{reference_:.1f} ({change_:+.0%} worse)")
+    return regressions_
+
+
+def main() -> None:
+    """
+    Run the benchmark and print results
+    """
+
+    parser_ = argparse.ArgumentParser(description=__doc__)
+    parser_.add_argument("scenarios", nargs="*", default=list(SCENARIOS))
+    parser_.add_argument("--save", help="write results to a json file")
+    parser_.add_argument("--compare", help="json file of baseline results")
+    parser_.add_argument("--tolerance", type=float, default=0.2)
+    parser_.add_argument("--child", help=argparse.SUPPRESS)
+    args_ = parser_.parse_args()
+
+    if args_.child:
+        result_ = SCENARIOS[args_.child]()
+        result_["peak_rss_mib"] = peak_rss_mib()
+        print(json.dumps(result_))
+        return
+
+    results_ = {}
+    for name_ in args_.scenarios:
+        results_[name_] = run_scenario(name_)
+        metrics_ = results_[name_]
+        rss_ = metrics_["peak_rss_mib"]
+        print(f"  {name_:<22} {metrics_['rps']:>9.1f} req/s  "
+              f"p50 {metrics_['p50_ms']:>8.2f} ms  "
+              f"p99 {metrics_['p99_ms']:>8.2f} ms  "
+              f"peak RSS {'n/a' if rss_ is None else f'{rss_:.1f} MiB'}")
+
+    if args_.save:
+        with open(args_.save, "w", encoding="utf-8") as file_:
+            json.dump(results_, file_, indent=2, sort_keys=True)
+
+    if args_.compare:
+        with open(args_.compare, "r", encoding="utf-8") as file_:
+            baseline_ = json.load(file_)
+        regressions_ = find_regressions(
+            results_, baseline_, args_.tolerance)
+        for regression_ in regressions_:
+            print(f"REGRESSION {regression_}")
+        if regressions_:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the resampling and aggregation of columnar series,
+requiring numpy
+"""
+
+import datetime
+import zoneinfo
+from typing import Union
+
+from py_france_rte.columnar import ColumnarSeries
+from py_france_rte.modules.actual_generation import PRODUCTION_SUBTYPES
+from py_france_rte.utils import is_str_instance
+
+try:
+    import numpy as np
+except ImportError as err:
+    raise ImportError(
+        "Aggregation requires numpy, "
+        "install it with \"pip install numpy\"") from err
+
+AGGREGATIONS = ("sum", "mean", "min", "max", "energy")
+CALENDAR_INTERVALS = ("day", "month", "year")
+
+# production subtype: production type
+_SUBTYPE_PARENTS = {subtype_: type_
+                    for (type_, subtypes_) in PRODUCTION_SUBTYPES.items()
+                    for subtype_ in subtypes_}
+
+
+def _utc_offsets(
+        timestamps: "np.ndarray",
+        timezone: zoneinfo.ZoneInfo) -> "np.ndarray":
+    """
+    UTC offsets in seconds of a timezone at epoch timestamps,
+    computed once per distinct hour as offsets change on hour boundaries
+    """
+    (hours_, inverse_) = np.unique(timestamps // 3600, return_inverse=True)
+    offsets_ = np.array(
+        [datetime.datetime.fromtimestamp(
+            int(hour_) * 3600, timezone).utcoffset().total_seconds()
+         for hour_ in hours_],
+        dtype=np.int64)
+    return offsets_[inverse_]
+
+
+def _calendar_bins(
+        timestamps: "np.ndarray",
+        interval: str,
+        timezone: zoneinfo.ZoneInfo) -> "tuple[np.ndarray, np.ndarray]":
+    """
+    Start and end epoch timestamps of the local calendar days, months
+    or years holding each timestamp. Local days last 23 or 25 hours
+    on DST transitions.
+    """
+    local_ = timestamps + _utc_offsets(timestamps, timezone)
+    periods_ = (local_ // 86400).astype("datetime64[D]").astype(
+        {"day": "datetime64[D]",
+         "month": "datetime64[M]",
+         "year": "datetime64[Y]"}[interval])
+
+    (unique_, inverse_) = np.unique(periods_, return_inverse=True)
+    bounds_ = np.concatenate((unique_, unique_ + 1)).astype("datetime64[D]")
+    # Local midnight of each bound, back to an epoch timestamp
+    bound_timestamps_ = np.array(
+        [datetime.datetime.combine(
+            bound_.item(), datetime.time(), timezone).timestamp()
+         for bound_ in bounds_],
+        dtype=np.int64)
+
+    starts_ = bound_timestamps_[:len(unique_)]
+    ends_ = bound_timestamps_[len(unique_):]
+    return (starts_[inverse_], ends_[inverse_])
+
+
+def resample(
+        series: ColumnarSeries,
+        interval: Union[str, datetime.timedelta],
+        how: str = "sum",
+        timezone: str = "Europe/Paris") -> ColumnarSeries:
+    """
+    resample(
+            series: ColumnarSeries,
+            interval: Union[str, datetime.timedelta],
+            how: str = "sum",
+            timezone: str = "Europe/Paris") -> ColumnarSeries
+
+    Aggregate the values of a series over longer intervals.
+    Missing values are ignored, intervals without any value are NaN.
+
+    Parameters
+    ----------
+    series : ColumnarSeries
+        The series to resample, exemple : a series of to_columnar
+    interval : str or datetime.timedelta
+        Calendar intervals "day", "month" or "year" of timezone, lasting
+        23 or 25 hours on DST transitions, or a fixed duration aligned
+        on the epoch, exemple : datetime.timedelta(hours=1)
+    how : str, default: "sum"
+        The aggregation of values, among "sum", "mean", "min", "max",
+        and "energy", the sum of values in MW times their duration,
+        giving MWh
+    timezone : str, default: "Europe/Paris"
+        The timezone of calendar intervals
+
+    Returns
+    -------
+    ColumnarSeries
+        The aggregated series, its metadata holding "aggregation"
+        and "interval", updated holding the latest update of each interval
+
+    Raises
+    ------
+    ValueError
+        If the aggregation or the interval is unknown
+    """
+    if how not in AGGREGATIONS:
+        raise ValueError(
+            f"Unknown aggregation {how}, expected one of {AGGREGATIONS}")
+
+    order_ = np.argsort(series.start, kind="stable")
+    start_ = series.start[order_]
+    values_ = series.values[order_]
+
+    if isinstance(interval, datetime.timedelta):
+        step_ = int(interval.total_seconds())
+        if step_ <= 0:
+            raise ValueError(f"interval must be positive, is {interval}")
+        bin_start_ = start_ - start_ % step_
+        bin_end_ = bin_start_ + step_
+        interval_name_ = f"{step_}s"
+    else:
+        is_str_instance(interval, "interval")
+        if interval not in CALENDAR_INTERVALS:
+            raise ValueError(
+                f"Unknown interval {interval}, expected a timedelta "
+                f"or one of {CALENDAR_INTERVALS}")
+        (bin_start_, bin_end_) = _calendar_bins(
+            start_, interval, zoneinfo.ZoneInfo(timezone))
+        interval_name_ = interval
+
+    metadata_ = dict(
+        series.metadata, aggregation=how, interval=interval_name_)
+    if len(start_) == 0:
+        return ColumnarSeries(
+            metadata_,
+            start_,
+            series.end[order_],
+            values_,
+            series.updated[order_])
+
+    # Sorted values of each interval are contiguous
+    first_ = np.concatenate(
+        ([0], np.flatnonzero(np.diff(bin_start_)) + 1))
+    valid_ = ~np.isnan(values_)
+    counts_ = np.add.reduceat(valid_.astype(np.int64), first_)
+    filled_ = np.where(valid_, values_, 0.)
+
+    if how == "sum":
+        result_ = np.add.reduceat(filled_, first_)
+    elif how == "mean":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result_ = np.add.reduceat(filled_, first_) / counts_
+    elif how == "min":
+        result_ = np.minimum.reduceat(
+            np.where(valid_, values_, np.inf), first_)
+    elif how == "max":
+        result_ = np.maximum.reduceat(
+            np.where(valid_, values_, -np.inf), first_)
+    else:
+        hours_ = (series.end[order_] - start_) / 3600.
+        result_ = np.add.reduceat(filled_ * hours_, first_)
+    result_[counts_ == 0] = np.nan
+
+    return ColumnarSeries(
+        metadata_,
+        bin_start_[first_],
+        bin_end_[first_],
+        result_,
+        np.maximum.reduceat(series.updated[order_], first_))
+
+
+def rollup_subtypes(
+        series: "list[ColumnarSeries]") -> "list[ColumnarSeries]":
+    """
+    rollup_subtypes(
+            series: "list[ColumnarSeries]") -> "list[ColumnarSeries]"
+
+    Sum the series of production subtypes into series of their
+    production type, following PRODUCTION_SUBTYPES, exemple :
+    HYDRO_PUMPED_STORAGE, HYDRO_WATER_RESERVOIR and
+    HYDRO_RUN_OF_RIVER_AND_POUNDAGE into HYDRO. Values are summed
+    by start date, missing values are ignored. Series of subtypes
+    missing from PRODUCTION_SUBTYPES, exemple : "TOTAL", are returned
+    unchanged so that they are not counted twice.
+
+    Parameters
+    ----------
+    series : list[ColumnarSeries]
+        The series to roll up, exemple : series of to_columnar of a
+        generation mix response, with "production_subtype" metadata
+
+    Returns
+    -------
+    list[ColumnarSeries]
+        A series per production type of known subtype series, in order
+        of first appearance, followed by other series unchanged
+    """
+    groups_ = {}
+    others_ = []
+    for series_ in series:
+        # Series of other subtypes, exemple : "TOTAL", are not summed
+        type_ = _SUBTYPE_PARENTS.get(
+            series_.metadata.get("production_subtype"))
+        if type_ is None:
+            others_.append(series_)
+        else:
+            groups_.setdefault(type_, []).append(series_)
+
+    rolled_up_ = []
+    for (type_, group_) in groups_.items():
+        start_ = np.concatenate([series_.start for series_ in group_])
+        end_ = np.concatenate([series_.end for series_ in group_])
+        values_ = np.concatenate([series_.values for series_ in group_])
+        updated_ = np.concatenate([series_.updated for series_ in group_])
+
+        (unique_, first_, inverse_) = np.unique(
+            start_, return_index=True, return_inverse=True)
+        valid_ = ~np.isnan(values_)
+        sums_ = np.bincount(
+            inverse_, weights=np.where(valid_, values_, 0.),
+            minlength=len(unique_))
+        sums_[np.bincount(inverse_, weights=valid_,
+                          minlength=len(unique_)) == 0] = np.nan
+        latest_ = np.full(len(unique_), -1, dtype=np.int64)
+        np.maximum.at(latest_, inverse_, updated_)
+
+        metadata_ = {key_: value_
+                     for (key_, value_) in group_[0].metadata.items()
+                     if key_ != "production_subtype"}
+        metadata_["production_type"] = type_
+        rolled_up_.append(ColumnarSeries(
+            metadata_, unique_, end_[first_], sums_, latest_))
+
+    return rolled_up_ + others_
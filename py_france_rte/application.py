@@ -7,11 +7,32 @@ This file contains the Application class,
 to use when interracting with the France RTE APIs
 """
 
-import types
-from typing import Optional
+import datetime
+import functools
+from typing import Callable, Iterator, Optional
 
 from py_france_rte.base_application import BaseApplication
-from py_france_rte.utils import SUPPORTED_APIS
+from py_france_rte.chunking import (merge_responses, parse_date,
+                                    split_date_range)
+from py_france_rte.conditional import ValidatorCache
+from py_france_rte.coverage import CoverageIndex
+from py_france_rte.errors import ComError
+from py_france_rte.memory_cache import TTLCache
+from py_france_rte.parallel import iter_prefetched, run_bounded
+from py_france_rte.pipeline import normalize_response
+from py_france_rte.rate_limit import TokenBucket
+from py_france_rte.registry import DATE_LIMITS
+from py_france_rte.retry import RetryPolicy
+from py_france_rte.response_cache import ResponseCache
+from py_france_rte.sync import (WatermarkStore, drop_values_before,
+                                latest_dates, watermark_key)
+from py_france_rte.utils import (SUPPORTED_APIS, is_int_instance,
+                                 is_list_instance, is_str_instance)
+from py_france_rte.validation import current_hour, date_rules
+
+# Cost of one request in series of one unit downloaded, for its quota,
+# latency and envelope, used by request_units to compare its plans
+REQUEST_COST = 20
 
 
 class Application(BaseApplication):
@@ -20,7 +41,19 @@ class Application(BaseApplication):
             id_client: str,
             id_secret: str,
             subscribed_apis: "list[str]",
-            timeout: Optional[int] = 10) -> Application:
+            timeout: Optional[int] = 10,
+            pool_size: Optional[int] = 10,
+            keep_alive: Optional[bool] = True,
+            compression: Optional[bool] = True,
+            max_workers: Optional[int] = 1,
+            token_refresh_margin: Optional[int] = 60,
+            token_cache: Optional[str] = None,
+            response_cache: Optional[ResponseCache] = None,
+            ecowatt_cache: Optional[TTLCache] = None,
+            rate_limits: Optional["dict[str, TokenBucket]"] = None,
+            rate_limit_block: Optional[bool] = True,
+            retry_policy: Optional[RetryPolicy] = None,
+            validator_cache: Optional[ValidatorCache] = None) -> Application:
 
     This is the class representing an application to communicate with RTE APIs.
     You need to create the applications on data.rte-france.com
@@ -37,6 +70,48 @@ class Application(BaseApplication):
         The list of all APIs the application is subscribed to and can use
     timeout : int, default: 10
         The timeout value for http requests, defaults to 10s
+    pool_size : int, default: 10
+        The number of connections kept open to RTE servers, shared by
+        all API functions of the application
+    keep_alive : bool, default: True
+        Reuse connections between requests instead of opening
+        a new one for each request
+    compression : bool, default: True
+        Request gzip/deflate compressed responses
+    max_workers : int, default: 1
+        The maximum number of requests sent at the same time by
+        request_chunked and request_parallel, should not exceed pool_size
+    token_refresh_margin : int, default: 60
+        The oauth token is refreshed in background when it expires
+        in less than token_refresh_margin seconds
+    token_cache : str, optional
+        Path of a file storing oauth tokens, shared by all processes
+        using the same application. No token is requested while the
+        stored one is valid.
+    response_cache : ResponseCache, optional
+        A cache of responses by request url, exemple :
+        SQLiteResponseCache("responses.sqlite"). Historical windows are
+        then requested only once.
+    ecowatt_cache : TTLCache, optional
+        An in-process cache of Ecowatt signals, exemple :
+        TTLCache(ttl=900, stale_ttl=3600). Concurrent requests
+        share a single http request.
+    rate_limits : dict[str, TokenBucket], optional
+        Rate limiter of each API, exemple :
+        {"Ecowatt": TokenBucket(rate=1 / 900)}.
+        Buckets may be shared with other applications.
+    rate_limit_block : bool, default: True
+        Wait until the rate limit allows a request,
+        or raise RateLimitError at once
+    retry_policy : RetryPolicy, optional
+        Policy to send again requests failing with transient errors,
+        exemple : RetryPolicy(max_attempts=5). Request functions also
+        accept a retry_policy overriding it for one call.
+    validator_cache : ValidatorCache, optional
+        A store of response validators, exemple : ValidatorCache().
+        Requests are then sent as conditional GET requests, and
+        responses not modified since the last request are neither
+        downloaded nor decoded again.
 
     Returns
     -------
@@ -63,8 +138,39 @@ class Application(BaseApplication):
             id_client: str,
             id_secret: str,
             subscribed_apis: "list[str]",
-            timeout: Optional[int] = 10) -> None:
-        super().__init__(id_client, id_secret, timeout)
+            timeout: Optional[int] = 10,
+            pool_size: Optional[int] = 10,
+            keep_alive: Optional[bool] = True,
+            compression: Optional[bool] = True,
+            max_workers: Optional[int] = 1,
+            token_refresh_margin: Optional[int] = 60,
+            token_cache: Optional[str] = None,
+            response_cache: Optional[ResponseCache] = None,
+            ecowatt_cache: Optional[TTLCache] = None,
+            rate_limits: Optional["dict[str, TokenBucket]"] = None,
+            rate_limit_block: Optional[bool] = True,
+            retry_policy: Optional[RetryPolicy] = None,
+            validator_cache: Optional[ValidatorCache] = None) -> None:
+        super().__init__(
+            id_client,
+            id_secret,
+            timeout,
+            pool_size,
+            keep_alive,
+            compression,
+            token_refresh_margin,
+            token_cache,
+            response_cache,
+            ecowatt_cache,
+            rate_limits,
+            rate_limit_block,
+            retry_policy,
+            validator_cache)
+
+        is_int_instance(max_workers, "max_workers")
+        self.max_workers = max_workers
+        # function name: largest window in days not known to be too large
+        self.window_sizes = {}
 
         self.register_apis(subscribed_apis)
 
@@ -72,7 +178,7 @@ class Application(BaseApplication):
         """
         register_apis(self, subscribed_apis: "list[str]") -> None
 
-        Overwrite all application instance methods for provided supported APIs
+        Give access to the request functions of provided supported APIs
 
         Parameters
         ----------
@@ -89,24 +195,755 @@ class Application(BaseApplication):
         for api_ in subscribed_apis:
             if api_ not in SUPPORTED_APIS:
                 raise RuntimeError(f"Unsupported API declared : {api_}")
-            # Load API functions
-            # Ecowatt
-            if api_ == "Ecowatt":
-                from py_france_rte.modules.ecowatt import \
-                    request_ecowatt_signals
-                self.request_ecowatt_signals = types.MethodType(
-                    request_ecowatt_signals, self)
-            # Actual Generation
-            elif api_ == "Actual Generation":
-                from py_france_rte.modules.actual_generation import (
-                    request_actual_generation_per_type,
-                    request_actual_generation_per_unit,
-                    request_generation_mix_15min, request_water_reserves)
-                self.request_actual_generation_per_unit = types.MethodType(
-                    request_actual_generation_per_unit, self)
-                self.request_actual_generation_per_type = types.MethodType(
-                    request_actual_generation_per_type, self)
-                self.request_generation_mix_15min = types.MethodType(
-                    request_generation_mix_15min, self)
-                self.request_water_reserves = types.MethodType(
-                    request_water_reserves, self)
+        # Request functions of the endpoints of these APIs are
+        # resolved from the registry on first access
+        self.subscribed_apis.update(subscribed_apis)
+
+    def request_chunked(
+            self,
+            endpoint: str,
+            start_date: str,
+            end_date: str,
+            **options) -> "dict":
+        """
+        request_chunked(
+                self,
+                endpoint: str,
+                start_date: str,
+                end_date: str,
+                **options) -> "dict"
+
+        Request data over any date range, by splitting it into windows
+        accepted by the requested endpoint, and merging their responses.
+        Windows are requested by up to max_workers threads.
+
+        Parameters
+        ----------
+        endpoint : str
+            The name of the dated endpoint to request,
+            exemple : "actual_generation_per_unit"
+        start_date : str
+            The start date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        end_date : str
+            The end date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        **options
+            Other parameters of the request function of the endpoint,
+            exemple : unit_eic_code="17W100P100P0345B"
+
+        Returns
+        -------
+        dict
+            The merged response of all windows
+
+        Raises
+        ------
+        RuntimeError
+            If the endpoint does not support chunked requests
+        ValueError
+            If the dates are invalid for the requested endpoint
+        """
+
+        windows_ = self._plan_windows(endpoint, start_date, end_date)
+        request_ = getattr(self, f"request_{endpoint}")
+
+        return merge_responses(run_bounded(
+            [functools.partial(request_, window_start_, window_end_, **options)
+             for (window_start_, window_end_) in windows_],
+            self.max_workers))
+
+    def request_adaptive(
+            self,
+            endpoint: str,
+            start_date: str,
+            end_date: str,
+            **options) -> "dict":
+        """
+        request_adaptive(
+                self,
+                endpoint: str,
+                start_date: str,
+                end_date: str,
+                **options) -> "dict"
+
+        Request data over any date range like request_chunked, splitting
+        in half each window answered with 413 "Response too large", down
+        to the minimum duration of the endpoint, then by production type
+        for generation_mix_15min. The largest window size not known
+        to be too large is remembered per endpoint in window_sizes,
+        so that next requests start from it.
+
+        Parameters
+        ----------
+        endpoint : str
+            The name of the dated endpoint to request,
+            exemple : "actual_generation_per_unit"
+        start_date : str
+            The start date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        end_date : str
+            The end date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        **options
+            Other parameters of the request function of the endpoint,
+            exemple : unit_eic_code="17W100P100P0345B"
+
+        Returns
+        -------
+        dict
+            The merged response of all windows
+
+        Raises
+        ------
+        RuntimeError
+            If the endpoint does not support chunked requests
+        ValueError
+            If the dates are invalid for the requested endpoint
+        ComError
+            If an error occurs when requesting data from an API, or if
+            a response is too large even over the smallest window
+        """
+
+        from py_france_rte.modules.actual_generation import PRODUCTION_TYPES
+
+        # Dates are verified once over the largest windows
+        self._plan_windows(endpoint, start_date, end_date)
+        (max_days_, min_days_, _) = DATE_LIMITS[endpoint]
+        request_ = getattr(self, f"request_{endpoint}")
+
+        pending_ = [(window_start_, window_end_, options)
+                    for (window_start_, window_end_) in split_date_range(
+                        start_date,
+                        end_date,
+                        self.window_sizes.get(endpoint, max_days_),
+                        min_days_)]
+        responses_ = []
+
+        while pending_:
+            results_ = run_bounded(
+                [functools.partial(
+                    self._request_unless_too_large,
+                    request_,
+                    window_start_,
+                    window_end_,
+                    window_options_)
+                 for (window_start_, window_end_, window_options_)
+                 in pending_],
+                self.max_workers)
+
+            too_large_ = []
+            for (window_, result_) in zip(pending_, results_):
+                if result_ is None:
+                    too_large_.append(window_)
+                else:
+                    responses_.append((parse_date(
+                        window_[0], "start_date"), result_))
+
+            pending_ = []
+            for (window_start_, window_end_, window_options_) in too_large_:
+                days_ = (parse_date(window_end_, "end_date")
+                         - parse_date(window_start_, "start_date")).days
+                if days_ > min_days_:
+                    half_ = max(min_days_, days_ // 2)
+                    self.window_sizes[endpoint] = min(
+                        half_,
+                        self.window_sizes.get(endpoint, max_days_))
+                    pending_ += [
+                        (half_start_, half_end_, window_options_)
+                        for (half_start_, half_end_) in split_date_range(
+                            window_start_, window_end_, half_, min_days_)]
+                elif endpoint == "generation_mix_15min" \
+                        and window_options_.get("production_type") is None \
+                        and window_options_.get("production_subtype") is None:
+                    pending_ += [
+                        (window_start_, window_end_,
+                         dict(window_options_, production_type=type_))
+                        for type_ in PRODUCTION_TYPES]
+                else:
+                    raise ComError(
+                        f"Response too large from {window_start_} to "
+                        f"{window_end_} of {endpoint}", code=413)
+
+        responses_.sort(key=lambda item_: item_[0])
+        return merge_responses(
+            [response_ for (_, response_) in responses_])
+
+    @staticmethod
+    def _request_unless_too_large(
+            request: Callable[..., dict],
+            start_date: str,
+            end_date: str,
+            options: dict) -> Optional[dict]:
+        """
+        Request a window, None if the response is too large
+        """
+
+        try:
+            return request(start_date, end_date, **options)
+        except ComError as err:
+            if err.code == 413:
+                return None
+            raise
+
+    def request_incremental(
+            self,
+            endpoint: str,
+            watermarks: WatermarkStore,
+            initial_start_date: str,
+            end_date: Optional[str] = None,
+            revision_days: Optional[int] = 0,
+            max_lag_days: Optional[int] = 7,
+            **options) -> "dict":
+        """
+        request_incremental(
+                self,
+                endpoint: str,
+                watermarks: WatermarkStore,
+                initial_start_date: str,
+                end_date: Optional[str] = None,
+                revision_days: Optional[int] = 0,
+                max_lag_days: Optional[int] = 7,
+                **options) -> "dict"
+
+        Request only the data not ingested yet, up to end_date. Each
+        series, a unit or a production type, has its own watermark, the
+        end date and updated date of its latest values received. The
+        range starts at the earliest watermark of the endpoint and
+        options, each series then keeps only its values after its own
+        watermark. The requested range is extended back to the minimum
+        duration of the endpoint when needed.
+
+        A series lagging more than max_lag_days behind the latest
+        watermark, exemple : a unit no longer published, does not hold
+        the range back: it only gets its values of the last
+        max_lag_days. Values revised by RTE after being ingested are
+        only requested again within revision_days before the watermark,
+        and returned when updated since the last run.
+
+        Parameters
+        ----------
+        endpoint : str
+            The name of the dated endpoint to request,
+            exemple : "actual_generation_per_unit"
+        watermarks : WatermarkStore
+            The store of watermarks, exemple :
+            WatermarkStore("watermarks.json")
+        initial_start_date : str
+            The start date of the range when nothing was ingested yet,
+            must be at format "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        end_date : str, optional
+            The end date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz", defaults to the current hour
+        revision_days : int, default: 0
+            The number of days before the watermark requested again
+            for revised values, 0 never requests ingested values again
+        max_lag_days : int or None, default: 7
+            The number of days a series may lag behind the latest
+            watermark before being ignored to start the range,
+            None always starts at the earliest watermark
+        **options
+            Other parameters of the request function, each combination
+            having its own watermarks,
+            exemple : unit_eic_code="17W100P100P0345B"
+
+        Returns
+        -------
+        dict
+            The merged response of the new data, empty if the watermark
+            is already at end_date
+
+        Raises
+        ------
+        RuntimeError
+            If the endpoint is not supported
+        ValueError
+            If the dates are invalid for the requested endpoint
+        """
+
+        (_, min_days_, min_date_) = self._date_limits(endpoint)
+
+        is_int_instance(revision_days, "revision_days")
+        if max_lag_days is not None:
+            is_int_instance(max_lag_days, "max_lag_days")
+
+        key_ = watermark_key(endpoint, options)
+        watermark_ = watermarks.get(key_) or {}
+        if not watermark_:
+            start_ = parse_date(initial_start_date, "initial_start_date")
+        else:
+            ends_ = [datetime.datetime.fromisoformat(series_["end_date"])
+                     for series_ in watermark_.values()]
+            # Series lagging behind are requested again from their
+            # watermark, within max_lag_days of the latest one
+            start_ = min(ends_)
+            if max_lag_days is not None:
+                start_ = max(start_, max(ends_)
+                             - datetime.timedelta(days=max_lag_days))
+        if end_date is None:
+            end_ = datetime.datetime.now(datetime.timezone.utc).replace(
+                minute=0, second=0, microsecond=0)
+        else:
+            end_ = parse_date(end_date, "end_date")
+
+        revision_start_ = start_ - datetime.timedelta(days=revision_days)
+        if revision_start_ >= end_:
+            return {}
+
+        request_start_ = max(
+            min(revision_start_,
+                end_ - datetime.timedelta(days=min_days_)),
+            datetime.datetime.fromisoformat(min_date_ + "T00:00:00+00:00"))
+        response_ = self.request_chunked(
+            endpoint,
+            request_start_.isoformat(),
+            end_.astimezone(request_start_.tzinfo).isoformat(),
+            **options)
+        # Each series keeps the values after its own watermark, or
+        # revised since when revision_days is set, series seen for the
+        # first time the values after start_
+        if not revision_days:
+            watermark_ = {identity_: {"end_date": series_["end_date"]}
+                          for (identity_, series_) in watermark_.items()}
+        response_ = drop_values_before(
+            response_, start_.isoformat(), watermark_)
+
+        dates_ = latest_dates(response_)
+        if dates_:
+            watermarks.advance(key_, dates_)
+
+        return response_
+
+    def plan_missing(
+            self,
+            endpoint: str,
+            coverage: CoverageIndex,
+            start_date: str,
+            end_date: str,
+            **options) -> "list[tuple[str, str]]":
+        """
+        plan_missing(
+                self,
+                endpoint: str,
+                coverage: CoverageIndex,
+                start_date: str,
+                end_date: str,
+                **options) -> "list[tuple[str, str]]"
+
+        Plan the windows to request so that a date range is fully
+        fetched, skipping the ranges already covered. Missing ranges
+        shorter than the minimum duration of the endpoint are extended
+        back to it, longer ones are split to its maximum duration.
+
+        Parameters
+        ----------
+        endpoint : str
+            The name of the dated endpoint to request,
+            exemple : "actual_generation_per_unit"
+        coverage : CoverageIndex
+            The index of fetched ranges, exemple :
+            CoverageIndex("coverage.json")
+        start_date : str
+            The start date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        end_date : str
+            The end date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        **options
+            Other parameters of the request function, each combination
+            having its own coverage,
+            exemple : unit_eic_code="17W100P100P0345B"
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The (start_date, end_date) windows to request,
+            in chronological order
+
+        Raises
+        ------
+        RuntimeError
+            If the endpoint is not supported
+        ValueError
+            If the dates are invalid for the requested endpoint
+        """
+
+        (_, min_days_, min_date_) = self._date_limits(endpoint)
+        min_duration_ = datetime.timedelta(days=min_days_)
+        min_start_ = datetime.datetime.fromisoformat(
+            min_date_ + "T00:00:00+00:00")
+
+        windows_ = []
+        for (missing_start_, missing_end_) in coverage.missing(
+                watermark_key(endpoint, options), start_date, end_date):
+            start_ = datetime.datetime.fromisoformat(missing_start_)
+            end_ = datetime.datetime.fromisoformat(missing_end_)
+            if end_ - start_ < min_duration_:
+                start_ = max(end_ - min_duration_, min_start_)
+            windows_ += self._plan_windows(
+                endpoint, start_.isoformat(), end_.isoformat())
+
+        return windows_
+
+    def request_missing(
+            self,
+            endpoint: str,
+            coverage: CoverageIndex,
+            start_date: str,
+            end_date: str,
+            immutable_after: Optional[int] = 259200,
+            **options) -> "dict":
+        """
+        request_missing(
+                self,
+                endpoint: str,
+                coverage: CoverageIndex,
+                start_date: str,
+                end_date: str,
+                immutable_after: Optional[int] = 259200,
+                **options) -> "dict"
+
+        Request only the windows planned by plan_missing, with up to
+        max_workers threads, and record them in the coverage index once
+        all of them succeeded. Only data older than immutable_after is
+        recorded, recent data consolidated later by RTE being requested
+        again by the next calls.
+
+        Parameters
+        ----------
+        endpoint : str
+            The name of the dated endpoint to request,
+            exemple : "actual_generation_per_unit"
+        coverage : CoverageIndex
+            The index of fetched ranges, exemple :
+            CoverageIndex("coverage.json")
+        start_date : str
+            The start date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        end_date : str
+            The end date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        immutable_after : int, default: 259200
+            The age in seconds after which data is considered final and
+            recorded as covered, defaults to 3 days
+        **options
+            Other parameters of the request function,
+            exemple : unit_eic_code="17W100P100P0345B"
+
+        Returns
+        -------
+        dict
+            The merged response of the requested windows,
+            empty if the range was already covered
+
+        Raises
+        ------
+        RuntimeError
+            If the endpoint is not supported
+        ValueError
+            If the dates are invalid for the requested endpoint
+        """
+
+        is_int_instance(immutable_after, "immutable_after")
+
+        windows_ = self.plan_missing(
+            endpoint, coverage, start_date, end_date, **options)
+        request_ = getattr(self, f"request_{endpoint}")
+
+        response_ = merge_responses(run_bounded(
+            [functools.partial(request_, window_start_, window_end_, **options)
+             for (window_start_, window_end_) in windows_],
+            self.max_workers))
+
+        key_ = watermark_key(endpoint, options)
+        final_end_ = datetime.datetime.now(datetime.timezone.utc) \
+            - datetime.timedelta(seconds=immutable_after)
+        for (window_start_, window_end_) in windows_:
+            start_ = datetime.datetime.fromisoformat(window_start_)
+            end_ = min(datetime.datetime.fromisoformat(window_end_),
+                       final_end_.astimezone(start_.tzinfo))
+            if start_ < end_:
+                coverage.add(key_, window_start_,
+                             end_.replace(microsecond=0).isoformat())
+
+        return response_
+
+    def request_units(
+            self,
+            unit_eic_codes: "list[str]",
+            start_date: str,
+            end_date: str,
+            published_units: Optional[int] = 200) -> "dict[str, dict]":
+        """
+        request_units(
+                self,
+                unit_eic_codes: "list[str]",
+                start_date: str,
+                end_date: str,
+                published_units: Optional[int] = 200) -> "dict[str, dict]"
+
+        Request actual generation of many units over any date range,
+        with the cheaper of two plans. Filtered, each unit is requested
+        on its own for each window, len(unit_eic_codes) * len(windows)
+        requests of one series each. Unfiltered, a single request per
+        window downloads the series of all published units, then
+        filtered locally. Each plan costs its requests, REQUEST_COST
+        each, plus its downloaded series: filtered is chosen while
+        len(unit_eic_codes) * (REQUEST_COST + 1) is at most
+        REQUEST_COST + published_units, up to 10 units by default.
+        Requests are sent by up to max_workers threads, within the rate
+        limit of the application.
+
+        Parameters
+        ----------
+        unit_eic_codes : list[str]
+            The EIC codes of the units, exemple : ["17W100P100P0345B"]
+        start_date : str
+            The start date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        end_date : str
+            The end date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        published_units : int, default: 200
+            The estimated number of units in an unfiltered response,
+            0 always sends unfiltered requests
+
+        Returns
+        -------
+        dict[str, dict]
+            The merged series of each unit by EIC code,
+            None for units without data
+
+        Raises
+        ------
+        TypeError
+            If a parameter is of an unexpected type
+        ValueError
+            If the dates are invalid
+        ComError
+            If an error occurs when requesting data from an API,
+            remaining requests are then cancelled
+        """
+
+        is_list_instance(unit_eic_codes, "unit_eic_codes")
+        for unit_eic_code_ in unit_eic_codes:
+            is_str_instance(unit_eic_code_, "unit_eic_code")
+        is_int_instance(published_units, "published_units")
+        codes_ = list(dict.fromkeys(unit_eic_codes))
+
+        windows_ = self._plan_windows(
+            "actual_generation_per_unit", start_date, end_date)
+        request_ = self.request_actual_generation_per_unit
+
+        # Requests and downloaded series of each plan
+        filtered_cost_ = len(codes_) * len(windows_) * (REQUEST_COST + 1)
+        unfiltered_cost_ = len(windows_) * (REQUEST_COST + published_units)
+        filters_ = codes_ if published_units \
+            and filtered_cost_ <= unfiltered_cost_ else [None]
+
+        responses_ = run_bounded(
+            [functools.partial(
+                request_,
+                window_start_,
+                window_end_,
+                unit_eic_code=filter_)
+             for filter_ in filters_
+             for (window_start_, window_end_) in windows_],
+            self.max_workers)
+
+        series_ = {code_: None for code_ in codes_}
+        merged_ = merge_responses(responses_)
+        for unit_series_ in merged_.get("actual_generations_per_unit", []):
+            code_ = unit_series_.get("unit", {}).get("eic_code")
+            if code_ in series_:
+                series_[code_] = unit_series_
+
+        return series_
+
+    def iter_records(
+            self,
+            start_date: str,
+            end_date: str,
+            endpoints: Optional["list[str]"] = None,
+            prefetch: Optional[int] = 1,
+            options: Optional["dict[str, dict]"] = None) -> Iterator[dict]:
+        """
+        iter_records(
+                self,
+                start_date: str,
+                end_date: str,
+                endpoints: Optional["list[str]"] = None,
+                prefetch: Optional[int] = 1,
+                options: Optional["dict[str, dict]"] = None) -> Iterator[dict]
+
+        Lazily ingest Actual Generation data over any date range.
+        Each endpoint range is split into windows accepted by the API,
+        and the records of a window are yielded as soon as its response
+        arrives, while the next prefetch windows are requested in
+        background. At most prefetch + 1 responses are held in memory.
+
+        Parameters
+        ----------
+        start_date : str
+            The start date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        end_date : str
+            The end date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : "2015-06-08T00:00:00+02:00"
+        endpoints : list[str], optional
+            The dated endpoints to ingest, in order, defaults to all of
+            them, exemple : ["actual_generation_per_type", "water_reserves"]
+        prefetch : int, default: 1
+            The number of windows requested ahead of the consumer,
+            0 requests each window when the previous one is consumed
+        options : dict[str, dict], optional
+            Other parameters of the request function of each endpoint,
+            exemple : {"actual_generation_per_unit":
+            {"unit_eic_code": "17W100P100P0345B"}}
+
+        Returns
+        -------
+        Iterator[dict]
+            A flat record for each value,
+            exemple : {"endpoint": "actual_generation_per_type",
+            "production_type": "NUCLEAR",
+            "start_date": "2020-01-01T00:00:00+01:00",
+            "end_date": "2020-01-01T01:00:00+01:00", "value": 51234,
+            "updated_date": "2020-01-01T01:00:00+01:00"}
+
+        Raises
+        ------
+        RuntimeError
+            If an endpoint is not supported
+        ValueError
+            If the dates are invalid for a requested endpoint
+        ComError
+            If an error occurs when requesting data from an API,
+            raised once the records of previous windows are consumed
+        """
+
+        endpoints_ = list(DATE_LIMITS) if endpoints is None else endpoints
+        options_ = options or {}
+        is_int_instance(prefetch, "prefetch")
+
+        # Plan every window first, so that invalid parameters are
+        # reported before any request is sent
+        windows_ = []
+        tasks_ = []
+        for endpoint_ in endpoints_:
+            endpoint_windows_ = self._plan_windows(
+                endpoint_, start_date, end_date)
+            request_ = getattr(self, f"request_{endpoint_}")
+            previous_end_ = None
+            for (window_start_, window_end_) in endpoint_windows_:
+                # The last window may overlap the previous one,
+                # dates are compared as datetimes whatever their offsets
+                emit_from_ = previous_end_ \
+                    if previous_end_ is not None \
+                    and parse_date(window_start_, "start_date") \
+                    < parse_date(previous_end_, "end_date") else None
+                windows_.append((endpoint_, emit_from_))
+                tasks_.append(functools.partial(
+                    request_,
+                    window_start_,
+                    window_end_,
+                    **options_.get(endpoint_, {})))
+                previous_end_ = window_end_
+
+        return self._iter_window_records(
+            windows_, iter_prefetched(tasks_, prefetch))
+
+    @staticmethod
+    def _iter_window_records(
+            windows: "list[tuple[str, Optional[str]]]",
+            responses: Iterator[dict]) -> Iterator[dict]:
+        """
+        Normalize the responses of planned windows into records
+        """
+
+        for ((endpoint_, emit_from_), response_) in zip(windows, responses):
+            yield from normalize_response(endpoint_, response_, emit_from_)
+
+    @staticmethod
+    def _date_limits(endpoint: str) -> "tuple[int, int, str]":
+        """
+        Get the (max_days, min_days, min_date) of a dated endpoint
+        """
+
+        if endpoint not in DATE_LIMITS:
+            raise RuntimeError(
+                f"Chunked requests are not supported by {endpoint}")
+
+        return DATE_LIMITS[endpoint]
+
+    def _plan_windows(
+            self,
+            endpoint: str,
+            start_date: str,
+            end_date: str) -> "list[tuple[str, str]]":
+        """
+        Split a date range into verified windows of a dated endpoint
+        """
+
+        rules_ = date_rules(*self._date_limits(endpoint))
+        windows_ = split_date_range(
+            start_date, end_date, rules_.max_days, rules_.min_days)
+        # All windows are checked in one pass, the first problem raised
+        now_ = current_hour()
+        for (window_, diagnostic_) in zip(
+                windows_, rules_.check_dates(windows_, now_)):
+            if diagnostic_ is not None:
+                raise ValueError(rules_.describe(diagnostic_, *window_, now_))
+
+        return windows_
+
+    def request_parallel(
+            self,
+            requests: "list[tuple[str, dict]]") -> "list[dict]":
+        """
+        request_parallel(
+                self,
+                requests: "list[tuple[str, dict]]") -> "list[dict]"
+
+        Send independent requests, possibly to different APIs,
+        with up to max_workers threads
+
+        Parameters
+        ----------
+        requests : list[tuple[str, dict]]
+            The (function_name, parameters) of each request,
+            exemple : ("request_water_reserves",
+            {"start_date": "2017-06-05T00:00:00+02:00",
+            "end_date": "2017-06-12T00:00:00+02:00"})
+
+        Returns
+        -------
+        list[dict]
+            The response of each request, in the order of requests
+
+        Raises
+        ------
+        ComError
+            If an error occurs when requesting data from an API,
+            remaining requests are then cancelled
+        NoAccessError
+            If a request targets an API the application is not registered to
+        """
+
+        return run_bounded(
+            [functools.partial(getattr(self, function_name_), **parameters_)
+             for (function_name_, parameters_) in requests],
+            self.max_workers)
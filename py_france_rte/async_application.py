@@ -0,0 +1,280 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the AsyncApplication class,
+the asyncio counterpart of Application, requiring aiohttp
+"""
+
+import asyncio
+from time import time
+from typing import Optional
+
+from py_france_rte.errors import NoAccessError
+from py_france_rte.key import Key
+from py_france_rte.rate_limit import TokenBucket
+from py_france_rte.registry import ENDPOINTS
+from py_france_rte.utils import (OAUTH_TOKEN_REQ_URL, SUPPORTED_APIS,
+                                 generate_header, is_int_instance,
+                                 is_str_instance, verify_response_code)
+
+try:
+    import aiohttp
+except ImportError as err:
+    raise ImportError(
+        "AsyncApplication requires aiohttp, "
+        "install it with \"pip install aiohttp\"") from err
+
+
+class AsyncApplication():
+    """
+    AsyncApplication(
+            id_client: str,
+            id_secret: str,
+            subscribed_apis: "list[str]",
+            timeout: Optional[int] = 10,
+            pool_size: Optional[int] = 10,
+            max_in_flight: Optional[int] = 10,
+            compression: Optional[bool] = True,
+            rate_limits: Optional["dict[str, TokenBucket]"] = None,
+            rate_limit_block: Optional[bool] = True) -> AsyncApplication:
+
+    This is the asyncio counterpart of Application, all request functions
+    are coroutines sharing a pool of connections. URLs and parameters are
+    prepared and verified exactly as with Application.
+    To be used as an async context manager, or closed with close().
+
+    Parameters
+    ----------
+    id_client : str
+        The application client ID
+    id_secret : str
+        The application secret ID
+    subscribed_apis : list[str]
+        The list of all APIs the application is subscribed to and can use
+    timeout : int, default: 10
+        The timeout value for http requests, defaults to 10s
+    pool_size : int, default: 10
+        The number of connections kept open to RTE servers
+    max_in_flight : int, default: 10
+        The maximum number of data requests sent at the same time
+    compression : bool, default: True
+        Request gzip/deflate compressed responses
+    rate_limits : dict[str, TokenBucket], optional
+        Rate limiter of each API, exemple :
+        {"Ecowatt": TokenBucket(rate=1 / 900)}.
+        Buckets may be shared with other applications.
+    rate_limit_block : bool, default: True
+        Wait until the rate limit allows a request,
+        or raise RateLimitError at once
+
+    Returns
+    -------
+    AsyncApplication
+        An application instance
+
+    Raises
+    ------
+    RuntimeError
+        If an error occurs at run time, like methods parameters not
+        following the APIs specifications
+    ValueError
+        If a provided parameter is of unexpected type
+    ComError
+        If an error occurs when requesting data from an API,
+        may happen if you reached your quota
+    NoAccessError
+        If the application tries to access an API it
+        was not declared to be registered to
+    """
+
+    def __init__(
+            self,
+            id_client: str,
+            id_secret: str,
+            subscribed_apis: "list[str]",
+            timeout: Optional[int] = 10,
+            pool_size: Optional[int] = 10,
+            max_in_flight: Optional[int] = 10,
+            compression: Optional[bool] = True,
+            rate_limits: Optional["dict[str, TokenBucket]"] = None,
+            rate_limit_block: Optional[bool] = True) -> None:
+
+        is_str_instance(id_client, "id_client")
+        is_str_instance(id_secret, "id_secret")
+        is_int_instance(timeout, "timeout")
+        is_int_instance(pool_size, "pool_size")
+        is_int_instance(max_in_flight, "max_in_flight")
+
+        for api_ in subscribed_apis:
+            if api_ not in SUPPORTED_APIS:
+                raise RuntimeError(f"Unsupported API declared : {api_}")
+
+        self.key = Key(id_client, id_secret)
+        self.subscribed_apis = list(subscribed_apis)
+        self.oauth_token = "None"
+        self.oauth_token_expire = 0.
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.max_in_flight = max_in_flight
+        self.compression = compression
+        self.rate_limits = dict(rate_limits or {})
+        self.rate_limit_block = rate_limit_block
+        # Created on first use, within the running event loop
+        self._session = None
+        self._semaphore = None
+        self._token_lock = None
+
+    async def __aenter__(self) -> "AsyncApplication":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close all pooled connections of the application
+        """
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """
+        Get the session of the application, creating it if needed
+        """
+
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Accept-Encoding":
+                         "gzip, deflate" if self.compression else "identity"})
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._token_lock = asyncio.Lock()
+        return self._session
+
+    async def generate_oauth_token(self) -> None:
+        """
+        generate an oauth token for the application
+        """
+
+        async with self._get_session().post(
+                OAUTH_TOKEN_REQ_URL,
+                headers={
+                    "content-type": "application/x-www-form-urlencoded",
+                    "Authorization": f"Basic {self.key.key_b64}"}) as token_:
+            if token_.status != 200:
+                raise RuntimeError("Unable to request oauth token")
+            token_content_ = await token_.json(content_type=None)
+
+        self.oauth_token = token_content_["access_token"]
+        self.oauth_token_expire = time() + token_content_["expires_in"]
+
+    async def verify_token(self) -> None:
+        """
+        Verify oauth_token time validity, generates new oauth_token if needed,
+        concurrent callers wait for a single refresh
+        """
+
+        if time() <= self.oauth_token_expire:
+            return
+
+        self._get_session()
+        async with self._token_lock:
+            if time() > self.oauth_token_expire:
+                await self.generate_oauth_token()
+
+    async def _request(self, url: str, api: str) -> "dict":
+        """
+        Request data from an API with a prepared url
+        """
+
+        if api not in self.subscribed_apis:
+            raise NoAccessError(f"No access declared to {api} API")
+
+        if api in self.rate_limits:
+            await self.rate_limits[api].acquire_async(
+                block=self.rate_limit_block)
+
+        await self.verify_token()
+        session_ = self._get_session()
+
+        async with self._semaphore:
+            async with session_.get(
+                    url,
+                    headers=generate_header(self.oauth_token)) as response_:
+                verify_response_code(response_.status, api)
+                return await response_.json(content_type=None)
+
+    # Ecowatt
+
+    async def request_ecowatt_signals(self) -> "dict":
+        """
+        Request signals from Ecowatt
+        """
+
+        return await self._request(
+            ENDPOINTS["ecowatt_signals"].url_for(), "Ecowatt")
+
+    # Actual Generation
+
+    async def request_actual_generation_per_type(
+            self,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None) -> "dict":
+        """
+        Request actual generation per type
+        """
+
+        url_ = ENDPOINTS["actual_generation_per_type"].url_for(
+            start_date, end_date)
+
+        return await self._request(url_, "Actual Generation")
+
+    async def request_actual_generation_per_unit(
+            self,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+            unit_eic_code: Optional[str] = None) -> "dict":
+        """
+        Request actual generation per unit
+        """
+
+        url_ = ENDPOINTS["actual_generation_per_unit"].url_for(
+            start_date,
+            end_date,
+            unit_eic_code=unit_eic_code)
+
+        return await self._request(url_, "Actual Generation")
+
+    async def request_water_reserves(
+            self,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None) -> "dict":
+        """
+        Request water reserves
+        """
+
+        url_ = ENDPOINTS["water_reserves"].url_for(start_date, end_date)
+
+        return await self._request(url_, "Actual Generation")
+
+    async def request_generation_mix_15min(
+            self,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+            production_type: Optional[str] = None,
+            production_subtype: Optional[str] = None) -> "dict":
+        """
+        Request actual generation mix with 15min scale
+        """
+
+        url_ = ENDPOINTS["generation_mix_15min"].url_for(
+            start_date,
+            end_date,
+            production_type=production_type,
+            production_subtype=production_subtype)
+
+        return await self._request(url_, "Actual Generation")
@@ -5,24 +5,132 @@
 This file contains the BaseApplication class, to be overloaded with Application
 """
 
-
-from time import time
-from typing import Optional
+import functools
+import threading
+import types
+from time import perf_counter, sleep, time
+from typing import Any, Callable, Iterator, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from py_france_rte.errors import NoAccessError
+from py_france_rte.conditional import ValidatorCache
+from py_france_rte.errors import ComError, NoAccessError
+from py_france_rte.instrumentation import RequestEvent
 from py_france_rte.key import Key
-from py_france_rte.utils import (OAUTH_TOKEN_REQ_URL, is_int_instance,
-                                 is_str_instance)
+from py_france_rte.memory_cache import TTLCache
+from py_france_rte.rate_limit import TokenBucket
+from py_france_rte.registry import ENDPOINTS, Endpoint
+from py_france_rte.response_cache import ResponseCache
+from py_france_rte.retry import RetryPolicy, parse_retry_after
+from py_france_rte.streaming import iter_json_items
+from py_france_rte.token_cache import TokenCache
+from py_france_rte.utils import (OAUTH_TOKEN_REQ_URL, generate_header,
+                                 is_int_instance, is_str_instance,
+                                 verify_response_code)
+
+
+STREAM_CHUNK_SIZE = 65536
+
+
+def _count_bytes(
+        chunks: Iterator[bytes],
+        event: RequestEvent) -> Iterator[bytes]:
+    """
+    Count the bytes of a streamed response in its event,
+    as well as the time spent receiving them
+    """
+
+    while True:
+        download_start_ = perf_counter()
+        chunk_ = next(chunks, None)
+        event.lap("download", download_start_)
+        if chunk_ is None:
+            return
+        event.bytes += len(chunk_)
+        yield chunk_
+
+
+@functools.lru_cache(maxsize=None)
+def _build_endpoint_function(name: str) -> Optional[Callable]:
+    """
+    Build the request_<endpoint> or stream_<endpoint> function of
+    an endpoint of the registry, None if name is not one of them
+    """
+
+    (kind_, _, endpoint_) = name.partition("_")
+    if kind_ not in ("request", "stream") or endpoint_ not in ENDPOINTS:
+        return None
+
+    def function_(self, *args, **kwargs) -> Any:
+        if kind_ == "request":
+            return self.request_endpoint(endpoint_, *args, **kwargs)
+        return self.stream_endpoint(endpoint_, *args, **kwargs)
 
+    function_.__name__ = name
+    function_.__qualname__ = f"BaseApplication.{name}"
+    function_.__doc__ = (
+        f"{name}(self, {', '.join(ENDPOINTS[endpoint_].parameters)})"
+        f"\n\n{kind_.capitalize()} {endpoint_} from the "
+        f"{ENDPOINTS[endpoint_].api} API, see py_france_rte.registry")
+    return function_
 
-def request_oauth_token(key: Key, timeout: int = 10) -> "tuple[str, int]":
+
+def create_session(
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        compression: bool = True) -> requests.Session:
+    """
+    create_session(
+            pool_size: int = 10,
+            keep_alive: bool = True,
+            compression: bool = True) -> requests.Session
+
+    Create a http session holding a pool of reusable connections,
+    so that consecutive requests skip the TCP and TLS handshakes.
+
+    Parameters
+    ----------
+    pool_size : int, default: 10
+        The maximum number of connections kept open per host
+    keep_alive : bool, default: True
+        Keep connections open between requests,
+        if False every request opens a new connection
+    compression : bool, default: True
+        Ask the server for gzip/deflate compressed responses
+
+    Returns
+    -------
+    requests.Session
+        A session to use for every request of an application
+    """
+
+    is_int_instance(pool_size, "pool_size")
+
+    session_ = requests.Session()
+    adapter_ = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session_.mount("https://", adapter_)
+    session_.mount("http://", adapter_)
+
+    session_.headers["Connection"] = "keep-alive" if keep_alive else "close"
+    session_.headers["Accept-Encoding"] = \
+        "gzip, deflate" if compression else "identity"
+
+    return session_
+
+
+def request_oauth_token(
+        key: Key,
+        timeout: int = 10,
+        session: Optional[requests.Session] = None) -> "tuple[str, int]":
     """
-    Request an oauth_token for a given application
+    Request an oauth_token for a given application,
+    using the provided session if any
     """
 
-    token_request = requests.post(
+    requester_ = session if session is not None else requests
+
+    token_request = requester_.post(
         OAUTH_TOKEN_REQ_URL,
         headers={
             "content-type": "application/x-www-form-urlencoded",
@@ -44,84 +152,540 @@ class BaseApplication():
     """
 
     def __init__(self, id_client: str, id_secret: str,
-                 timeout: Optional[int] = 10) -> None:
+                 timeout: Optional[int] = 10,
+                 pool_size: Optional[int] = 10,
+                 keep_alive: Optional[bool] = True,
+                 compression: Optional[bool] = True,
+                 token_refresh_margin: Optional[int] = 60,
+                 token_cache: Optional[str] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 ecowatt_cache: Optional[TTLCache] = None,
+                 rate_limits: Optional["dict[str, TokenBucket]"] = None,
+                 rate_limit_block: Optional[bool] = True,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 validator_cache: Optional[ValidatorCache] = None) -> None:
 
         is_str_instance(id_client, "id_client")
         is_str_instance(id_secret, "id_secret")
         is_int_instance(timeout, "timeout")
+        is_int_instance(token_refresh_margin, "token_refresh_margin")
 
         self.key = Key(id_client, id_secret)
         self.oauth_token = "None"
         self.oauth_token_expire = 0.
+        self.token_refresh_margin = token_refresh_margin
+        self.token_cache = \
+            TokenCache(token_cache) if token_cache is not None else None
+        # Held while a token refresh is in progress
+        self._token_lock = threading.Lock()
         self.timeout = timeout
-        self.generate_oauth_token()
+        self.response_cache = response_cache
+        self.ecowatt_cache = ecowatt_cache
+        self.rate_limits = dict(rate_limits or {})
+        self.rate_limit_block = rate_limit_block
+        self.retry_policy = retry_policy
+        self.validator_cache = validator_cache
+        # Called with a RequestEvent after each request
+        self.hooks = []
+        # APIs whose endpoints can be requested
+        self.subscribed_apis = set()
+        self.session = create_session(pool_size, keep_alive, compression)
+        # The oauth token is generated on first request
 
-    def generate_oauth_token(self) -> None:
+    def close(self) -> None:
         """
-        generate an oauth token for the application
+        Close all pooled connections of the application
         """
 
-        (oauth_token, validity_duration_) = request_oauth_token(
-            self.key, timeout=self.timeout)
+        self.session.close()
 
-        self.oauth_token = oauth_token
-        self.oauth_token_expire = time() + validity_duration_
+    def __enter__(self) -> "BaseApplication":
+        return self
 
-    def verify_token(self) -> None:
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        # Request functions of the registry, resolved on first access
+        function_ = _build_endpoint_function(name)
+        if function_ is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'")
+        return types.MethodType(function_, self)
+
+    def __dir__(self) -> "list[str]":
+        return sorted(set(super().__dir__()).union(
+            f"{kind_}_{endpoint_}" for kind_ in ("request", "stream")
+            for endpoint_ in ENDPOINTS))
+
+    def _endpoint(self, name: str) -> Endpoint:
         """
-        Verify oauth_token time validity, generates new oauth_token if needed
+        Get an endpoint of the registry, if its API is subscribed
+        """
+
+        if name not in ENDPOINTS:
+            raise RuntimeError(f"Unsupported endpoint : {name}")
+        endpoint_ = ENDPOINTS[name]
+        if endpoint_.api not in self.subscribed_apis:
+            raise NoAccessError(f"No access declared to {endpoint_.api} API")
+        return endpoint_
+
+    def add_hook(self, hook: Callable[[RequestEvent], Any]) -> None:
         """
+        add_hook(self, hook: Callable[[RequestEvent], Any]) -> None
 
-        if time() > self.oauth_token_expire:
-            self.generate_oauth_token()
+        Register a hook called with a RequestEvent after each request,
+        exemple : a HistogramCollector. Requests are only measured while
+        a hook is registered. Hooks are called in the requesting thread
+        and should return quickly.
 
-    # Declare all API funstions to be overloaded if access is declared
+        Parameters
+        ----------
+        hook : Callable[[RequestEvent], Any]
+            The hook to register
+        """
 
-    # Ecowatt
+        self.hooks = self.hooks + [hook]
 
-    def request_ecowatt_signals(self,) -> "dict":
+    def remove_hook(self, hook: Callable[[RequestEvent], Any]) -> None:
         """
-        function to be overwritten
+        remove_hook(self, hook: Callable[[RequestEvent], Any]) -> None
+
+        Unregister a hook
+
+        Parameters
+        ----------
+        hook : Callable[[RequestEvent], Any]
+            The hook to unregister
+
+        Raises
+        ------
+        ValueError
+            If the hook is not registered
         """
-        raise NoAccessError("No access declared to Ecowatt API")
 
-    # Actual Generation
+        hooks_ = list(self.hooks)
+        hooks_.remove(hook)
+        self.hooks = hooks_
 
-    def request_actual_generation_per_type(
-            self,
-            start_date: Optional[str] = None,
-            end_date: Optional[str] = None) -> "dict":
+    def _emit(self, event: RequestEvent) -> None:
         """
-        function to be overwritten
+        Call all hooks with a finished event
         """
-        raise NoAccessError("No access declared to Actual Generation API")
 
-    def request_actual_generation_per_unit(
+        event.finish()
+        for hook_ in self.hooks:
+            hook_(event)
+
+    def generate_oauth_token(self) -> None:
+        """
+        generate an oauth token for the application,
+        or get it from the token cache if a valid one is stored there
+        """
+
+        if self.token_cache is None:
+            (oauth_token, validity_duration_) = request_oauth_token(
+                self.key, timeout=self.timeout, session=self.session)
+            self.oauth_token = oauth_token
+            self.oauth_token_expire = time() + validity_duration_
+            return
+
+        cached_token_ = self.token_cache.load(
+            self.key.id_client, self.token_refresh_margin)
+        if cached_token_ is None:
+            cached_token_ = self.token_cache.refresh(
+                self.key.id_client,
+                self.token_refresh_margin,
+                lambda: request_oauth_token(
+                    self.key, timeout=self.timeout, session=self.session))
+
+        (self.oauth_token, self.oauth_token_expire) = cached_token_
+
+    def verify_token(self) -> None:
+        """
+        Verify oauth_token time validity, generates new oauth_token if needed.
+        Only one refresh runs at a time, other callers wait for its result.
+        A token expiring within token_refresh_margin seconds is refreshed
+        in background while callers keep using it.
+        """
+
+        now_ = time()
+
+        if now_ > self.oauth_token_expire:
+            with self._token_lock:
+                if time() > self.oauth_token_expire:
+                    self.generate_oauth_token()
+        elif now_ > self.oauth_token_expire - self.token_refresh_margin:
+            if self._token_lock.acquire(blocking=False):
+                threading.Thread(
+                    target=self._refresh_token_in_background,
+                    daemon=True).start()
+
+    def _refresh_token_in_background(self) -> None:
+        """
+        Refresh the token, the token lock being already held by the caller
+        """
+
+        try:
+            if time() > self.oauth_token_expire - self.token_refresh_margin:
+                self.generate_oauth_token()
+        except (requests.RequestException, RuntimeError):
+            # The current token is still valid, once expired
+            # the next call to verify_token refreshes it and raises
+            pass
+        finally:
+            self._token_lock.release()
+
+    def request_api(
             self,
-            start_date: Optional[str] = None,
+            url: str,
+            api: str,
             end_date: Optional[str] = None,
-            unit_eic_code: Optional[str] = None) -> "dict":
+            retry_policy: Optional[RetryPolicy] = None) -> "dict":
         """
-        function to be overwritten
+        request_api(
+                self,
+                url: str,
+                api: str,
+                end_date: Optional[str] = None,
+                retry_policy: Optional[RetryPolicy] = None) -> "dict"
+
+        Request data from an API with a prepared url, shared by all
+        API functions. The response is read from the response cache
+        if stored there and still fresh, otherwise the request waits
+        for the rate limit of the API if any, and is sent again on
+        transient errors according to the retry policy. With a
+        validator cache, the request is conditional on the validators
+        of the last response of the url, a 304 answer getting it back.
+
+        Parameters
+        ----------
+        url : str
+            The request url, with its options
+        api : str
+            The requested API
+        end_date : str, optional
+            The end date of the requested window if any,
+            used to decide how long the response stays fresh
+        retry_policy : RetryPolicy, optional
+            The retry policy of this request,
+            defaults to the retry policy of the application
+
+        Returns
+        -------
+        dict
+            The decoded response
+
+        Raises
+        ------
+        ComError
+            If the API answers with an error code, or if the API
+            could not be reached after retries
+        RateLimitError
+            If the rate limit of the API is reached
+            and rate_limit_block is False
         """
-        raise NoAccessError("No access declared to Actual Generation API")
 
-    def request_water_reserves(
+        event_ = RequestEvent(api, url) if self.hooks else None
+
+        try:
+            if self.response_cache is not None:
+                cached_response_ = self.response_cache.get(url)
+                if cached_response_ is not None:
+                    if event_ is not None:
+                        event_.cache_hit = True
+                    return cached_response_
+
+            validated_ = self.validator_cache.get(url) \
+                if self.validator_cache is not None else None
+
+            response_ = self._send_request(
+                url,
+                api,
+                retry_policy if retry_policy is not None
+                else self.retry_policy,
+                event=event_,
+                headers=validated_.headers if validated_ is not None
+                else None,
+                accept_not_modified=validated_ is not None)
+
+            if validated_ is not None:
+                not_modified_ = response_.status_code == 304
+                self.validator_cache.record(validated_, not_modified_)
+                if event_ is not None and not_modified_:
+                    event_.bytes_saved = validated_.size
+
+            if validated_ is not None and not_modified_:
+                response_.close()
+                content_ = validated_.content
+            elif event_ is None:
+                content_ = response_.json()
+            else:
+                parse_start_ = perf_counter()
+                content_ = response_.json()
+                event_.lap("parse", parse_start_)
+                event_.bytes = len(response_.content)
+
+            if self.validator_cache is not None \
+                    and response_.status_code != 304:
+                self.validator_cache.set(
+                    url, response_.headers, content_, len(response_.content))
+
+            if self.response_cache is not None:
+                self.response_cache.set(url, content_, end_date)
+
+            return content_
+        except Exception as err:
+            if event_ is not None:
+                event_.error = type(err).__name__
+            raise
+        finally:
+            if event_ is not None:
+                self._emit(event_)
+
+    def stream_api(
             self,
-            start_date: Optional[str] = None,
-            end_date: Optional[str] = None) -> "dict":
+            url: str,
+            api: str,
+            retry_policy: Optional[RetryPolicy] = None) -> Iterator[Any]:
+        """
+        stream_api(
+                self,
+                url: str,
+                api: str,
+                retry_policy: Optional[RetryPolicy] = None) -> Iterator[Any]
+
+        Request data from an API with a prepared url, decoding the
+        response incrementally. Each series of the response is yielded
+        as soon as it is received, so that memory use is bounded by the
+        largest series. Streamed responses skip the response cache.
+
+        Parameters
+        ----------
+        url : str
+            The request url, with its options
+        api : str
+            The requested API
+        retry_policy : RetryPolicy, optional
+            The retry policy of this request,
+            defaults to the retry policy of the application
+
+        Yields
+        ------
+        Any
+            Each series of the response, exemple : one unit of
+            actual_generations_per_unit
+
+        Raises
+        ------
+        ComError
+            If the API answers with an error code, or if the API
+            could not be reached after retries
+        """
+
+        event_ = RequestEvent(api, url) if self.hooks else None
+
+        try:
+            response_ = self._send_request(
+                url,
+                api,
+                retry_policy if retry_policy is not None
+                else self.retry_policy,
+                stream=True,
+                event=event_)
+
+            chunks_ = response_.iter_content(STREAM_CHUNK_SIZE)
+            if event_ is not None:
+                chunks_ = _count_bytes(chunks_, event_)
+            try:
+                for (_, series_) in iter_json_items(chunks_):
+                    yield series_
+            finally:
+                response_.close()
+        except Exception as err:
+            if event_ is not None:
+                event_.error = type(err).__name__
+            raise
+        finally:
+            if event_ is not None:
+                self._emit(event_)
+
+    def request_endpoint(self, name: str, *args, **kwargs) -> "dict":
+        """
+        request_endpoint(self, name: str, *args, **kwargs) -> "dict"
+
+        Request an endpoint of the registry, the generic path of all
+        request_<endpoint> functions, exemple :
+        request_endpoint("water_reserves", start_date, end_date) is
+        request_water_reserves(start_date, end_date)
+
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint, exemple : "water_reserves"
+        *args, **kwargs
+            The parameters of the endpoint, see Endpoint.parameters
+
+        Returns
+        -------
+        dict
+            The decoded response
+
+        Raises
+        ------
+        RuntimeError
+            If the endpoint is unknown, or if only one date is provided
+        NoAccessError
+            If the API of the endpoint is not subscribed
+        ValueError
+            If dates or filters are invalid
+        ComError
+            If an error occurs when requesting data from an API
         """
-        function to be overwritten
+
+        endpoint_ = self._endpoint(name)
+        arguments_ = endpoint_.bind(args, kwargs)
+        retry_policy_ = arguments_.pop("retry_policy")
+        url_ = endpoint_.url_for(**arguments_)
+
+        def request_() -> "dict":
+            return self.request_api(
+                url_,
+                endpoint_.api,
+                arguments_.get("end_date"),
+                retry_policy_)
+
+        if endpoint_.memory_cached and self.ecowatt_cache is not None:
+            loaded_ = []
+
+            def load_() -> "dict":
+                loaded_.append(url_)
+                return request_()
+
+            content_ = self.ecowatt_cache.get_or_load(url_, load_)
+            # Responses served by the cache are reported as cache hits
+            if not loaded_ and self.hooks:
+                event_ = RequestEvent(endpoint_.api, url_)
+                event_.cache_hit = True
+                self._emit(event_)
+            return content_
+        return request_()
+
+    def stream_endpoint(self, name: str, *args, **kwargs) -> Iterator[Any]:
         """
-        raise NoAccessError("No access declared to Actual Generation API")
+        stream_endpoint(self, name: str, *args, **kwargs) -> Iterator[Any]
+
+        Stream an endpoint of the registry, the generic path of all
+        stream_<endpoint> functions. Parameters are verified at once,
+        the request being sent on first iteration.
 
-    def request_generation_mix_15min(
+        Parameters
+        ----------
+        name : str
+            The name of the endpoint, exemple : "actual_generation_per_unit"
+        *args, **kwargs
+            The parameters of the endpoint, see Endpoint.parameters
+
+        Returns
+        -------
+        Iterator[Any]
+            Each series of the response, see stream_api
+
+        Raises
+        ------
+        RuntimeError
+            If the endpoint is unknown, or if only one date is provided
+        NoAccessError
+            If the API of the endpoint is not subscribed
+        ValueError
+            If dates or filters are invalid
+        """
+
+        endpoint_ = self._endpoint(name)
+        arguments_ = endpoint_.bind(args, kwargs)
+        retry_policy_ = arguments_.pop("retry_policy")
+
+        return self.stream_api(
+            endpoint_.url_for(**arguments_), endpoint_.api, retry_policy_)
+
+    def _send_request(
             self,
-            start_date: Optional[str] = None,
-            end_date: Optional[str] = None,
-            production_type: Optional[str] = None,
-            production_subtype: Optional[str] = None) -> "dict":
+            url: str,
+            api: str,
+            retry_policy: Optional[RetryPolicy],
+            stream: bool = False,
+            event: Optional[RequestEvent] = None,
+            headers: Optional["dict[str, str]"] = None,
+            accept_not_modified: bool = False) -> requests.Response:
         """
-        function to be overwritten
+        Send a GET request until it succeeds or the retry policy gives up,
+        recording phase timings in event if any, with headers added to
+        the authorization header. A 304 Not Modified answer is returned
+        only if accept_not_modified, the request being conditional.
         """
-        raise NoAccessError("No access declared to Actual Generation")
+
+        attempt_ = 0
+        while True:
+            attempt_ += 1
+            if event is not None:
+                event.attempts = attempt_
+                phase_start_ = perf_counter()
+
+            if api in self.rate_limits:
+                self.rate_limits[api].acquire(block=self.rate_limit_block)
+            if event is not None:
+                phase_start_ = event.lap("rate_limit", phase_start_)
+
+            self.verify_token()
+            if event is not None:
+                phase_start_ = event.lap("token", phase_start_)
+
+            try:
+                headers_ = generate_header(self.oauth_token)
+                if headers:
+                    headers_.update(headers)
+                response_ = self.session.get(
+                    url=url,
+                    headers=headers_,
+                    timeout=self.timeout,
+                    stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as err:
+                if event is not None:
+                    phase_start_ = event.lap("wait", phase_start_)
+                if retry_policy is None:
+                    raise
+                if not retry_policy.should_retry(attempt_):
+                    raise ComError(
+                        f"Unable to reach {api}",
+                        attempts=attempt_) from err
+                sleep(retry_policy.delay(attempt_))
+                if event is not None:
+                    event.lap("retry_wait", phase_start_)
+                continue
+
+            if event is not None:
+                event.status = response_.status_code
+                phase_start_ = event.lap_response(
+                    response_.elapsed.total_seconds(), phase_start_)
+
+            if retry_policy is not None and retry_policy.should_retry(
+                    attempt_, response_.status_code):
+                response_.close()
+                sleep(retry_policy.delay(
+                    attempt_,
+                    parse_retry_after(response_.headers.get("Retry-After"))))
+                if event is not None:
+                    event.lap("retry_wait", phase_start_)
+                continue
+
+            if accept_not_modified and response_.status_code == 304:
+                return response_
+
+            try:
+                verify_response_code(code=response_.status_code, api=api)
+            except ComError as err:
+                response_.close()
+                err.attempts = attempt_
+                raise
+
+            return response_
@@ -0,0 +1,176 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains utilities to split long date ranges into windows
+accepted by the APIs, and to merge the responses of these windows
+"""
+
+import datetime
+import json
+
+from py_france_rte.utils import DATE_FORMAT, is_int_instance, is_str_instance
+from py_france_rte.validation import parse_datetime
+
+
+def parse_date(date: str, name: str) -> datetime.datetime:
+    """
+    parse_date(date: str, name: str) -> datetime.datetime
+
+    Parse a date at format DATE_FORMAT, keeping its timezone offset.
+
+    Parameters
+    ----------
+    date : str
+        The date to parse, must be at format "YYYY-MM-DDThh:mm:sszzzzzz"
+        exemple : "2015-06-08T00:00:00+02:00"
+    name : str
+        The name of the variable
+
+    Returns
+    -------
+    datetime.datetime
+        The parsed timezone aware date
+
+    Raises
+    ------
+    TypeError
+        If the date is not a str
+    ValueError
+        If the date is not at format DATE_FORMAT
+    """
+    is_str_instance(date, name)
+    date_ = parse_datetime(date)
+    if date_ is None:
+        raise ValueError(
+            f"Invalid date format for {name}, requires {DATE_FORMAT}")
+    return date_
+
+
+def split_date_range(
+        start_date: str,
+        end_date: str,
+        max_days: int,
+        min_days: int) -> "list[tuple[str, str]]":
+    """
+    split_date_range(
+            start_date: str,
+            end_date: str,
+            max_days: int,
+            min_days: int) -> "list[tuple[str, str]]"
+
+    Split a date range into consecutive windows lasting at most max_days
+    and at least min_days. All windows are expressed with the timezone
+    offset of start_date. When the remaining time for the last window is
+    shorter than min_days, the last window starts min_days before end_date
+    and overlaps the previous one.
+
+    Parameters
+    ----------
+    start_date : str
+        The start date of the range, must be at format
+        "YYYY-MM-DDThh:mm:sszzzzzz", exemple : "2015-06-08T00:00:00+02:00"
+    end_date : str
+        The end date of the range, must be at format
+        "YYYY-MM-DDThh:mm:sszzzzzz", exemple : "2015-06-08T00:00:00+02:00"
+    max_days : int
+        The maximum duration of a window, in day(s)
+    min_days : int
+        The minimum duration of a window, in day(s)
+
+    Returns
+    -------
+    list[tuple[str, str]]
+        The (start_date, end_date) windows, in chronological order
+
+    Raises
+    ------
+    ValueError
+        If a date is invalid, if start_date is later than end_date,
+        or if the range is shorter than min_days
+    """
+    is_int_instance(max_days, "max_days")
+    is_int_instance(min_days, "min_days")
+
+    start_ = parse_date(start_date, "start_date")
+    end_ = parse_date(end_date, "end_date").astimezone(start_.tzinfo)
+
+    if start_ > end_:
+        raise ValueError(
+            f"start_date ({start_date}) is later than end_date {end_date}")
+    if (end_ - start_).days < min_days:
+        raise ValueError(
+            f"Duration between start_date ({start_date}) and "
+            f"end_date ({end_date}) "
+            f"is less than min_days ({min_days} days)")
+
+    step_ = datetime.timedelta(days=max_days)
+    min_step_ = datetime.timedelta(days=min_days)
+
+    windows_ = []
+    window_start_ = start_
+    while window_start_ < end_:
+        window_end_ = min(window_start_ + step_, end_)
+        if window_end_ - window_start_ < min_step_:
+            window_start_ = window_end_ - min_step_
+        windows_.append((window_start_, window_end_))
+        window_start_ = window_end_
+
+    return [(window_start_.isoformat(), window_end_.isoformat())
+            for (window_start_, window_end_) in windows_]
+
+
+def _series_identity(series: dict) -> str:
+    """
+    Identify a series by all its fields but its dates and values
+    """
+    return json.dumps(
+        {key_: value_ for (key_, value_) in series.items()
+         if key_ not in ("start_date", "end_date", "values")},
+        sort_keys=True)
+
+
+def merge_responses(responses: "list[dict]") -> dict:
+    """
+    merge_responses(responses: "list[dict]") -> dict
+
+    Merge the responses of consecutive windows into a single response.
+    Series sharing the same fields (production type, unit...) are merged
+    into one series whose values are concatenated in chronological order,
+    values already seen at window boundaries being dropped.
+
+    Parameters
+    ----------
+    responses : list[dict]
+        The responses of the windows, in chronological order
+
+    Returns
+    -------
+    dict
+        The merged response
+    """
+    merged_ = {}
+    series_maps_ = {}
+
+    for response_ in responses:
+        for (key_, content_) in response_.items():
+            if not isinstance(content_, list):
+                merged_.setdefault(key_, content_)
+                continue
+            series_map_ = series_maps_.setdefault(key_, {})
+            merged_[key_] = series_map_
+            for series_ in content_:
+                identity_ = _series_identity(series_)
+                if identity_ not in series_map_:
+                    series_map_[identity_] = (dict(series_, values=[]), set())
+                (merged_series_, seen_) = series_map_[identity_]
+                merged_series_["end_date"] = series_.get("end_date")
+                for value_ in series_.get("values", []):
+                    if value_["start_date"] not in seen_:
+                        seen_.add(value_["start_date"])
+                        merged_series_["values"].append(value_)
+
+    for (key_, series_map_) in series_maps_.items():
+        merged_[key_] = [series_ for (series_, _) in series_map_.values()]
+
+    return merged_
@@ -0,0 +1,213 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the conversion of API responses into columnar series
+of NumPy arrays, requiring numpy
+"""
+
+import datetime
+from operator import itemgetter
+
+from py_france_rte.utils import DATE_FORMAT
+
+try:
+    import numpy as np
+except ImportError as err:
+    raise ImportError(
+        "Columnar results require numpy, "
+        "install it with \"pip install numpy\"") from err
+
+# Length of dates at format "YYYY-MM-DDThh:mm:sszzzzzz"
+_DATE_LENGTH = 25
+# (first character, length) of year, month, day, hour, minute, second,
+# offset hour and offset minute in dates
+_DATE_FIELDS = ((0, 4), (5, 2), (8, 2), (11, 2), (14, 2), (17, 2),
+                (20, 2), (23, 2))
+# Weight of each character in each field, so that
+# digits @ _DATE_WEIGHTS gives all fields in a single product
+_DATE_WEIGHTS = np.zeros((_DATE_LENGTH, len(_DATE_FIELDS)), dtype=np.float32)
+for (_field, (_first, _length)) in enumerate(_DATE_FIELDS):
+    for _index in range(_length):
+        _DATE_WEIGHTS[_first + _index, _field] = 10 ** (_length - 1 - _index)
+_DATE_ZERO = ord("0") * _DATE_WEIGHTS.sum(axis=0)
+
+
+def _parse_timestamps_slow(dates: "list[str]") -> "np.ndarray":
+    """
+    Parse dates one by one, for dates not at the expected fixed width
+    """
+    return np.array(
+        [datetime.datetime.strptime(date_, DATE_FORMAT).timestamp()
+         for date_ in dates],
+        dtype=np.int64)
+
+
+def parse_timestamps(dates: "list[str]") -> "np.ndarray":
+    """
+    parse_timestamps(dates: "list[str]") -> "np.ndarray"
+
+    Parse dates into epoch timestamps in a single vectorized pass
+
+    Parameters
+    ----------
+    dates : list[str]
+        The dates to parse, at format "YYYY-MM-DDThh:mm:sszzzzzz",
+        exemple : "2015-06-08T00:00:00+02:00"
+
+    Returns
+    -------
+    np.ndarray
+        The int64 epoch timestamps of the dates, in seconds
+    """
+    joined_ = "".join(dates)
+    if len(joined_) != len(dates) * _DATE_LENGTH or not joined_.isascii():
+        return _parse_timestamps_slow(dates)
+    chars_ = np.frombuffer(
+        joined_.encode("ascii"), dtype=np.uint8).reshape(-1, _DATE_LENGTH)
+    if not ((chars_[:, 10] == ord("T")).all()
+            and (chars_[:, 22] == ord(":")).all()):
+        return _parse_timestamps_slow(dates)
+
+    # Float products of characters are exact as all fields are lower
+    # than 2 ** 24, and much faster than integer ones
+    fields_ = chars_.astype(np.float32) @ _DATE_WEIGHTS
+    fields_ -= _DATE_ZERO
+    (year_, month_, day_, hour_, minute_, second_,
+     offset_hour_, offset_minute_) = fields_.T.astype(np.int64)
+
+    # Days since 1970-01-01 of a proleptic gregorian date
+    year_ -= month_ <= 2
+    era_ = year_ // 400
+    year_of_era_ = year_ - era_ * 400
+    day_of_year_ = (153 * ((month_ + 9) % 12) + 2) // 5 + day_ - 1
+    day_of_era_ = (year_of_era_ * 365 + year_of_era_ // 4
+                   - year_of_era_ // 100 + day_of_year_)
+    days_ = era_ * 146097 + day_of_era_ - 719468
+
+    sign_ = np.where(chars_[:, 19] == ord("-"), -1, 1)
+    offset_ = sign_ * (offset_hour_ * 3600 + offset_minute_ * 60)
+
+    return (days_ * 86400 + hour_ * 3600 + minute_ * 60 + second_
+            - offset_)
+
+
+class ColumnarSeries():
+    """
+    ColumnarSeries(
+            metadata: dict,
+            start: np.ndarray,
+            end: np.ndarray,
+            values: np.ndarray,
+            updated: np.ndarray) -> ColumnarSeries:
+
+    A series of an API response held in NumPy arrays
+
+    Parameters
+    ----------
+    metadata : dict
+        The fields of the series but its values, with the response key
+        as "endpoint", exemple : {"endpoint": "water_reserves",
+        "start_date": "2017-06-05T00:00:00+02:00",
+        "end_date": "2017-06-12T00:00:00+02:00"}
+    start : np.ndarray
+        The int64 epoch start timestamps of values, in seconds
+    end : np.ndarray
+        The int64 epoch end timestamps of values, in seconds
+    values : np.ndarray
+        The float64 values, NaN when missing
+    updated : np.ndarray
+        The int64 epoch update timestamps of values, in seconds,
+        -1 when missing
+
+    Returns
+    -------
+    ColumnarSeries
+        An instance of ColumnarSeries class
+    """
+
+    __slots__ = ("metadata", "start", "end", "values", "updated")
+
+    def __init__(
+            self,
+            metadata: dict,
+            start: "np.ndarray",
+            end: "np.ndarray",
+            values: "np.ndarray",
+            updated: "np.ndarray") -> None:
+        self.metadata = metadata
+        self.start = start
+        self.end = end
+        self.values = values
+        self.updated = updated
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"ColumnarSeries({self.metadata}, {len(self)} values)"
+
+
+def to_columnar(response: dict) -> "list[ColumnarSeries]":
+    """
+    to_columnar(response: dict) -> "list[ColumnarSeries]"
+
+    Convert an Actual Generation response into columnar series.
+    All dates of all series are parsed in a single vectorized pass.
+
+    Parameters
+    ----------
+    response : dict
+        A response of an Actual Generation request function,
+        or a merged response of request_chunked
+
+    Returns
+    -------
+    list[ColumnarSeries]
+        The series of the response, in order
+    """
+
+    metadata_ = []
+    lengths_ = []
+    points_ = []
+
+    for (key_, content_) in response.items():
+        if not isinstance(content_, list):
+            continue
+        for series_ in content_:
+            series_values_ = series_.get("values", [])
+            metadata_.append(dict(
+                {field_: value_ for (field_, value_) in series_.items()
+                 if field_ != "values"},
+                endpoint=key_))
+            lengths_.append(len(series_values_))
+            points_ += series_values_
+
+    start_ = parse_timestamps(list(map(itemgetter("start_date"), points_)))
+    end_ = parse_timestamps(list(map(itemgetter("end_date"), points_)))
+    try:
+        value_ = np.array(
+            list(map(itemgetter("value"), points_)), dtype=np.float64)
+    except KeyError:
+        value_ = np.array(
+            [point_.get("value") for point_ in points_], dtype=np.float64)
+    try:
+        update_ = parse_timestamps(
+            list(map(itemgetter("updated_date"), points_)))
+    except KeyError:
+        # Only the points lacking an update date get -1
+        updated_dates_ = [point_.get("updated_date") for point_ in points_]
+        present_ = [index_ for (index_, date_) in enumerate(updated_dates_)
+                    if date_ is not None]
+        update_ = np.full(len(points_), -1, dtype=np.int64)
+        update_[present_] = parse_timestamps(
+            [updated_dates_[index_] for index_ in present_])
+
+    bounds_ = np.cumsum([0] + lengths_)
+    return [ColumnarSeries(
+        metadata_[index_],
+        start_[bounds_[index_]:bounds_[index_ + 1]],
+        end_[bounds_[index_]:bounds_[index_ + 1]],
+        value_[bounds_[index_]:bounds_[index_ + 1]],
+        update_[bounds_[index_]:bounds_[index_ + 1]])
+        for index_ in range(len(metadata_))]
@@ -0,0 +1,260 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the ValidatorCache class, keeping the validators
+(ETag, Last-Modified) and decoded body of responses so that requests
+can be sent as conditional GET requests
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from py_france_rte.utils import is_int_instance
+
+
+def normalize_url(url: str) -> str:
+    """
+    normalize_url(url: str) -> str
+
+    Normalize a request url, so that urls differing only by the case
+    of their host or the order of their options share their validators
+
+    Parameters
+    ----------
+    url : str
+        The request url, with its options
+
+    Returns
+    -------
+    str
+        The normalized url
+    """
+    parts_ = urlsplit(url)
+    return urlunsplit((
+        parts_.scheme.lower(),
+        parts_.netloc.lower(),
+        parts_.path,
+        urlencode(sorted(parse_qsl(parts_.query, keep_blank_values=True))),
+        ""))
+
+
+class Validated():
+    """
+    Validated(
+            etag: Optional[str],
+            last_modified: Optional[str],
+            content: Any,
+            size: int) -> Validated:
+
+    A stored response with its validators
+
+    Parameters
+    ----------
+    etag : str or None
+        The ETag header of the response
+    last_modified : str or None
+        The Last-Modified header of the response
+    content : Any
+        The decoded response
+    size : int
+        The size of the response body in bytes
+
+    Returns
+    -------
+    Validated
+        An instance of Validated class
+    """
+
+    __slots__ = ("etag", "last_modified", "content", "size")
+
+    def __init__(
+            self,
+            etag: Optional[str],
+            last_modified: Optional[str],
+            content: Any,
+            size: int) -> None:
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content = content
+        self.size = size
+
+    @property
+    def headers(self) -> "dict[str, str]":
+        """
+        Headers making a request conditional on these validators
+        """
+        headers_ = {}
+        if self.etag is not None:
+            headers_["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers_["If-Modified-Since"] = self.last_modified
+        return headers_
+
+
+class ValidatorCache():
+    """
+    ValidatorCache(
+            max_entries: int = 256,
+            max_size: int = 16777216) -> ValidatorCache:
+
+    In-process thread-safe store of validated responses by normalized
+    request url. Requests of a stored url are sent with If-None-Match
+    and If-Modified-Since headers, and a 304 Not Modified answer gets
+    the stored response, without downloading nor decoding it again.
+    Returned responses are shared by all callers and must not be
+    modified. The least recently used responses are dropped first when
+    there are more than max_entries of them or when their bodies exceed
+    max_size bytes, responses larger than max_size are not stored.
+
+    Parameters
+    ----------
+    max_entries : int, default: 256
+        The maximum number of stored responses
+    max_size : int, default: 16777216
+        The maximum total size in bytes of the bodies of stored
+        responses, defaults to 16 MiB
+
+    Returns
+    -------
+    ValidatorCache
+        An instance of ValidatorCache class
+
+    Raises
+    ------
+    TypeError
+        If a parameter is of an unexpected type
+    """
+
+    def __init__(
+            self,
+            max_entries: int = 256,
+            max_size: int = 16777216) -> None:
+
+        is_int_instance(max_entries, "max_entries")
+        is_int_instance(max_size, "max_size")
+
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # normalized url: Validated, least recently used first
+        self._entries = OrderedDict()
+        # Total size of the bodies of stored responses
+        self._size = 0
+        self._stats = {
+            "not_modified": 0,
+            "modified": 0,
+            "bytes_saved": 0}
+
+    @property
+    def stats(self) -> "dict[str, int]":
+        """
+        Counters of not_modified (304) and modified (200) answers to
+        conditional requests, and bytes_saved by 304 answers
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self) -> None:
+        """
+        Remove all responses
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get(self, url: str) -> Optional[Validated]:
+        """
+        get(self, url: str) -> Optional[Validated]
+
+        Get the stored response of a url
+
+        Parameters
+        ----------
+        url : str
+            The request url, with its options
+
+        Returns
+        -------
+        Validated or None
+            The stored response, None if missing
+        """
+
+        key_ = normalize_url(url)
+        with self._lock:
+            validated_ = self._entries.get(key_)
+            if validated_ is not None:
+                self._entries.move_to_end(key_)
+            return validated_
+
+    def set(
+            self,
+            url: str,
+            headers: "dict[str, str]",
+            content: Any,
+            size: int) -> None:
+        """
+        set(
+                self,
+                url: str,
+                headers: "dict[str, str]",
+                content: Any,
+                size: int) -> None
+
+        Store a response of a url, if it has validators and fits
+        in max_size
+
+        Parameters
+        ----------
+        url : str
+            The request url, with its options
+        headers : dict[str, str]
+            The response headers, case insensitive
+        content : Any
+            The decoded response
+        size : int
+            The size of the response body in bytes
+        """
+
+        etag_ = headers.get("ETag")
+        last_modified_ = headers.get("Last-Modified")
+        if etag_ is None and last_modified_ is None:
+            return
+
+        key_ = normalize_url(url)
+        with self._lock:
+            previous_ = self._entries.pop(key_, None)
+            if previous_ is not None:
+                self._size -= previous_.size
+            if size > self.max_size:
+                return
+            self._entries[key_] = Validated(
+                etag_, last_modified_, content, size)
+            self._size += size
+            while len(self._entries) > self.max_entries \
+                    or self._size > self.max_size:
+                (_, evicted_) = self._entries.popitem(last=False)
+                self._size -= evicted_.size
+
+    def record(self, validated: Validated, not_modified: bool) -> None:
+        """
+        record(self, validated: Validated, not_modified: bool) -> None
+
+        Count the answer to a conditional request
+
+        Parameters
+        ----------
+        validated : Validated
+            The stored response the request was conditional on
+        not_modified : bool
+            True if the answer was 304 Not Modified
+        """
+
+        with self._lock:
+            if not_modified:
+                self._stats["not_modified"] += 1
+                self._stats["bytes_saved"] += validated.size
+            else:
+                self._stats["modified"] += 1
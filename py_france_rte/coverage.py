@@ -0,0 +1,254 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the IntervalSet and CoverageIndex classes, recording
+which date ranges of each endpoint were already fetched
+"""
+
+import bisect
+import datetime
+from typing import Iterator
+
+from py_france_rte.chunking import parse_date
+from py_france_rte.utils import (file_lock, is_int_instance, is_str_instance,
+                                 read_json, write_json)
+
+
+class IntervalSet():
+    """
+    IntervalSet(intervals: "list[tuple[int, int]]" = ()) -> IntervalSet:
+
+    Set of disjoint [start, end) integer intervals, sorted by start.
+    Overlapping and adjacent intervals are merged when added, so that
+    the set stays as small as the covered ranges allow.
+
+    Parameters
+    ----------
+    intervals : list[tuple[int, int]], default: ()
+        The intervals initially in the set, in any order
+
+    Returns
+    -------
+    IntervalSet
+        An instance of IntervalSet class
+    """
+
+    def __init__(self, intervals: "list[tuple[int, int]]" = ()) -> None:
+        self._starts = []
+        self._ends = []
+        for (start_, end_) in intervals:
+            self.add(start_, end_)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> "Iterator[tuple[int, int]]":
+        return zip(self._starts, self._ends)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def add(self, start: int, end: int) -> None:
+        """
+        add(self, start: int, end: int) -> None
+
+        Add the [start, end) interval to the set
+
+        Parameters
+        ----------
+        start : int
+            The start of the interval
+        end : int
+            The end of the interval, excluded
+        """
+
+        is_int_instance(start, "start")
+        is_int_instance(end, "end")
+        if start >= end:
+            return
+
+        # Intervals ending at start or later and starting at end or
+        # earlier overlap or touch the new one
+        first_ = bisect.bisect_left(self._ends, start)
+        last_ = bisect.bisect_right(self._starts, end)
+        if first_ < last_:
+            start = min(start, self._starts[first_])
+            end = max(end, self._ends[last_ - 1])
+        self._starts[first_:last_] = [start]
+        self._ends[first_:last_] = [end]
+
+    def missing(self, start: int, end: int) -> "list[tuple[int, int]]":
+        """
+        missing(self, start: int, end: int) -> "list[tuple[int, int]]"
+
+        Find the parts of the [start, end) interval not in the set
+
+        Parameters
+        ----------
+        start : int
+            The start of the interval
+        end : int
+            The end of the interval, excluded
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The missing [start, end) intervals, sorted
+        """
+
+        missing_ = []
+        cursor_ = start
+        index_ = bisect.bisect_right(self._ends, start)
+        while index_ < len(self._starts) and self._starts[index_] < end:
+            if self._starts[index_] > cursor_:
+                missing_.append((cursor_, self._starts[index_]))
+            cursor_ = max(cursor_, self._ends[index_])
+            index_ += 1
+        if cursor_ < end:
+            missing_.append((cursor_, end))
+        return missing_
+
+
+class CoverageIndex():
+    """
+    CoverageIndex(path: str) -> CoverageIndex:
+
+    On-disk record of the date ranges already fetched, per endpoint and
+    request options, exemple : keys built by sync.watermark_key.
+    Reads and writes are protected by a lock file, so that it can be
+    shared by jobs running at the same time.
+
+    Parameters
+    ----------
+    path : str
+        The path of the json file holding the covered ranges,
+        the lock file is the same path suffixed by ".lock"
+
+    Returns
+    -------
+    CoverageIndex
+        An instance of CoverageIndex class
+
+    Raises
+    ------
+    TypeError
+        If a parameter is of an unexpected type
+    """
+
+    def __init__(self, path: str) -> None:
+
+        is_str_instance(path, "path")
+
+        self.path = path
+        self.lock_path = path + ".lock"
+
+    def _read(self) -> "dict":
+        """
+        Read all covered ranges, the lock being held by the caller
+        """
+
+        return read_json(self.path)
+
+    def _write(self, coverage: "dict") -> None:
+        """
+        Atomically replace all covered ranges,
+        the lock being held by the caller
+        """
+
+        write_json(self.path, coverage, sort_keys=True)
+
+    def get(self, key: str) -> IntervalSet:
+        """
+        get(self, key: str) -> IntervalSet
+
+        Get the covered ranges of some data
+
+        Parameters
+        ----------
+        key : str
+            The key of the data, exemple : "actual_generation_per_type"
+
+        Returns
+        -------
+        IntervalSet
+            The covered ranges, as epoch timestamps in seconds
+        """
+
+        is_str_instance(key, "key")
+
+        with file_lock(self.lock_path, exclusive=False):
+            return IntervalSet(
+                tuple(interval_) for interval_ in self._read().get(key, []))
+
+    def add(self, key: str, start_date: str, end_date: str) -> None:
+        """
+        add(self, key: str, start_date: str, end_date: str) -> None
+
+        Record a fetched range of some data
+
+        Parameters
+        ----------
+        key : str
+            The key of the data, exemple : "actual_generation_per_type"
+        start_date : str
+            The start date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz", exemple : "2015-06-08T00:00:00+02:00"
+        end_date : str
+            The end date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz", exemple : "2015-06-08T00:00:00+02:00"
+        """
+
+        is_str_instance(key, "key")
+        start_ = int(parse_date(start_date, "start_date").timestamp())
+        end_ = int(parse_date(end_date, "end_date").timestamp())
+
+        with file_lock(self.lock_path):
+            coverage_ = self._read()
+            intervals_ = IntervalSet(
+                tuple(interval_) for interval_ in coverage_.get(key, []))
+            intervals_.add(start_, end_)
+            coverage_[key] = [list(interval_) for interval_ in intervals_]
+            self._write(coverage_)
+
+    def missing(
+            self,
+            key: str,
+            start_date: str,
+            end_date: str) -> "list[tuple[str, str]]":
+        """
+        missing(
+                self,
+                key: str,
+                start_date: str,
+                end_date: str) -> "list[tuple[str, str]]"
+
+        Find the parts of a date range not fetched yet
+
+        Parameters
+        ----------
+        key : str
+            The key of the data, exemple : "actual_generation_per_type"
+        start_date : str
+            The start date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz", exemple : "2015-06-08T00:00:00+02:00"
+        end_date : str
+            The end date of the range, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz", exemple : "2015-06-08T00:00:00+02:00"
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The missing (start_date, end_date) ranges, sorted, expressed
+            with the timezone offset of start_date
+        """
+
+        start_ = parse_date(start_date, "start_date")
+        end_ = parse_date(end_date, "end_date")
+
+        return [(datetime.datetime.fromtimestamp(
+                    missing_start_, start_.tzinfo).isoformat(),
+                 datetime.datetime.fromtimestamp(
+                    missing_end_, start_.tzinfo).isoformat())
+                for (missing_start_, missing_end_) in self.get(key).missing(
+                    int(start_.timestamp()), int(end_.timestamp()))]
@@ -5,6 +5,8 @@
 This file contains all py_france_rte related errors
 """
 
+from typing import Optional
+
 
 class NoAccessError(Exception):
     """
@@ -15,7 +17,26 @@ class NoAccessError(Exception):
 
 class ComError(Exception):
     """
-    Basic communication error
+    Basic communication error, holding the response code if any
+    and the number of attempts made before failing
+    """
+
+    def __init__(self, *args, code: Optional[int] = None,
+                 attempts: int = 1) -> None:
+        super().__init__(*args)
+        self.code = code
+        self.attempts = attempts
+
+    def __str__(self) -> str:
+        if self.attempts > 1:
+            return f"{super().__str__()} ({self.attempts} attempts)"
+        return super().__str__()
+
+
+class RateLimitError(ComError):
+    """
+    Error to specify to the user that a request was not sent,
+    as it would exceed the rate limit of the API
     """
 
 
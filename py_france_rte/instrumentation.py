@@ -0,0 +1,272 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the events emitted for each request of an application
+to its hooks, and the HistogramCollector hook exporting them to Prometheus
+"""
+
+import bisect
+import threading
+from time import perf_counter
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+# Upper bounds of duration histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1., 2.5, 5.,
+                   10., 30.)
+
+
+class RequestEvent():
+    """
+    RequestEvent(api: str, url: str) -> RequestEvent:
+
+    Measures of a request of an application, emitted to its hooks
+    once the request succeeded or failed. Timings are in seconds, per
+    phase : "rate_limit" waiting for the rate limit, "token" verifying
+    and refreshing the oauth token, "wait" from sending the request to
+    receiving the response headers (connection, TLS, server time),
+    "download" receiving the body, "retry_wait" waiting between
+    attempts, "parse" decoding json, and "total". bytes_saved holds
+    the size of the stored response when a conditional request is
+    answered by 304 Not Modified.
+
+    Parameters
+    ----------
+    api : str
+        The requested API
+    url : str
+        The request url, with its options
+
+    Returns
+    -------
+    RequestEvent
+        An instance of RequestEvent class
+    """
+
+    __slots__ = ("api", "url", "status", "bytes", "bytes_saved",
+                 "attempts", "cache_hit", "error", "timings", "_start")
+
+    def __init__(self, api: str, url: str) -> None:
+        self.api = api
+        self.url = url
+        self.status = None
+        self.bytes = 0
+        self.bytes_saved = 0
+        self.attempts = 0
+        self.cache_hit = False
+        self.error = None
+        self.timings = {}
+        self._start = perf_counter()
+
+    def __repr__(self) -> str:
+        return (f"RequestEvent({self.endpoint}, status={self.status}, "
+                f"attempts={self.attempts}, timings={self.timings})")
+
+    @property
+    def endpoint(self) -> str:
+        """
+        Last segment of the url path, exemple : "water_reserves"
+        """
+        return urlsplit(self.url).path.rstrip("/").rsplit("/", 1)[-1]
+
+    @property
+    def window(self) -> "tuple[Optional[str], Optional[str]]":
+        """
+        Requested (start_date, end_date), (None, None) if not dated
+        """
+        parameters_ = parse_qs(urlsplit(self.url).query)
+        return (parameters_.get("start_date", [None])[0],
+                parameters_.get("end_date", [None])[0])
+
+    def lap(self, phase: str, start: float) -> float:
+        """
+        Add the time elapsed since start to a phase, returns the current time
+        """
+        now_ = perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.) + now_ - start
+        return now_
+
+    def lap_response(self, elapsed: float, start: float) -> float:
+        """
+        Split the time elapsed since start between waiting for the
+        response headers, elapsed seconds, and downloading the body
+        """
+        now_ = perf_counter()
+        self.timings["wait"] = self.timings.get("wait", 0.) + elapsed
+        self.timings["download"] = self.timings.get("download", 0.) \
+            + max(0., now_ - start - elapsed)
+        return now_
+
+    def finish(self) -> None:
+        """
+        Record the total duration of the request
+        """
+        self.timings["total"] = perf_counter() - self._start
+
+
+class HistogramCollector():
+    """
+    HistogramCollector(buckets: "tuple[float, ...]" = DEFAULT_BUCKETS)
+        -> HistogramCollector:
+
+    Hook aggregating request events in memory, in a duration histogram
+    per endpoint and phase and in counters per endpoint and status.
+    Thread-safe, to be registered with application.add_hook(collector).
+
+    Parameters
+    ----------
+    buckets : tuple[float, ...], default: DEFAULT_BUCKETS
+        The upper bounds of the histogram buckets, in seconds
+
+    Returns
+    -------
+    HistogramCollector
+        An instance of HistogramCollector class
+    """
+
+    def __init__(
+            self,
+            buckets: "tuple[float, ...]" = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        # (endpoint, phase): [bucket counts..., +Inf count, sum]
+        self.histograms = {}
+        # (endpoint, status): count
+        self.requests = {}
+        # endpoint: {"bytes", "bytes_saved", "retries", "cache_hits",
+        # "not_modified"}
+        self.totals = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        endpoint_ = event.endpoint
+        status_ = "cache" if event.cache_hit else str(
+            event.status if event.status is not None else event.error)
+
+        with self._lock:
+            for (phase_, duration_) in event.timings.items():
+                histogram_ = self.histograms.setdefault(
+                    (endpoint_, phase_), [0] * (len(self.buckets) + 1) + [0.])
+                histogram_[bisect.bisect_left(self.buckets, duration_)] += 1
+                histogram_[-1] += duration_
+
+            key_ = (endpoint_, status_)
+            self.requests[key_] = self.requests.get(key_, 0) + 1
+
+            totals_ = self.totals.setdefault(
+                endpoint_, {"bytes": 0, "bytes_saved": 0, "retries": 0,
+                            "cache_hits": 0, "not_modified": 0})
+            totals_["bytes"] += event.bytes
+            totals_["bytes_saved"] += event.bytes_saved
+            totals_["retries"] += max(0, event.attempts - 1)
+            totals_["cache_hits"] += event.cache_hit
+            totals_["not_modified"] += event.status == 304
+
+    def percentile(
+            self,
+            endpoint: str,
+            phase: str,
+            fraction: float) -> Optional[float]:
+        """
+        percentile(
+                self,
+                endpoint: str,
+                phase: str,
+                fraction: float) -> Optional[float]
+
+        Estimate a duration percentile as the upper bound of its bucket
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint, exemple : "signals"
+        phase : str
+            The phase, exemple : "total"
+        fraction : float
+            The percentile, exemple : 0.99
+
+        Returns
+        -------
+        float or None
+            The duration in seconds, infinity beyond the last bucket,
+            None if no request was recorded
+        """
+
+        with self._lock:
+            histogram_ = self.histograms.get((endpoint, phase))
+            if histogram_ is None:
+                return None
+            counts_ = histogram_[:-1]
+
+        rank_ = fraction * sum(counts_)
+        cumulated_ = 0
+        for (bound_, count_) in zip(self.buckets + (float("inf"),), counts_):
+            cumulated_ += count_
+            if cumulated_ >= rank_:
+                return bound_
+        return float("inf")
+
+    def to_prometheus(self, prefix: str = "py_france_rte") -> str:
+        """
+        to_prometheus(self, prefix: str = "py_france_rte") -> str
+
+        Export all metrics in the Prometheus text format
+
+        Parameters
+        ----------
+        prefix : str, default: "py_france_rte"
+            The prefix of metric names
+
+        Returns
+        -------
+        str
+            The metrics, exemple :
+            'py_france_rte_requests_total{endpoint="signals",status="200"} 3'
+        """
+
+        with self._lock:
+            histograms_ = {key_: list(value_)
+                           for (key_, value_) in self.histograms.items()}
+            requests_ = dict(self.requests)
+            totals_ = {key_: dict(value_)
+                       for (key_, value_) in self.totals.items()}
+
+        lines_ = [
+            f"# HELP {prefix}_request_duration_seconds "
+            f"Duration of request phases",
+            f"# TYPE {prefix}_request_duration_seconds histogram"]
+        for ((endpoint_, phase_), histogram_) in sorted(histograms_.items()):
+            labels_ = f'endpoint="{endpoint_}",phase="{phase_}"'
+            cumulated_ = 0
+            for (bound_, count_) in zip(
+                    self.buckets + (float("inf"),), histogram_[:-1]):
+                cumulated_ += count_
+                bound_text_ = "+Inf" if bound_ == float("inf") \
+                    else repr(bound_)
+                lines_.append(
+                    f"{prefix}_request_duration_seconds_bucket"
+                    f'{{{labels_},le="{bound_text_}"}} {cumulated_}')
+            lines_.append(f"{prefix}_request_duration_seconds_sum"
+                          f"{{{labels_}}} {histogram_[-1]!r}")
+            lines_.append(f"{prefix}_request_duration_seconds_count"
+                          f"{{{labels_}}} {cumulated_}")
+
+        lines_ += [f"# HELP {prefix}_requests_total Requests by status",
+                   f"# TYPE {prefix}_requests_total counter"]
+        for ((endpoint_, status_), count_) in sorted(requests_.items()):
+            lines_.append(f'{prefix}_requests_total{{endpoint="{endpoint_}",'
+                          f'status="{status_}"}} {count_}')
+
+        for (name_, help_) in (
+                ("bytes", "Bytes received"),
+                ("bytes_saved", "Bytes not downloaded thanks to 304 answers"),
+                ("retries", "Requests sent again"),
+                ("cache_hits", "Responses read from cache"),
+                ("not_modified", "Conditional requests answered by 304")):
+            lines_ += [f"# HELP {prefix}_{name_}_total {help_}",
+                       f"# TYPE {prefix}_{name_}_total counter"]
+            for (endpoint_, endpoint_totals_) in sorted(totals_.items()):
+                lines_.append(f'{prefix}_{name_}_total{{endpoint='
+                              f'"{endpoint_}"}} {endpoint_totals_[name_]}')
+
+        return "\n".join(lines_) + "\n"
@@ -0,0 +1,169 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the TTLCache class, an in-process cache
+coalescing concurrent requests of the same data
+"""
+
+import threading
+from time import monotonic
+from typing import Any, Callable
+
+from py_france_rte.utils import is_int_instance
+
+
+class _Flight():
+    """
+    A load in progress, shared by all callers waiting for its result
+    """
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class TTLCache():
+    """
+    TTLCache(ttl: int, stale_ttl: int = 0) -> TTLCache:
+
+    In-process thread-safe cache. Values are fresh for ttl seconds, then
+    stale for stale_ttl more seconds: stale values are returned at once
+    while a single background load refreshes them. When many callers miss
+    the cache at the same time, only one of them loads the value and the
+    others wait for its result. Returned values are shared by all callers
+    and must not be modified.
+
+    Parameters
+    ----------
+    ttl : int
+        The time in seconds during which a loaded value is fresh
+    stale_ttl : int, default: 0
+        The time in seconds during which an expired value is
+        still returned while being refreshed
+
+    Returns
+    -------
+    TTLCache
+        An instance of TTLCache class
+
+    Raises
+    ------
+    TypeError
+        If a parameter is of an unexpected type
+    """
+
+    def __init__(self, ttl: int, stale_ttl: int = 0) -> None:
+
+        is_int_instance(ttl, "ttl")
+        is_int_instance(stale_ttl, "stale_ttl")
+
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._lock = threading.Lock()
+        # key: (value, load time)
+        self._entries = {}
+        # key: _Flight
+        self._flights = {}
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "errors": 0}
+
+    @property
+    def stats(self) -> "dict[str, int]":
+        """
+        Counters of hits (fresh), stale_hits, misses, coalesced misses
+        (waiting for another caller load) and load errors
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def clear(self) -> None:
+        """
+        Remove all values
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_load(self, key: Any, load: Callable[[], Any]) -> Any:
+        """
+        get_or_load(self, key: Any, load: Callable[[], Any]) -> Any
+
+        Get the value of a key, loading it if missing or expired
+
+        Parameters
+        ----------
+        key : Any
+            The key of the value, must be hashable
+        load : Callable[[], Any]
+            Load the value of the key
+
+        Returns
+        -------
+        Any
+            The value of the key
+
+        Raises
+        ------
+        Exception
+            The error raised by load, if no value could be returned
+        """
+
+        with self._lock:
+            now_ = monotonic()
+            entry_ = self._entries.get(key)
+            if entry_ is not None:
+                (value_, loaded_) = entry_
+                if now_ < loaded_ + self.ttl:
+                    self._stats["hits"] += 1
+                    return value_
+                if now_ < loaded_ + self.ttl + self.stale_ttl:
+                    self._stats["stale_hits"] += 1
+                    if key not in self._flights:
+                        flight_ = self._flights[key] = _Flight()
+                        threading.Thread(
+                            target=self._load,
+                            args=(key, load, flight_),
+                            daemon=True).start()
+                    return value_
+
+            self._stats["misses"] += 1
+            flight_ = self._flights.get(key)
+            leader_ = flight_ is None
+            if leader_:
+                flight_ = self._flights[key] = _Flight()
+            else:
+                self._stats["coalesced"] += 1
+
+        if leader_:
+            self._load(key, load, flight_)
+        else:
+            flight_.event.wait()
+
+        if flight_.error is not None:
+            raise flight_.error
+        return flight_.result
+
+    def _load(self, key: Any, load: Callable[[], Any],
+              flight: _Flight) -> None:
+        """
+        Load the value of a key and share it with callers waiting for it
+        """
+
+        try:
+            flight.result = load()
+        except Exception as err:  # pylint: disable=W0703
+            flight.error = err
+        with self._lock:
+            if flight.error is None:
+                self._entries[key] = (flight.result, monotonic())
+            else:
+                self._stats["errors"] += 1
+            del self._flights[key]
+        flight.event.set()
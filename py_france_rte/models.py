@@ -0,0 +1,358 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains compact models of API responses, holding values in
+contiguous buffers and parsing dates only when accessed
+"""
+
+import datetime
+from array import array
+from typing import Iterator, Optional, Union
+
+_NAN = float("nan")
+
+
+class DateColumn():
+    """
+    DateColumn(dates: "list[Optional[str]]") -> DateColumn:
+
+    Dates held in a single buffer instead of one str object each.
+    Dates of the same length, like all dates at format
+    "YYYY-MM-DDThh:mm:sszzzzzz", are stored as fixed width ascii.
+    Repeated dates are stored once.
+
+    Parameters
+    ----------
+    dates : list[str or None]
+        The dates, exemple : ["2015-06-08T00:00:00+02:00"]
+
+    Returns
+    -------
+    DateColumn
+        An instance of DateColumn class
+    """
+
+    __slots__ = ("_buffer", "_width", "_indexes")
+
+    def __init__(self, dates: "list[Optional[str]]") -> None:
+        # Repeated dates, exemple : update dates, are stored once
+        unique_ = dict.fromkeys(dates)
+        if len(unique_) < len(dates) // 2:
+            positions_ = {date_: index_
+                          for (index_, date_) in enumerate(unique_)}
+            self._indexes = array(
+                "I", [positions_[date_] for date_ in dates])
+            dates = list(unique_)
+        else:
+            self._indexes = None
+
+        widths_ = {len(date_) for date_ in dates if date_ is not None}
+        if None not in unique_ and len(widths_) <= 1 \
+                and all(date_.isascii() for date_ in dates):
+            self._width = widths_.pop() if widths_ else 0
+            self._buffer = "".join(dates).encode("ascii")
+        else:
+            self._width = None
+            self._buffer = tuple(dates)
+
+    def __len__(self) -> int:
+        if self._indexes is not None:
+            return len(self._indexes)
+        if self._width is None:
+            return len(self._buffer)
+        return len(self._buffer) // self._width if self._width else 0
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Date column index out of range")
+        if self._indexes is not None:
+            index = self._indexes[index]
+        if self._width is None:
+            return self._buffer[index]
+        return self._buffer[
+            index * self._width:(index + 1) * self._width].decode("ascii")
+
+    def datetime(self, index: int) -> Optional[datetime.datetime]:
+        """
+        datetime(self, index: int) -> Optional[datetime.datetime]
+
+        Parse a date of the column
+
+        Parameters
+        ----------
+        index : int
+            The position of the date
+
+        Returns
+        -------
+        datetime.datetime or None
+            The timezone aware date, None if missing
+        """
+
+        date_ = self[index]
+        return datetime.datetime.fromisoformat(date_) \
+            if date_ is not None else None
+
+
+class Point():
+    """
+    Point(series: Series, index: int) -> Point:
+
+    View of a value of a series, its dates being parsed only when accessed
+
+    Parameters
+    ----------
+    series : Series
+        The series holding the value
+    index : int
+        The position of the value in the series
+
+    Returns
+    -------
+    Point
+        An instance of Point class
+    """
+
+    __slots__ = ("_series", "_index")
+
+    def __init__(self, series: "Series", index: int) -> None:
+        self._series = series
+        self._index = index
+
+    def __repr__(self) -> str:
+        return (f"Point({self.start_date}, {self.end_date}, "
+                f"value={self.value})")
+
+    @property
+    def start_date(self) -> str:
+        """
+        Start date of the value, exemple : "2015-06-08T00:00:00+02:00"
+        """
+        return self._series.start_dates[self._index]
+
+    @property
+    def end_date(self) -> str:
+        """
+        End date of the value, exemple : "2015-06-08T01:00:00+02:00"
+        """
+        return self._series.end_dates[self._index]
+
+    @property
+    def updated_date(self) -> Optional[str]:
+        """
+        Update date of the value, None if missing
+        """
+        return self._series.updated_dates[self._index]
+
+    @property
+    def value(self) -> float:
+        """
+        The value, NaN if missing
+        """
+        return self._series.values[self._index]
+
+    @property
+    def start(self) -> datetime.datetime:
+        """
+        Parsed start date of the value
+        """
+        return self._series.start_dates.datetime(self._index)
+
+    @property
+    def end(self) -> datetime.datetime:
+        """
+        Parsed end date of the value
+        """
+        return self._series.end_dates.datetime(self._index)
+
+    @property
+    def updated(self) -> Optional[datetime.datetime]:
+        """
+        Parsed update date of the value, None if missing
+        """
+        return self._series.updated_dates.datetime(self._index)
+
+    def to_dict(self) -> dict:
+        """
+        to_dict(self) -> dict
+
+        Get the value in the form of the API response
+
+        Returns
+        -------
+        dict
+            The value, exemple : {"start_date": "2015-06-08T00:00:00+02:00",
+            "end_date": "2015-06-08T01:00:00+02:00", "value": 1268,
+            "updated_date": "2015-06-08T01:00:00+02:00"}
+        """
+        point_ = {"start_date": self.start_date,
+                  "end_date": self.end_date,
+                  "value": self.value}
+        if self.updated_date is not None:
+            point_["updated_date"] = self.updated_date
+        return point_
+
+
+class Series():
+    """
+    Series(
+            metadata: dict,
+            start_dates: DateColumn,
+            end_dates: DateColumn,
+            updated_dates: DateColumn,
+            values: array) -> Series:
+
+    A series of an Actual Generation response, its values held in a
+    contiguous array of doubles and its dates in DateColumn buffers.
+    Indexing and iterating give Point views.
+
+    Parameters
+    ----------
+    metadata : dict
+        The fields of the series but its values,
+        exemple : {"production_type": "NUCLEAR"}
+    start_dates : DateColumn
+        The start dates of values
+    end_dates : DateColumn
+        The end dates of values
+    updated_dates : DateColumn
+        The update dates of values
+    values : array
+        The values, as an array of type "d", NaN when missing
+
+    Returns
+    -------
+    Series
+        An instance of Series class
+    """
+
+    __slots__ = ("metadata", "start_dates", "end_dates", "updated_dates",
+                 "values")
+
+    def __init__(
+            self,
+            metadata: dict,
+            start_dates: DateColumn,
+            end_dates: DateColumn,
+            updated_dates: DateColumn,
+            values: array) -> None:
+        self.metadata = metadata
+        self.start_dates = start_dates
+        self.end_dates = end_dates
+        self.updated_dates = updated_dates
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Point:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Series index out of range")
+        return Point(self, index)
+
+    def __iter__(self) -> Iterator[Point]:
+        return (Point(self, index_) for index_ in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"Series({self.metadata}, {len(self)} values)"
+
+    @classmethod
+    def from_dict(cls, series: dict) -> "Series":
+        """
+        from_dict(cls, series: dict) -> Series
+
+        Build a series from a series of a response, exemple : an item
+        of a stream_* function, so that responses can be converted
+        without being fully decoded
+
+        Parameters
+        ----------
+        series : dict
+            The series, holding its values in "values"
+
+        Returns
+        -------
+        Series
+            The compact series
+        """
+        values_ = series.get("values", [])
+        return cls(
+            {key_: value_ for (key_, value_) in series.items()
+             if key_ != "values"},
+            DateColumn([value_["start_date"] for value_ in values_]),
+            DateColumn([value_["end_date"] for value_ in values_]),
+            DateColumn([value_.get("updated_date") for value_ in values_]),
+            array("d", [_NAN if value_.get("value") is None
+                        else value_["value"] for value_ in values_]))
+
+
+class EcowattSignal():
+    """
+    EcowattSignal(signal: dict) -> EcowattSignal:
+
+    A day of Ecowatt signals, its hourly values held in an array of bytes
+
+    Parameters
+    ----------
+    signal : dict
+        A signal of the Ecowatt response
+
+    Returns
+    -------
+    EcowattSignal
+        An instance of EcowattSignal class
+    """
+
+    __slots__ = ("day_date", "generation_date", "dvalue", "message",
+                 "hvalues")
+
+    def __init__(self, signal: dict) -> None:
+        self.day_date = signal.get("jour")
+        self.generation_date = signal.get("GenerationFichier")
+        self.dvalue = signal.get("dvalue")
+        self.message = signal.get("message")
+        hvalues_ = array("b", [0] * 24)
+        for value_ in signal.get("values", []):
+            hvalues_[value_["pas"]] = value_["hvalue"]
+        self.hvalues = hvalues_
+
+    def __repr__(self) -> str:
+        return f"EcowattSignal({self.day_date}, dvalue={self.dvalue})"
+
+    @property
+    def day(self) -> Optional[datetime.datetime]:
+        """
+        Parsed day of the signal
+        """
+        return datetime.datetime.fromisoformat(self.day_date) \
+            if self.day_date is not None else None
+
+
+def to_models(response: dict) -> "list[Union[Series, EcowattSignal]]":
+    """
+    to_models(response: dict) -> "list[Union[Series, EcowattSignal]]"
+
+    Convert a response into compact models
+
+    Parameters
+    ----------
+    response : dict
+        A response of an Actual Generation or Ecowatt request function
+
+    Returns
+    -------
+    list[Series or EcowattSignal]
+        The signals of an Ecowatt response,
+        the series of an Actual Generation response, in order
+    """
+    if "signals" in response:
+        return [EcowattSignal(signal_) for signal_ in response["signals"]]
+    return [Series.from_dict(dict(series_, endpoint=key_))
+            for (key_, content_) in response.items()
+            if isinstance(content_, list)
+            for series_ in content_]
@@ -2,27 +2,19 @@
 # -*- coding: UTF-8 -*-
 
 """
-This file contains all functions dedicated to the actual generation api
+This file contains all functions dedicated to the actual generation api,
+its endpoints being declared in py_france_rte.registry
 """
 
 from typing import Optional
 
-import requests
+from py_france_rte.registry import ENDPOINTS
+from py_france_rte.utils import is_str_instance
 
-from py_france_rte.base_application import BaseApplication
-from py_france_rte.utils import (BASE_OPEN_API_URL, generate_header,
-                                 is_str_instance, prepare_date_request,
-                                 prepare_url_with_options, verify_dates,
-                                 verify_response_code)
-
-ACTUAL_GENERATION_PER_TYPE_URL = BASE_OPEN_API_URL + \
-    "actual_generation/v1/actual_generations_per_production_type"
-ACTUAL_GENERATION_PER_UNIT_URL = BASE_OPEN_API_URL + \
-    "actual_generation/v1/actual_generations_per_unit"
-WATER_RESERVES_URL = BASE_OPEN_API_URL + \
-    "actual_generation/v1/water_reserves"
-GENRATION_MIX_15MIN_URL = BASE_OPEN_API_URL + \
-    "actual_generation/v1/generation_mix_15min_time_scale"
+ACTUAL_GENERATION_PER_TYPE_URL = ENDPOINTS["actual_generation_per_type"].url
+ACTUAL_GENERATION_PER_UNIT_URL = ENDPOINTS["actual_generation_per_unit"].url
+WATER_RESERVES_URL = ENDPOINTS["water_reserves"].url
+GENRATION_MIX_15MIN_URL = ENDPOINTS["generation_mix_15min"].url
 PRODUCTION_TYPES = [
     "FOSSIL_OIL",
     "FOSSIL_GAS",
@@ -60,143 +52,6 @@ PRODUCTION_SUBTYPES = {
 }
 
 
-def request_actual_generation_per_type(
-        self: BaseApplication,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None) -> "dict":
-    """
-    Application function overwrite to request actual generation per type
-    """
-
-    verify_dates(start_date, end_date, 155, 1, "2014-12-15")
-
-    self.verify_token()
-    header_ = generate_header(self.oauth_token)
-
-    options_ = []
-
-    if start_date:
-        options_.append(prepare_date_request(start_date, end_date))
-
-    url_ = prepare_url_with_options(ACTUAL_GENERATION_PER_TYPE_URL, options_)
-
-    signal_response = requests.get(
-        url=url_,
-        headers=header_,
-        timeout=self.timeout)
-
-    verify_response_code(
-        code=signal_response.status_code,
-        api="actual_generation")
-
-    return signal_response.json()
-
-
-def request_actual_generation_per_unit(
-        self: BaseApplication,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None,
-        unit_eic_code: Optional[str] = None) -> "dict":
-    """
-    Application function overwrite to request actual generation per unit
-    """
-
-    verify_dates(start_date, end_date, 7, 1, "2011-12-13")
-
-    self.verify_token()
-    header_ = generate_header(self.oauth_token)
-
-    options_ = []
-
-    if start_date:
-        options_.append(prepare_date_request(start_date, end_date))
-    if unit_eic_code:
-        options_.append(f"unit_eic_code={unit_eic_code}")
-
-    url_ = prepare_url_with_options(ACTUAL_GENERATION_PER_UNIT_URL, options_)
-
-    signal_response = requests.get(
-        url=url_,
-        headers=header_,
-        timeout=self.timeout)
-
-    verify_response_code(
-        code=signal_response.status_code,
-        api="actual_generation")
-
-    return signal_response.json()
-
-
-def request_water_reserves(
-        self: BaseApplication,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None) -> "dict":
-    """
-    Application function overwrite to request water reserves
-    """
-
-    verify_dates(start_date, end_date, 366, 7, "2014-12-08")
-
-    self.verify_token()
-    header_ = generate_header(self.oauth_token)
-
-    options_ = []
-
-    if start_date:
-        options_.append(prepare_date_request(start_date, end_date))
-
-    url_ = prepare_url_with_options(WATER_RESERVES_URL, options_)
-
-    signal_response = requests.get(
-        url=url_,
-        headers=header_,
-        timeout=self.timeout)
-
-    verify_response_code(
-        code=signal_response.status_code,
-        api="actual_generation")
-
-    return signal_response.json()
-
-
-def request_generation_mix_15min(
-        self: BaseApplication,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None,
-        production_type: Optional[str] = None,
-        production_subtype: Optional[str] = None) -> "dict":
-    """
-    Application function overwrite to request
-    actual generation mix with 15min scale
-    """
-
-    verify_dates(start_date, end_date, 14, 1, "2017-01-01")
-    self.verify_token()
-    header_ = generate_header(self.oauth_token)
-
-    options_ = []
-
-    if start_date:
-        options_.append(prepare_date_request(start_date, end_date))
-    if production_type or production_subtype:
-        options_ += prepare_type_request(
-            production_type,
-            production_subtype)
-
-    url_ = prepare_url_with_options(GENRATION_MIX_15MIN_URL, options_)
-
-    signal_response = requests.get(
-        url=url_,
-        headers=header_,
-        timeout=self.timeout)
-
-    verify_response_code(
-        code=signal_response.status_code,
-        api="actual_generation")
-
-    return signal_response.json()
-
-
 def prepare_type_request(
         production_type: Optional[str] = None,
         production_subtype: Optional[str] = None) -> "list[str]":
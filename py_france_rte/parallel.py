@@ -0,0 +1,123 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains utilities to run independent requests concurrently
+"""
+
+import collections
+import itertools
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator
+
+from py_france_rte.utils import is_int_instance
+
+
+def run_bounded(
+        tasks: "list[Callable[[], Any]]",
+        max_workers: int) -> "list[Any]":
+    """
+    run_bounded(
+            tasks: "list[Callable[[], Any]]",
+            max_workers: int) -> "list[Any]"
+
+    Run tasks in a pool of at most max_workers threads.
+    As soon as a task fails, tasks not started yet are cancelled
+    and the error is raised once running tasks are over.
+
+    Parameters
+    ----------
+    tasks : list[Callable[[], Any]]
+        The tasks to run, taking no parameter
+    max_workers : int
+        The maximum number of tasks running at the same time,
+        1 runs all tasks sequentially in the calling thread
+
+    Returns
+    -------
+    list[Any]
+        The results of the tasks, in the order of tasks
+
+    Raises
+    ------
+    ValueError
+        If max_workers is lower than 1
+    Exception
+        The error raised by the first failing task
+    """
+    is_int_instance(max_workers, "max_workers")
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, is {max_workers}")
+
+    if max_workers == 1 or len(tasks) <= 1:
+        return [task_() for task_ in tasks]
+
+    executor_ = ThreadPoolExecutor(max_workers=min(max_workers, len(tasks)))
+    try:
+        futures_ = [executor_.submit(task_) for task_ in tasks]
+        (done_, _) = wait(futures_, return_when=FIRST_EXCEPTION)
+        for future_ in futures_:
+            if future_ in done_ and future_.exception() is not None:
+                raise future_.exception()
+        return [future_.result() for future_ in futures_]
+    finally:
+        executor_.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_prefetched(
+        tasks: "Iterable[Callable[[], Any]]",
+        depth: int) -> "Iterator[Any]":
+    """
+    iter_prefetched(
+            tasks: "Iterable[Callable[[], Any]]",
+            depth: int) -> "Iterator[Any]"
+
+    Lazily run tasks and yield their results in order, while the next
+    depth tasks run in background threads. At most depth results wait
+    to be consumed at any time. Closing the iterator cancels tasks
+    not started yet.
+
+    Parameters
+    ----------
+    tasks : Iterable[Callable[[], Any]]
+        The tasks to run, taking no parameter
+    depth : int
+        The number of tasks run ahead of the consumer,
+        0 runs each task in the calling thread when its result is needed
+
+    Yields
+    ------
+    Any
+        The result of each task, in the order of tasks
+
+    Raises
+    ------
+    ValueError
+        If depth is negative
+    Exception
+        The error raised by the first failing task, once the results
+        of previous tasks are consumed
+    """
+    is_int_instance(depth, "depth")
+    if depth < 0:
+        raise ValueError(f"depth must be positive, is {depth}")
+
+    if depth == 0:
+        for task_ in tasks:
+            yield task_()
+        return
+
+    tasks_ = iter(tasks)
+    pending_ = collections.deque()
+    executor_ = ThreadPoolExecutor(max_workers=depth)
+    try:
+        for task_ in itertools.islice(tasks_, depth):
+            pending_.append(executor_.submit(task_))
+        while pending_:
+            result_ = pending_.popleft().result()
+            # Keep depth tasks running while the consumer handles result_
+            for task_ in itertools.islice(tasks_, 1):
+                pending_.append(executor_.submit(task_))
+            yield result_
+    finally:
+        executor_.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,79 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the normalization of API responses into flat records,
+used by the ingestion pipeline of Application
+"""
+
+import datetime
+from typing import Iterator, Optional
+
+def _series_fields(series: dict) -> dict:
+    """
+    Flatten the fields of a series but its dates and values,
+    exemple : {"unit": {"eic_code": "..."}} gives {"unit_eic_code": "..."}
+    """
+    fields_ = {}
+    for (key_, value_) in series.items():
+        if key_ in ("start_date", "end_date", "values"):
+            continue
+        if isinstance(value_, dict):
+            for (sub_key_, sub_value_) in value_.items():
+                fields_[f"{key_}_{sub_key_}"] = sub_value_
+        else:
+            fields_[key_] = value_
+    return fields_
+
+
+def normalize_response(
+        endpoint: str,
+        response: dict,
+        emit_from: Optional[str] = None) -> Iterator[dict]:
+    """
+    normalize_response(
+            endpoint: str,
+            response: dict,
+            emit_from: Optional[str] = None) -> Iterator[dict]
+
+    Flatten a response into one record per value, holding the fields
+    of its series, exemple : {"endpoint": "actual_generation_per_unit",
+    "unit_eic_code": "17W100P100P0345B", "unit_production_type": "NUCLEAR",
+    "start_date": "2020-01-01T00:00:00+01:00",
+    "end_date": "2020-01-01T01:00:00+01:00",
+    "value": 1268, "updated_date": "2020-01-01T01:00:00+01:00"}
+
+    Parameters
+    ----------
+    endpoint : str
+        The name of the requested endpoint,
+        exemple : "actual_generation_per_unit"
+    response : dict
+        A response of an Actual Generation request function
+    emit_from : str, optional
+        Values starting before this date are skipped, to drop values
+        already emitted by an overlapping window. Must be at format
+        "YYYY-MM-DDThh:mm:sszzzzzz", exemple : "2015-06-08T00:00:00+02:00"
+
+    Yields
+    ------
+    dict
+        A record for each value of each series, in order
+    """
+    emit_from_ = (datetime.datetime.fromisoformat(emit_from)
+                  if emit_from is not None else None)
+
+    for content_ in response.values():
+        if not isinstance(content_, list):
+            continue
+        for series_ in content_:
+            fields_ = _series_fields(series_)
+            fields_["endpoint"] = endpoint
+            for value_ in series_.get("values", []):
+                if (emit_from_ is not None
+                        and datetime.datetime.fromisoformat(
+                            value_["start_date"]) < emit_from_):
+                    continue
+                record_ = dict(fields_)
+                record_.update(value_)
+                yield record_
@@ -0,0 +1,143 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the TokenBucket class, a client-side rate limiter
+keeping requests within the quotas of RTE APIs
+"""
+
+import threading
+import time
+from typing import Optional
+
+from py_france_rte.errors import RateLimitError
+from py_france_rte.utils import is_int_instance, is_number_instance
+
+
+class TokenBucket():
+    """
+    TokenBucket(rate: float, capacity: int = 1) -> TokenBucket:
+
+    Thread-safe token bucket rate limiter: up to capacity requests can be
+    sent at once, then requests are spread at rate requests per second.
+    A bucket can be shared by several applications, threads, and event
+    loops. Waiting callers are served in order of arrival.
+
+    Parameters
+    ----------
+    rate : float
+        The number of requests allowed per second,
+        exemple : 1 / 900 for one request every 15 minutes
+    capacity : int, default: 1
+        The maximum number of requests sent in a burst
+
+    Returns
+    -------
+    TokenBucket
+        An instance of TokenBucket class
+
+    Raises
+    ------
+    TypeError
+        If a parameter is of an unexpected type
+    ValueError
+        If rate or capacity is not positive
+    """
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+
+        is_number_instance(rate, "rate")
+        is_int_instance(capacity, "capacity")
+        if rate <= 0 or capacity < 1:
+            raise ValueError(
+                f"rate ({rate}) and capacity ({capacity}) must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, block: bool, timeout: Optional[float]) -> float:
+        """
+        Reserve a token, returns the time to wait before it is available
+        """
+
+        with self._lock:
+            now_ = time.monotonic()
+            self._tokens = min(
+                float(self.capacity),
+                self._tokens + (now_ - self._last_refill) * self.rate)
+            self._last_refill = now_
+
+            wait_ = max(0., (1. - self._tokens) / self.rate)
+            if wait_ > 0. and (
+                    not block or (timeout is not None and wait_ > timeout)):
+                raise RateLimitError(
+                    f"Rate limit reached, next request "
+                    f"allowed in {wait_:.3f}s")
+            self._tokens -= 1.
+            return wait_
+
+    def acquire(
+            self,
+            block: bool = True,
+            timeout: Optional[float] = None) -> None:
+        """
+        acquire(
+                self,
+                block: bool = True,
+                timeout: Optional[float] = None) -> None
+
+        Wait until a request can be sent
+
+        Parameters
+        ----------
+        block : bool, default: True
+            Wait for the request to be allowed, or fail at once
+        timeout : float, optional
+            The maximum time to wait in seconds
+
+        Raises
+        ------
+        RateLimitError
+            If the request is not allowed without waiting and block is
+            False, or if it would wait longer than timeout
+        """
+
+        wait_ = self._reserve(block, timeout)
+        if wait_ > 0.:
+            time.sleep(wait_)
+
+    async def acquire_async(
+            self,
+            block: bool = True,
+            timeout: Optional[float] = None) -> None:
+        """
+        acquire_async(
+                self,
+                block: bool = True,
+                timeout: Optional[float] = None) -> None
+
+        Wait until a request can be sent, without blocking the event loop
+
+        Parameters
+        ----------
+        block : bool, default: True
+            Wait for the request to be allowed, or fail at once
+        timeout : float, optional
+            The maximum time to wait in seconds
+
+        Raises
+        ------
+        RateLimitError
+            If the request is not allowed without waiting and block is
+            False, or if it would wait longer than timeout
+        """
+
+        # Imported here, asyncio being slow to import for sync applications
+        import asyncio
+
+        wait_ = self._reserve(block, timeout)
+        if wait_ > 0.:
+            await asyncio.sleep(wait_)
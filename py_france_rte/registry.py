@@ -0,0 +1,223 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the registry of all endpoints of supported APIs,
+declaring their url, date limits and filters. Application request
+functions are resolved from it on first access, API modules being
+imported only when their filters are used.
+"""
+
+import importlib
+from typing import Any, Optional
+
+from py_france_rte.utils import (BASE_OPEN_API_URL, prepare_date_request,
+                                 prepare_url_with_options, verify_dates)
+
+ACTUAL_GENERATION_URL = BASE_OPEN_API_URL + "actual_generation/v1/"
+
+
+class Endpoint():
+    """
+    Endpoint(
+            name: str,
+            api: str,
+            url: str,
+            date_limits: Optional["tuple[int, int, str]"] = None,
+            filters: "tuple[str, ...]" = (),
+            prepare_filters: Optional[str] = None,
+            memory_cached: bool = False) -> Endpoint:
+
+    Declaration of an endpoint, requested by the request_<name> and
+    stream_<name> functions of applications subscribed to its API
+
+    Parameters
+    ----------
+    name : str
+        The name of the endpoint, exemple : "water_reserves"
+    api : str
+        The API of the endpoint, exemple : "Actual Generation"
+    url : str
+        The url of the endpoint, without options
+    date_limits : tuple[int, int, str], optional
+        The (max_days, min_days, min_date) accepted by the endpoint,
+        None if the endpoint takes no dates
+    filters : tuple[str, ...], default: ()
+        The names of the filters of the endpoint, in the order of
+        the parameters of its functions, exemple : ("unit_eic_code",)
+    prepare_filters : str, optional
+        The "module:function" verifying filters and returning url
+        options, imported on first use. Filters are sent as given if None.
+    memory_cached : bool, default: False
+        Read responses through the ecowatt_cache of the application
+
+    Returns
+    -------
+    Endpoint
+        An instance of Endpoint class
+    """
+
+    __slots__ = ("name", "api", "url", "date_limits", "filters",
+                 "prepare_filters", "memory_cached", "parameters",
+                 "_prepare")
+
+    def __init__(
+            self,
+            name: str,
+            api: str,
+            url: str,
+            date_limits: Optional["tuple[int, int, str]"] = None,
+            filters: "tuple[str, ...]" = (),
+            prepare_filters: Optional[str] = None,
+            memory_cached: bool = False) -> None:
+        self.name = name
+        self.api = api
+        self.url = url
+        self.date_limits = date_limits
+        self.filters = filters
+        self.prepare_filters = prepare_filters
+        self.memory_cached = memory_cached
+        # Parameters of request functions, in order
+        self.parameters = (("start_date", "end_date") if date_limits else ()) \
+            + filters + ("retry_policy",)
+        self._prepare = None
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.name!r}, {self.api!r})"
+
+    def bind(self, args: tuple, kwargs: dict) -> "dict[str, Any]":
+        """
+        bind(self, args: tuple, kwargs: dict) -> "dict[str, Any]"
+
+        Match the arguments of a request function with its parameters
+
+        Parameters
+        ----------
+        args : tuple
+            The positional arguments
+        kwargs : dict
+            The keyword arguments
+
+        Returns
+        -------
+        dict[str, Any]
+            The value of each parameter, None if not given
+
+        Raises
+        ------
+        TypeError
+            If arguments do not match the parameters
+        """
+
+        if len(args) > len(self.parameters):
+            raise TypeError(
+                f"{self.name} takes at most {len(self.parameters)} "
+                f"arguments ({len(args)} given)")
+        arguments_ = dict.fromkeys(self.parameters)
+        arguments_.update(zip(self.parameters, args))
+        for (name_, value_) in kwargs.items():
+            if name_ not in arguments_:
+                raise TypeError(
+                    f"{self.name} got an unexpected keyword argument "
+                    f"'{name_}'")
+            if name_ in self.parameters[:len(args)]:
+                raise TypeError(
+                    f"{self.name} got multiple values for argument "
+                    f"'{name_}'")
+            arguments_[name_] = value_
+        return arguments_
+
+    def url_for(
+            self,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None,
+            **filters) -> str:
+        """
+        url_for(
+                self,
+                start_date: Optional[str] = None,
+                end_date: Optional[str] = None,
+                **filters) -> str
+
+        Verify parameters and prepare the request url
+
+        Parameters
+        ----------
+        start_date : str, optional
+            The start date of the request, at format
+            "YYYY-MM-DDThh:mm:sszzzzzz", exemple : "2015-06-08T00:00:00+02:00"
+        end_date : str, optional
+            The end date of the request, at format
+            "YYYY-MM-DDThh:mm:sszzzzzz", exemple : "2015-06-08T00:00:00+02:00"
+        **filters
+            The filters of the endpoint, None when not used
+
+        Returns
+        -------
+        str
+            The request url, with its options
+
+        Raises
+        ------
+        ValueError
+            If dates or filters are invalid
+        """
+
+        options_ = []
+
+        if self.date_limits:
+            verify_dates(start_date, end_date, *self.date_limits)
+            if start_date:
+                options_.append(prepare_date_request(start_date, end_date))
+
+        if any(filters.values()):
+            if self.prepare_filters is None:
+                options_ += [f"{name_}={value_}"
+                             for (name_, value_) in filters.items() if value_]
+            else:
+                if self._prepare is None:
+                    (module_, function_) = self.prepare_filters.split(":")
+                    self._prepare = getattr(
+                        importlib.import_module(module_), function_)
+                options_ += self._prepare(**filters)
+
+        return prepare_url_with_options(self.url, options_)
+
+
+ENDPOINTS = {endpoint_.name: endpoint_ for endpoint_ in (
+    # Ecowatt
+    Endpoint(
+        "ecowatt_signals",
+        "Ecowatt",
+        BASE_OPEN_API_URL + "ecowatt/v4/signals",
+        memory_cached=True),
+    # Actual Generation
+    Endpoint(
+        "actual_generation_per_type",
+        "Actual Generation",
+        ACTUAL_GENERATION_URL + "actual_generations_per_production_type",
+        (155, 1, "2014-12-15")),
+    Endpoint(
+        "actual_generation_per_unit",
+        "Actual Generation",
+        ACTUAL_GENERATION_URL + "actual_generations_per_unit",
+        (7, 1, "2011-12-13"),
+        ("unit_eic_code",)),
+    Endpoint(
+        "water_reserves",
+        "Actual Generation",
+        ACTUAL_GENERATION_URL + "water_reserves",
+        (366, 7, "2014-12-08")),
+    Endpoint(
+        "generation_mix_15min",
+        "Actual Generation",
+        ACTUAL_GENERATION_URL + "generation_mix_15min_time_scale",
+        (14, 1, "2017-01-01"),
+        ("production_type", "production_subtype"),
+        "py_france_rte.modules.actual_generation:prepare_type_request"),
+)}
+
+# (max_days, min_days, min_date) accepted by each dated endpoint
+DATE_LIMITS = {name_: endpoint_.date_limits
+               for (name_, endpoint_) in ENDPOINTS.items()
+               if endpoint_.date_limits}
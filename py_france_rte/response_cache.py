@@ -0,0 +1,260 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the response caches, storing API responses
+by request url so that repeated requests cost no http request
+"""
+
+import abc
+import datetime
+import json
+import sqlite3
+import threading
+import zlib
+from time import time
+from typing import Optional
+
+from py_france_rte.utils import is_int_instance, is_str_instance
+
+
+class ResponseCache(abc.ABC):
+    """
+    ResponseCache(
+            immutable_after: int = 259200,
+            recent_ttl: int = 900) -> ResponseCache:
+
+    Abstract base class of response caches.
+    Responses of windows ending more than immutable_after seconds ago
+    never change and never expire, other responses expire after
+    recent_ttl seconds.
+
+    Parameters
+    ----------
+    immutable_after : int, default: 259200
+        The age in seconds after which data is considered final,
+        defaults to 3 days
+    recent_ttl : int, default: 900
+        The time to live in seconds of responses for recent
+        or undated windows, defaults to 15 minutes
+
+    Returns
+    -------
+    ResponseCache
+        An instance of ResponseCache class
+
+    Raises
+    ------
+    TypeError
+        If a parameter is of an unexpected type
+    """
+
+    def __init__(
+            self,
+            immutable_after: int = 259200,
+            recent_ttl: int = 900) -> None:
+
+        is_int_instance(immutable_after, "immutable_after")
+        is_int_instance(recent_ttl, "recent_ttl")
+
+        self.immutable_after = immutable_after
+        self.recent_ttl = recent_ttl
+
+    def expire_time(self, end_date: Optional[str] = None) -> Optional[float]:
+        """
+        expire_time(self, end_date: Optional[str] = None) -> Optional[float]
+
+        Compute the expiration timestamp of a response stored now
+
+        Parameters
+        ----------
+        end_date : str, optional
+            The end date of the requested window if any,
+            at format "YYYY-MM-DDThh:mm:sszzzzzz"
+
+        Returns
+        -------
+        float or None
+            The expiration timestamp, None if the response never expires
+        """
+
+        now_ = time()
+        if end_date:
+            end_ = datetime.datetime.fromisoformat(end_date).timestamp()
+            if end_ < now_ - self.immutable_after:
+                return None
+        return now_ + self.recent_ttl
+
+    @abc.abstractmethod
+    def get(self, url: str) -> Optional[dict]:
+        """
+        get(self, url: str) -> Optional[dict]
+
+        Get the stored response of a request url
+
+        Parameters
+        ----------
+        url : str
+            The request url, with its options
+
+        Returns
+        -------
+        dict or None
+            The stored response, None if missing or expired
+        """
+
+    @abc.abstractmethod
+    def set(self, url: str, content: dict,
+            end_date: Optional[str] = None) -> None:
+        """
+        set(self, url: str, content: dict,
+            end_date: Optional[str] = None) -> None
+
+        Store the response of a request url
+
+        Parameters
+        ----------
+        url : str
+            The request url, with its options
+        content : dict
+            The decoded response
+        end_date : str, optional
+            The end date of the requested window if any,
+            at format "YYYY-MM-DDThh:mm:sszzzzzz"
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all stored responses
+        """
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    SQLiteResponseCache(
+            path: str,
+            max_size: int = 268435456,
+            immutable_after: int = 259200,
+            recent_ttl: int = 900) -> SQLiteResponseCache:
+
+    Response cache stored as zlib compressed json in a SQLite database,
+    which can be shared by several processes. Once compressed responses
+    exceed max_size bytes, least recently used responses are removed.
+
+    Parameters
+    ----------
+    path : str
+        The path of the SQLite database, ":memory:" for a cache
+        kept in memory
+    max_size : int, default: 268435456
+        The maximum size of stored compressed responses in bytes,
+        defaults to 256 MiB
+    immutable_after : int, default: 259200
+        The age in seconds after which data is considered final,
+        defaults to 3 days
+    recent_ttl : int, default: 900
+        The time to live in seconds of responses for recent
+        or undated windows, defaults to 15 minutes
+
+    Returns
+    -------
+    SQLiteResponseCache
+        An instance of SQLiteResponseCache class
+
+    Raises
+    ------
+    TypeError
+        If a parameter is of an unexpected type
+    """
+
+    def __init__(
+            self,
+            path: str,
+            max_size: int = 268435456,
+            immutable_after: int = 259200,
+            recent_ttl: int = 900) -> None:
+        super().__init__(immutable_after, recent_ttl)
+
+        is_str_instance(path, "path")
+        is_int_instance(max_size, "max_size")
+
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, "
+                "body BLOB NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "expire REAL, "
+                "last_access REAL NOT NULL)")
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_access "
+                "ON responses (last_access)")
+
+    def get(self, url: str) -> Optional[dict]:
+        now_ = time()
+        with self._lock, self._connection:
+            row_ = self._connection.execute(
+                "SELECT body, expire FROM responses WHERE url = ?",
+                (url,)).fetchone()
+            if row_ is None:
+                return None
+            (body_, expire_) = row_
+            if expire_ is not None and expire_ <= now_:
+                self._connection.execute(
+                    "DELETE FROM responses WHERE url = ?", (url,))
+                return None
+            self._connection.execute(
+                "UPDATE responses SET last_access = ? WHERE url = ?",
+                (now_, url))
+        return json.loads(zlib.decompress(body_))
+
+    def set(self, url: str, content: dict,
+            end_date: Optional[str] = None) -> None:
+        body_ = zlib.compress(
+            json.dumps(content, separators=(",", ":")).encode("utf-8"))
+        if len(body_) > self.max_size:
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, body, size, expire, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, body_, len(body_), self.expire_time(end_date), time()))
+            self._evict()
+
+    def _evict(self) -> None:
+        """
+        Remove least recently used responses until stored responses
+        fit in max_size, the lock being held by the caller
+        """
+
+        (total_size_,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total_size_ <= self.max_size:
+            return
+
+        evicted_ = []
+        for (url_, size_) in self._connection.execute(
+                "SELECT url, size FROM responses ORDER BY last_access"):
+            if total_size_ <= self.max_size:
+                break
+            evicted_.append((url_,))
+            total_size_ -= size_
+        self._connection.executemany(
+            "DELETE FROM responses WHERE url = ?", evicted_)
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """
+        Close the database
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,172 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the RetryPolicy class, deciding when and after
+which delay a failed request is sent again
+"""
+
+import datetime
+import email.utils
+import random
+from time import time
+from typing import Optional
+
+from py_france_rte.utils import is_int_instance, is_number_instance
+
+RETRY_STATUSES = (408, 429, 500, 503, 509)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    parse_retry_after(value: Optional[str]) -> Optional[float]
+
+    Parse the Retry-After header of a response
+
+    Parameters
+    ----------
+    value : str, optional
+        The header value, a number of seconds or a http date
+
+    Returns
+    -------
+    float or None
+        The number of seconds to wait, None if missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0., float(value))
+    except ValueError:
+        pass
+    try:
+        date_ = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date_.tzinfo is None:
+        date_ = date_.replace(tzinfo=datetime.timezone.utc)
+    return max(0., date_.timestamp() - time())
+
+
+class RetryPolicy():
+    """
+    RetryPolicy(
+            max_attempts: int = 4,
+            backoff_factor: float = 0.5,
+            max_backoff: float = 60.,
+            retry_statuses: "tuple[int, ...]" = RETRY_STATUSES,
+            retry_on_timeout: bool = True) -> RetryPolicy:
+
+    Policy to send again requests failing with a transient error.
+    The n-th retry waits a random time between 0 and
+    backoff_factor * 2 ** (n - 1) seconds, at most max_backoff,
+    or longer if the server asks so with a Retry-After header.
+
+    Parameters
+    ----------
+    max_attempts : int, default: 4
+        The maximum number of times a request is sent
+    backoff_factor : float, default: 0.5
+        The base delay of retries in seconds
+    max_backoff : float, default: 60.
+        The maximum delay between two attempts in seconds,
+        unless required by a Retry-After header
+    retry_statuses : tuple[int, ...], default: (408, 429, 500, 503, 509)
+        The response codes of transient errors
+    retry_on_timeout : bool, default: True
+        Retry requests failing with a connection error or a timeout
+
+    Returns
+    -------
+    RetryPolicy
+        An instance of RetryPolicy class
+
+    Raises
+    ------
+    TypeError
+        If a parameter is of an unexpected type
+    ValueError
+        If max_attempts is lower than 1
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = 4,
+            backoff_factor: float = 0.5,
+            max_backoff: float = 60.,
+            retry_statuses: "tuple[int, ...]" = RETRY_STATUSES,
+            retry_on_timeout: bool = True) -> None:
+
+        is_int_instance(max_attempts, "max_attempts")
+        is_number_instance(backoff_factor, "backoff_factor")
+        is_number_instance(max_backoff, "max_backoff")
+        if max_attempts < 1:
+            raise ValueError(
+                f"max_attempts must be at least 1, is {max_attempts}")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_on_timeout = retry_on_timeout
+
+    def should_retry(
+            self,
+            attempt: int,
+            code: Optional[int] = None) -> bool:
+        """
+        should_retry(
+                self,
+                attempt: int,
+                code: Optional[int] = None) -> bool
+
+        Decide if a failed request is sent again
+
+        Parameters
+        ----------
+        attempt : int
+            The number of times the request was already sent
+        code : int, optional
+            The response code, None for a connection error or a timeout
+
+        Returns
+        -------
+        bool
+            True if the request should be sent again
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if code is None:
+            return self.retry_on_timeout
+        return code in self.retry_statuses
+
+    def delay(
+            self,
+            attempt: int,
+            retry_after: Optional[float] = None) -> float:
+        """
+        delay(
+                self,
+                attempt: int,
+                retry_after: Optional[float] = None) -> float
+
+        Compute the time to wait before the next attempt
+
+        Parameters
+        ----------
+        attempt : int
+            The number of times the request was already sent
+        retry_after : float, optional
+            The delay asked by the server in seconds, if any
+
+        Returns
+        -------
+        float
+            The time to wait in seconds
+        """
+        backoff_ = random.uniform(0., min(
+            self.max_backoff,
+            self.backoff_factor * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            return max(retry_after, backoff_)
+        return backoff_
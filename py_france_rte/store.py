@@ -0,0 +1,348 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the SeriesStore class, a local columnar store of
+Actual Generation series, requiring numpy
+"""
+
+import datetime
+import json
+import os
+import re
+import tempfile
+from typing import Optional
+
+from py_france_rte.chunking import parse_date
+from py_france_rte.columnar import ColumnarSeries, to_columnar
+from py_france_rte.utils import (file_lock, is_str_instance, read_json,
+                                 write_json)
+
+try:
+    import numpy as np
+except ImportError as err:
+    raise ImportError(
+        "SeriesStore requires numpy, "
+        "install it with \"pip install numpy\"") from err
+
+# Values of a partition, stored as a single structured array so that
+# a partition is one contiguous memory-mapped file
+VALUE_DTYPE = np.dtype([
+    ("start", "<i8"),
+    ("end", "<i8"),
+    ("value", "<f8"),
+    ("updated", "<i8")])
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+# Partition files, other files like temporary ones are ignored
+_PARTITION_NAME = re.compile(r"(\d{4}-\d{2})\.npy")
+
+
+def series_name(metadata: dict) -> str:
+    """
+    series_name(metadata: dict) -> str
+
+    Name a series by the fields identifying it, exemple :
+    "HYDRO_PUMPED_STORAGE" for a production type, "17W100P100P0345B"
+    for a unit, "HYDRO__HYDRO_PUMPED_STORAGE" for a subtype
+
+    Parameters
+    ----------
+    metadata : dict
+        The metadata of a ColumnarSeries
+
+    Returns
+    -------
+    str
+        The name of the series, usable as a directory name
+    """
+    parts_ = []
+    for (key_, value_) in metadata.items():
+        if key_ in ("endpoint", "start_date", "end_date"):
+            continue
+        if isinstance(value_, dict):
+            # Units are identified by their EIC code alone
+            value_ = value_.get("eic_code", "__".join(
+                str(sub_value_) for (_, sub_value_)
+                in sorted(value_.items())))
+        parts_.append(str(value_))
+    return _UNSAFE_CHARS.sub("_", "__".join(parts_)) or "all"
+
+
+def _timestamp(date: str, name: str) -> int:
+    """
+    Parse a date into an epoch timestamp in seconds
+    """
+    return int(parse_date(date, name).timestamp())
+
+
+class SeriesStore():
+    """
+    SeriesStore(root: str) -> SeriesStore:
+
+    Local append-only store of Actual Generation series, in the directory
+    root/endpoint/series/YYYY-MM.npy. Each partition holds the values of
+    one series for one UTC month, sorted by start date, as a NumPy file
+    read through a memory map. Writing a window merges it into existing
+    partitions, values of a new window replacing stored ones with the
+    same start date, so that writing a window twice changes nothing.
+
+    Parameters
+    ----------
+    root : str
+        The directory of the store, created if needed
+
+    Returns
+    -------
+    SeriesStore
+        An instance of SeriesStore class
+
+    Raises
+    ------
+    TypeError
+        If a parameter is of an unexpected type
+    """
+
+    def __init__(self, root: str) -> None:
+
+        is_str_instance(root, "root")
+
+        self.root = root
+        self.lock_path = os.path.join(root, ".lock")
+        os.makedirs(root, exist_ok=True)
+
+    def _series_path(self, endpoint: str, name: str) -> str:
+        """
+        Directory of the partitions of a series
+        """
+
+        return os.path.join(self.root, endpoint, name)
+
+    def write(self, response: dict) -> int:
+        """
+        write(self, response: dict) -> int
+
+        Merge all series of a response into the store
+
+        Parameters
+        ----------
+        response : dict
+            A response of an Actual Generation request function,
+            or a merged response of request_chunked
+
+        Returns
+        -------
+        int
+            The number of values written
+        """
+
+        written_ = 0
+        with file_lock(self.lock_path):
+            for series_ in to_columnar(response):
+                written_ += self._write_series(series_)
+        return written_
+
+    def _write_series(self, series: ColumnarSeries) -> int:
+        """
+        Merge one series into its partitions, the lock being held
+        """
+
+        if len(series) == 0:
+            return 0
+
+        path_ = self._series_path(
+            series.metadata["endpoint"], series_name(series.metadata))
+        os.makedirs(path_, exist_ok=True)
+        # Dates of the written window do not describe stored values
+        metadata_ = {key_: value_ for (key_, value_)
+                     in series.metadata.items()
+                     if key_ not in ("start_date", "end_date")}
+        metadata_path_ = os.path.join(path_, "metadata.json")
+        if read_json(metadata_path_) != metadata_:
+            write_json(metadata_path_, metadata_, sort_keys=True)
+
+        values_ = np.empty(len(series), dtype=VALUE_DTYPE)
+        values_["start"] = series.start
+        values_["end"] = series.end
+        values_["value"] = series.values
+        values_["updated"] = series.updated
+
+        months_ = values_["start"].astype("datetime64[s]").astype(
+            "datetime64[M]")
+        for month_ in np.unique(months_):
+            partition_path_ = os.path.join(path_, f"{month_}.npy")
+            new_ = values_[months_ == month_]
+            if os.path.exists(partition_path_):
+                # New values first, so that np.unique keeps them
+                new_ = np.concatenate((new_, np.load(partition_path_)))
+            (_, first_) = np.unique(new_["start"], return_index=True)
+            self._save(partition_path_, new_[first_])
+
+        return len(series)
+
+    @staticmethod
+    def _save(path: str, values: "np.ndarray") -> None:
+        """
+        Atomically replace a partition
+        """
+
+        (fd_, temp_path_) = tempfile.mkstemp(
+            dir=os.path.dirname(path), suffix=".npy.tmp")
+        try:
+            with os.fdopen(fd_, "wb") as file_:
+                np.save(file_, values)
+            os.replace(temp_path_, path)
+        except BaseException:
+            os.unlink(temp_path_)
+            raise
+
+    def series(self, endpoint: Optional[str] = None) -> "list[tuple]":
+        """
+        series(self, endpoint: Optional[str] = None) -> "list[tuple]"
+
+        List the stored series
+
+        Parameters
+        ----------
+        endpoint : str, optional
+            Only list the series of this endpoint,
+            exemple : "actual_generations_per_production_type"
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The (endpoint, name) of each stored series
+        """
+
+        endpoints_ = [endpoint] if endpoint is not None else sorted(
+            entry_ for entry_ in os.listdir(self.root)
+            if os.path.isdir(os.path.join(self.root, entry_)))
+        return [(endpoint_, name_)
+                for endpoint_ in endpoints_
+                if os.path.isdir(os.path.join(self.root, endpoint_))
+                for name_ in sorted(os.listdir(
+                    os.path.join(self.root, endpoint_)))]
+
+    def read(
+            self,
+            endpoint: str,
+            name: str,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None) -> ColumnarSeries:
+        """
+        read(
+                self,
+                endpoint: str,
+                name: str,
+                start_date: Optional[str] = None,
+                end_date: Optional[str] = None) -> ColumnarSeries
+
+        Read the stored values of a series starting within a range,
+        without any request nor json decoding. Partitions are memory
+        mapped, values are only copied when the range spans several months.
+
+        Parameters
+        ----------
+        endpoint : str
+            The response key of the series,
+            exemple : "actual_generations_per_production_type"
+        name : str
+            The name of the series, exemple : "HYDRO_PUMPED_STORAGE"
+        start_date : str, optional
+            The earliest start date of values, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz", exemple : "2015-06-08T00:00:00+02:00"
+        end_date : str, optional
+            Values start before end_date, must be at format
+            "YYYY-MM-DDThh:mm:sszzzzzz", exemple : "2015-06-08T00:00:00+02:00"
+
+        Returns
+        -------
+        ColumnarSeries
+            The stored values, sorted by start date
+
+        Raises
+        ------
+        KeyError
+            If the series is not stored
+        """
+
+        path_ = self._series_path(endpoint, name)
+        if not os.path.isdir(path_):
+            raise KeyError(f"No stored series {name} of {endpoint}")
+        with open(os.path.join(path_, "metadata.json"), "r",
+                  encoding="utf-8") as file_:
+            metadata_ = json.load(file_)
+
+        start_ = _timestamp(start_date, "start_date") \
+            if start_date is not None else None
+        end_ = _timestamp(end_date, "end_date") \
+            if end_date is not None else None
+        first_month_ = np.datetime64(start_, "s").astype("datetime64[M]") \
+            if start_ is not None else None
+        last_month_ = np.datetime64(end_, "s").astype("datetime64[M]") \
+            if end_ is not None else None
+
+        parts_ = []
+        for file_name_ in sorted(os.listdir(path_)):
+            match_ = _PARTITION_NAME.fullmatch(file_name_)
+            if match_ is None:
+                continue
+            month_ = np.datetime64(match_.group(1), "M")
+            if (first_month_ is not None and month_ < first_month_
+                    or last_month_ is not None and month_ > last_month_):
+                continue
+            values_ = np.load(
+                os.path.join(path_, file_name_), mmap_mode="r")
+            first_ = 0 if start_ is None else np.searchsorted(
+                values_["start"], start_, side="left")
+            last_ = len(values_) if end_ is None else np.searchsorted(
+                values_["start"], end_, side="left")
+            parts_.append(values_[first_:last_])
+
+        if not parts_:
+            values_ = np.empty(0, dtype=VALUE_DTYPE)
+        elif len(parts_) == 1:
+            values_ = parts_[0]
+        else:
+            values_ = np.concatenate(parts_)
+
+        return ColumnarSeries(
+            metadata_,
+            values_["start"],
+            values_["end"],
+            values_["value"],
+            values_["updated"])
+
+    def read_last(
+            self,
+            endpoint: str,
+            name: str,
+            days: int) -> ColumnarSeries:
+        """
+        read_last(self, endpoint: str, name: str, days: int) -> ColumnarSeries
+
+        Read the stored values of a series over the last days
+
+        Parameters
+        ----------
+        endpoint : str
+            The response key of the series,
+            exemple : "actual_generations_per_production_type"
+        name : str
+            The name of the series, exemple : "HYDRO_PUMPED_STORAGE"
+        days : int
+            The number of days to read, exemple : 730 for two years
+
+        Returns
+        -------
+        ColumnarSeries
+            The stored values, sorted by start date
+        """
+
+        start_ = datetime.datetime.now(datetime.timezone.utc) \
+            - datetime.timedelta(days=days)
+        return self.read(
+            endpoint,
+            name,
+            start_.replace(microsecond=0).isoformat())
@@ -0,0 +1,152 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the incremental decoding of API responses,
+so that large responses are never fully held in memory
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACES = " \t\n\r"
+_DECODER = json.JSONDecoder()
+
+
+class _Buffer():
+    """
+    Text decoded from a stream of bytes, read on demand
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.position = 0
+        self.exhausted = False
+
+    def read_more(self, minimum: int = 1) -> None:
+        """
+        Read at least minimum more characters, unless the stream ends
+        """
+
+        # Drop already decoded text to keep the buffer small
+        self.text = self.text[self.position:]
+        self.position = 0
+
+        target_ = len(self.text) + minimum
+        parts_ = [self.text]
+        length_ = len(self.text)
+        while length_ < target_:
+            chunk_ = next(self._chunks, None)
+            if chunk_ is None:
+                parts_.append(self._decoder.decode(b"", final=True))
+                self.exhausted = True
+                break
+            part_ = self._decoder.decode(chunk_)
+            parts_.append(part_)
+            length_ += len(part_)
+        self.text = "".join(parts_)
+
+    def next_char(self) -> str:
+        """
+        Skip whitespaces and return the next character without consuming it,
+        an empty string at the end of the stream
+        """
+
+        while True:
+            while (self.position < len(self.text)
+                   and self.text[self.position] in _WHITESPACES):
+                self.position += 1
+            if self.position < len(self.text):
+                return self.text[self.position]
+            if self.exhausted:
+                return ""
+            self.read_more()
+
+    def expect(self, chars: str) -> str:
+        """
+        Consume the next character, which must be one of chars
+        """
+
+        char_ = self.next_char()
+        if char_ == "" or char_ not in chars:
+            raise ValueError(
+                f"Invalid json response, expected one of {chars!r} "
+                f"and got {char_!r}")
+        self.position += 1
+        return char_
+
+    def decode_value(self) -> Any:
+        """
+        Decode the next json value, reading as much as needed
+        """
+
+        self.next_char()
+        while True:
+            try:
+                (value_, end_) = _DECODER.raw_decode(self.text, self.position)
+            except json.JSONDecodeError:
+                if self.exhausted:
+                    raise
+            else:
+                # A number may continue in the next chunk
+                if end_ < len(self.text) or self.exhausted:
+                    self.position = end_
+                    return value_
+            # Double the buffer so that decoding stays linear
+            self.read_more(max(len(self.text) - self.position, 65536))
+
+
+def iter_json_items(chunks: Iterable[bytes]) -> Iterator["tuple[str, Any]"]:
+    """
+    iter_json_items(chunks: Iterable[bytes]) -> Iterator["tuple[str, Any]"]
+
+    Incrementally decode a json object made of lists, exemple :
+    {"actual_generations_per_unit": [{...}, {...}]}, yielding
+    list items one at a time. Memory use is bounded by the largest item.
+    Values of the object which are not lists are ignored.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        The utf-8 encoded json document, in chunks of any size
+
+    Yields
+    ------
+    tuple[str, Any]
+        The key of the list and one of its decoded items
+
+    Raises
+    ------
+    ValueError
+        If the document is not a valid json object
+    """
+
+    buffer_ = _Buffer(chunks)
+
+    buffer_.expect("{")
+    if buffer_.next_char() == "}":
+        return
+
+    while True:
+        key_ = buffer_.decode_value()
+        if not isinstance(key_, str):
+            raise ValueError("Invalid json response, expected a key")
+        buffer_.expect(":")
+
+        if buffer_.next_char() == "[":
+            buffer_.expect("[")
+            if buffer_.next_char() == "]":
+                buffer_.expect("]")
+            else:
+                while True:
+                    yield (key_, buffer_.decode_value())
+                    if buffer_.expect(",]") == "]":
+                        break
+        else:
+            buffer_.decode_value()
+
+        if buffer_.expect(",}") == "}":
+            return
@@ -0,0 +1,307 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the WatermarkStore class, an on-disk record of the
+data already ingested, used by incremental requests
+"""
+
+import datetime
+from typing import Optional
+from urllib.parse import urlencode
+
+from py_france_rte.utils import (file_lock, is_str_instance, read_json,
+                                 write_json)
+
+
+def watermark_key(endpoint: str, options: Optional[dict] = None) -> str:
+    """
+    watermark_key(endpoint: str, options: Optional[dict] = None) -> str
+
+    Identify the data of an endpoint requested with some options
+
+    Parameters
+    ----------
+    endpoint : str
+        The name of the endpoint, exemple : "actual_generation_per_unit"
+    options : dict, optional
+        The other parameters of the request,
+        exemple : {"unit_eic_code": "17W100P100P0345B"}
+
+    Returns
+    -------
+    str
+        The key, exemple :
+        "actual_generation_per_unit?unit_eic_code=17W100P100P0345B"
+    """
+    is_str_instance(endpoint, "endpoint")
+    options_ = sorted((key_, value_) for (key_, value_)
+                      in (options or {}).items() if value_ is not None)
+    if not options_:
+        return endpoint
+    return f"{endpoint}?{urlencode(options_)}"
+
+
+def series_identity(series: dict) -> str:
+    """
+    series_identity(series: dict) -> str
+
+    Identify a series among the series of its endpoint
+
+    Parameters
+    ----------
+    series : dict
+        A series of an Actual Generation response
+
+    Returns
+    -------
+    str
+        The EIC code of its unit, or its production type and subtype,
+        exemple : "HYDRO/HYDRO_PUMPED_STORAGE", "" if the series has
+        none of them, like the only series of water reserves
+    """
+    unit_ = series.get("unit")
+    if isinstance(unit_, dict) and unit_.get("eic_code"):
+        return unit_["eic_code"]
+    return "/".join(series[field_]
+                    for field_ in ("production_type", "production_subtype")
+                    if series.get(field_))
+
+
+def _later(date: str, other: Optional[str]) -> bool:
+    """
+    Whether a date is later than another one, compared as datetimes
+    whatever their offsets, any date being later than None
+    """
+    return other is None or datetime.datetime.fromisoformat(date) \
+        > datetime.datetime.fromisoformat(other)
+
+
+def latest_dates(response: dict) -> "dict[str, dict[str, str]]":
+    """
+    latest_dates(response: dict) -> "dict[str, dict[str, str]]"
+
+    Find the latest end date and updated date of the values of each
+    series of a response
+
+    Parameters
+    ----------
+    response : dict
+        A response of an Actual Generation request function
+
+    Returns
+    -------
+    dict[str, dict[str, str]]
+        The latest "end_date" and "updated_date" by series_identity,
+        exemple : {"17W100P100P0345B": {
+        "end_date": "2020-01-01T00:00:00+01:00",
+        "updated_date": "2020-01-01T01:00:00+01:00"}}, "updated_date"
+        being left out when no value has one and series without any
+        value being left out
+    """
+    latest_ = {}
+
+    for content_ in response.values():
+        if not isinstance(content_, list):
+            continue
+        for series_ in content_:
+            identity_ = series_identity(series_)
+            for value_ in series_.get("values", []):
+                dates_ = latest_.setdefault(identity_, {})
+                for field_ in ("end_date", "updated_date"):
+                    if value_.get(field_) \
+                            and _later(value_[field_], dates_.get(field_)):
+                        dates_[field_] = value_[field_]
+
+    return latest_
+
+
+def drop_values_before(
+        response: dict,
+        date: str,
+        series_watermarks: Optional["dict[str, dict[str, str]]"] = None) \
+        -> dict:
+    """
+    drop_values_before(
+            response: dict,
+            date: str,
+            series_watermarks: Optional["dict[str, dict[str, str]]"] = None)
+            -> dict
+
+    Copy a response without the values starting before a date, unless
+    they were updated since the watermark of their series
+
+    Parameters
+    ----------
+    response : dict
+        A response of an Actual Generation request function
+    date : str
+        The date of the first value kept, at format
+        "YYYY-MM-DDThh:mm:sszzzzzz", exemple : "2015-06-08T00:00:00+02:00"
+    series_watermarks : dict[str, dict[str, str]], optional
+        The watermarks of some series by series_identity, as returned by
+        latest_dates. Their "end_date" overrides date for these series,
+        and values starting before it are still kept when their
+        updated_date is later than the "updated_date" of the watermark.
+
+    Returns
+    -------
+    dict
+        The response holding only new or revised values
+    """
+    date_ = datetime.datetime.fromisoformat(date)
+    series_watermarks_ = {}
+    for (identity_, watermark_) in (series_watermarks or {}).items():
+        series_watermarks_[identity_] = tuple(
+            datetime.datetime.fromisoformat(watermark_[field_])
+            if watermark_.get(field_) else None
+            for field_ in ("end_date", "updated_date"))
+    filtered_ = {}
+
+    for (key_, content_) in response.items():
+        if not isinstance(content_, list):
+            filtered_[key_] = content_
+            continue
+        filtered_[key_] = []
+        for series_ in content_:
+            (first_, updated_) = series_watermarks_.get(
+                series_identity(series_), (None, None))
+            first_ = first_ or date_
+            filtered_[key_].append(dict(series_, values=[
+                value_ for value_ in series_.get("values", [])
+                if datetime.datetime.fromisoformat(
+                    value_["start_date"]) >= first_
+                or updated_ is not None and value_.get("updated_date")
+                and datetime.datetime.fromisoformat(
+                    value_["updated_date"]) > updated_]))
+
+    return filtered_
+
+
+class WatermarkStore():
+    """
+    WatermarkStore(path: str) -> WatermarkStore:
+
+    On-disk record of the end date and updated date of the latest values
+    already ingested of each series, per endpoint and request options.
+    Reads and writes are protected by a lock file, so that it can be
+    shared by scheduled jobs running at the same time.
+
+    Parameters
+    ----------
+    path : str
+        The path of the json file holding the watermarks,
+        the lock file is the same path suffixed by ".lock"
+
+    Returns
+    -------
+    WatermarkStore
+        An instance of WatermarkStore class
+
+    Raises
+    ------
+    TypeError
+        If a parameter is of an unexpected type
+    """
+
+    def __init__(self, path: str) -> None:
+
+        is_str_instance(path, "path")
+
+        self.path = path
+        self.lock_path = path + ".lock"
+
+    def _read(self) -> "dict":
+        """
+        Read all watermarks, the lock being held by the caller
+        """
+
+        return read_json(self.path)
+
+    def _write(self, watermarks: "dict") -> None:
+        """
+        Atomically replace all watermarks, the lock being held by the caller
+        """
+
+        write_json(self.path, watermarks, indent=2, sort_keys=True)
+
+    def get(self, key: str) -> "Optional[dict[str, dict[str, str]]]":
+        """
+        get(self, key: str) -> "Optional[dict[str, dict[str, str]]]"
+
+        Get the watermarks of the series of some data
+
+        Parameters
+        ----------
+        key : str
+            The key of the data, as built by watermark_key
+
+        Returns
+        -------
+        dict[str, dict[str, str]] or None
+            The end date and updated date of the latest ingested values
+            of each series, by series_identity, exemple :
+            {"17W100P100P0345B": {"end_date": "2020-01-01T00:00:00+01:00",
+            "updated_date": "2020-01-01T01:00:00+01:00"}},
+            None if nothing was ingested
+        """
+
+        is_str_instance(key, "key")
+
+        with file_lock(self.lock_path, exclusive=False):
+            return self._read().get(key)
+
+    def advance(
+            self,
+            key: str,
+            dates: "dict[str, dict[str, str]]") -> None:
+        """
+        advance(self, key: str, dates: "dict[str, dict[str, str]]") -> None
+
+        Move the watermarks of series of some data forward,
+        dates earlier than the recorded ones are ignored
+
+        Parameters
+        ----------
+        key : str
+            The key of the data, as built by watermark_key
+        dates : dict[str, dict[str, str]]
+            The "end_date" and "updated_date" of the latest ingested
+            values of each series, by series_identity,
+            exemple : the result of latest_dates
+        """
+
+        is_str_instance(key, "key")
+
+        with file_lock(self.lock_path):
+            watermarks_ = self._read()
+            watermark_ = dict(watermarks_.get(key, {}))
+            for (identity_, dates_) in dates.items():
+                series_ = dict(watermark_.get(identity_, {}))
+                for (field_, date_) in dates_.items():
+                    is_str_instance(date_, field_)
+                    if _later(date_, series_.get(field_)):
+                        series_[field_] = date_
+                watermark_[identity_] = series_
+            watermarks_[key] = watermark_
+            self._write(watermarks_)
+
+    def clear(self, key: Optional[str] = None) -> None:
+        """
+        clear(self, key: Optional[str] = None) -> None
+
+        Forget the watermark of some data, or all watermarks
+
+        Parameters
+        ----------
+        key : str, optional
+            The key of the data, defaults to all data
+        """
+
+        with file_lock(self.lock_path):
+            watermarks_ = self._read()
+            if key is None:
+                watermarks_ = {}
+            else:
+                watermarks_.pop(key, None)
+            self._write(watermarks_)
@@ -0,0 +1,147 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the TokenCache class, an on-disk oauth token store
+shared by all processes using the same application identifiers
+"""
+
+from time import time
+from typing import Callable, Optional
+
+from py_france_rte.utils import (file_lock, is_int_instance, is_str_instance,
+                                 read_json, write_json)
+
+
+class TokenCache():
+    """
+    TokenCache(path: str) -> TokenCache:
+
+    On-disk store of oauth tokens, keyed by application client id.
+    Reads and writes are protected by a lock file, so that processes
+    sharing the store never request a token another one already got.
+
+    Parameters
+    ----------
+    path : str
+        The path of the json file holding the tokens,
+        the lock file is the same path suffixed by ".lock"
+
+    Returns
+    -------
+    TokenCache
+        An instance of TokenCache class
+
+    Raises
+    ------
+    TypeError
+        If a parameter is of an unexpected type
+    """
+
+    def __init__(self, path: str) -> None:
+
+        is_str_instance(path, "path")
+
+        self.path = path
+        self.lock_path = path + ".lock"
+
+    def _read(self) -> "dict":
+        """
+        Read all tokens, the lock being held by the caller
+        """
+
+        return read_json(self.path)
+
+    def _write(self, tokens: "dict") -> None:
+        """
+        Atomically replace all tokens, the lock being held by the caller
+        """
+
+        write_json(self.path, tokens)
+
+    def load(
+            self,
+            id_client: str,
+            min_validity: int = 0) -> "Optional[tuple[str, float]]":
+        """
+        load(
+                self,
+                id_client: str,
+                min_validity: int = 0) -> "Optional[tuple[str, float]]"
+
+        Get the cached token of an application
+
+        Parameters
+        ----------
+        id_client : str
+            The application client ID
+        min_validity : int, default: 0
+            The minimum time the token must still be valid for, in seconds
+
+        Returns
+        -------
+        tuple[str, float] or None
+            The token and its expiration timestamp,
+            None if no token is valid for at least min_validity seconds
+        """
+
+        is_str_instance(id_client, "id_client")
+        is_int_instance(min_validity, "min_validity")
+
+        with file_lock(self.lock_path, exclusive=False):
+            token_ = self._read().get(id_client)
+
+        if token_ is None or token_["expire"] - min_validity <= time():
+            return None
+        return (token_["access_token"], token_["expire"])
+
+    def refresh(
+            self,
+            id_client: str,
+            min_validity: int,
+            request_token: "Callable[[], tuple[str, int]]"
+    ) -> "tuple[str, float]":
+        """
+        refresh(
+                self,
+                id_client: str,
+                min_validity: int,
+                request_token: "Callable[[], tuple[str, int]]"
+        ) -> "tuple[str, float]"
+
+        Get the cached token of an application, requesting and storing
+        a new one if it is not valid for at least min_validity seconds.
+        Concurrent processes wait for the request of the first one.
+
+        Parameters
+        ----------
+        id_client : str
+            The application client ID
+        min_validity : int
+            The minimum time the token must still be valid for, in seconds
+        request_token : Callable[[], tuple[str, int]]
+            Request a new token, returns the token and its validity duration
+
+        Returns
+        -------
+        tuple[str, float]
+            The token and its expiration timestamp
+        """
+
+        is_str_instance(id_client, "id_client")
+        is_int_instance(min_validity, "min_validity")
+
+        with file_lock(self.lock_path):
+            tokens_ = self._read()
+            token_ = tokens_.get(id_client)
+            if token_ is not None and token_["expire"] - min_validity > time():
+                return (token_["access_token"], token_["expire"])
+
+            (access_token_, validity_duration_) = request_token()
+            expire_ = time() + validity_duration_
+            tokens_[id_client] = {
+                "access_token": access_token_,
+                "expire": expire_}
+            self._write(tokens_)
+
+        return (access_token_, expire_)
@@ -4,17 +4,26 @@
 """
 This file contains all utilities for the pyFranceRTE package.
 """
-import datetime
-from typing import Any
+import contextlib
+import json
+import os
+import tempfile
+from typing import Any, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 from py_france_rte.errors import _ERROR_LOOKUP, ComError
+from py_france_rte.validation import (DATE_FORMAT, current_hour, date_rules,
+                                      to_timestamp)
 
 OAUTH_TOKEN_REQ_URL = "https://digital.iservices.rte-france.com/token/oauth/"
 BASE_PRIVATE_API_URL = "https://digital.iservices.rte-france.com/private_api/"
 BASE_OPEN_API_URL = "https://digital.iservices.rte-france.com/open_api/"
 
-DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
-
 SUPPORTED_APIS = [
     "Ecowatt",
     "Actual Generation"
@@ -36,7 +45,13 @@ def generate_header(token: str) -> "dict[str:str]":
     -------
     dict[str:str]
         A header to use to request data from an authorized API
+
+    Raises
+    ------
+    TypeError
+        If the token is not a str
     """
+    is_str_instance(token, "token")
     return {
         "Host": "digital.iservices.rte-france.com",
         "Authorization": f"Bearer {token}"}
@@ -65,7 +80,7 @@ def verify_response_code(code: int, api: str) -> None:
             code,
             "Unable to perform request with %s, code %i") % (api,
                                                              code)
-        raise ComError(error_)
+        raise ComError(error_, code=code)
 
 
 def is_str_instance(variable: Any, name: str) -> None:
@@ -116,6 +131,54 @@ def is_int_instance(variable: Any, name: str) -> None:
             f"must be int and is {type(variable)}.")
 
 
+def is_number_instance(variable: Any, name: str) -> None:
+    """
+    is_number_instance(variable: Any, name: str) -> None:
+
+    Verifies if the provided variable is of type int or float.
+
+    Parameters
+    ----------
+    variable : Any
+        The provided variable to review
+    name : str
+        The name of the variable
+
+    Raises
+    ------
+    TypeError
+        If the variable is not an int or a float
+    """
+    if not isinstance(variable, (int, float)):
+        raise TypeError(
+            f"Invalid data type for {name}, "
+            f"must be int or float and is {type(variable)}.")
+
+
+def is_list_instance(variable: Any, name: str) -> None:
+    """
+    is_list_instance(variable: Any, name: str) -> None:
+
+    Verifies if the provided variable is of type list.
+
+    Parameters
+    ----------
+    variable : Any
+        The provided variable to review
+    name : str
+        The name of the variable
+
+    Raises
+    ------
+    TypeError
+        If the variable is not a list
+    """
+    if not isinstance(variable, list):
+        raise TypeError(
+            f"Invalid data type for {name}, "
+            f"must be list and is {type(variable)}.")
+
+
 def verify_dates(
         start_date: Any,
         end_date: Any,
@@ -132,6 +195,8 @@ def verify_dates(
     Verifies if the provided dates have the correct format.
     Verifies if the duration between the given dates is within given interval.
     Verifies if start_date is after min_date.
+    Built on the checks of validation.DateRules, see it to check many
+    windows at once.
 
     Parameters
     ----------
@@ -160,21 +225,17 @@ def verify_dates(
     """
     if start_date:
         is_str_instance(start_date, "start_date")
-        try:
-            datetime.datetime.strptime(start_date, DATE_FORMAT)
-        except ValueError as err:
+        start_ = to_timestamp(start_date)
+        if start_ is None:
             raise ValueError(
-                f"Invalid date format for start_date, requires {DATE_FORMAT}"
-            ) from err
+                f"Invalid date format for start_date, requires {DATE_FORMAT}")
 
     if end_date:
         is_str_instance(end_date, "end_date")
-        try:
-            datetime.datetime.strptime(end_date, DATE_FORMAT)
-        except ValueError as err:
+        end_ = to_timestamp(end_date)
+        if end_ is None:
             raise ValueError(
-                f"Invalid date format for end_date, requires {DATE_FORMAT}"
-            ) from err
+                f"Invalid date format for end_date, requires {DATE_FORMAT}")
 
     if start_date and not end_date or end_date and not start_date:
         raise RuntimeError(
@@ -185,40 +246,12 @@ def verify_dates(
         is_int_instance(min_days, "min_days")
         is_str_instance(min_date, "min_date")
 
-        start_ = datetime.datetime.fromisoformat(start_date)
-        end_ = datetime.datetime.fromisoformat(end_date)
-        min_date_ = datetime.datetime.fromisoformat(
-            min_date + "T00:00:00+00:00")
-        now_ = datetime.datetime.now(
-            end_.tzinfo).replace(
-            minute=0,
-            second=0,
-            microsecond=0)
-
-        if start_ < min_date_:
-            raise ValueError(
-                f"start_date ({start_date}) is earlier "
-                f"than min_date {min_date}")
-        if end_ > now_:
-            raise ValueError(
-                f"end_date ({end_date})is later "
-                f"than current supported time {now_}")
-        if start_ > end_:
+        rules_ = date_rules(max_days, min_days, min_date)
+        now_ = current_hour()
+        (diagnostic_,) = rules_.check_windows([(start_, end_)], now_)
+        if diagnostic_ is not None:
             raise ValueError(
-                f"start_date ({start_date}) is later than end_date {end_date}")
-
-        duration_ = end_ - start_
-
-        if duration_.days > max_days:
-            raise ValueError(
-                f"Duration between start_date ({start_date}) and "
-                f"end_date ({end_date}) exceeds max_days ({max_days} days)")
-
-        if duration_.days < min_days:
-            raise ValueError(
-                f"Duration between start_date ({start_date}) and "
-                f"end_date ({end_date}) "
-                f"is less than min_days ({min_days} days)")
+                rules_.describe(diagnostic_, start_date, end_date, now_))
 
 
 def prepare_date_request(start_date: str, end_date: str) -> str:
@@ -269,3 +302,98 @@ def prepare_url_with_options(base_url: str, options: "list[str]") -> str:
         base_url_ += "?"
         base_url_ += "&".join(options)
     return base_url_
+
+
+@contextlib.contextmanager
+def file_lock(path: str, exclusive: bool = True) -> Iterator[None]:
+    """
+    file_lock(path: str, exclusive: bool = True) -> Iterator[None]
+
+    Context manager holding a lock on a file shared by several processes,
+    the file is created if needed.
+
+    Parameters
+    ----------
+    path : str
+        The path of the lock file
+    exclusive : bool, default: True
+        Hold an exclusive lock, or a lock shared with other readers.
+        Locks are always exclusive on Windows.
+    """
+    is_str_instance(path, "path")
+    fd_ = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd_, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        else:
+            msvcrt.locking(fd_, msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd_, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd_, 0, os.SEEK_SET)
+                msvcrt.locking(fd_, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd_)
+
+
+def read_json(path: str) -> "dict":
+    """
+    read_json(path: str) -> "dict"
+
+    Read a json store, exemple : while holding its file_lock
+
+    Parameters
+    ----------
+    path : str
+        The path of the json file
+
+    Returns
+    -------
+    dict
+        The content of the file, empty if missing or unreadable
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file_:
+            return json.load(file_)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_json(
+        path: str,
+        content: Any,
+        indent: Optional[int] = None,
+        sort_keys: bool = False) -> None:
+    """
+    write_json(
+            path: str,
+            content: Any,
+            indent: Optional[int] = None,
+            sort_keys: bool = False) -> None
+
+    Atomically replace a json file, so that readers never see
+    a partly written file. The temporary file is private to the user.
+
+    Parameters
+    ----------
+    path : str
+        The path of the json file
+    content : Any
+        The content to write
+    indent : int, optional
+        The indentation of json.dump
+    sort_keys : bool, default: False
+        Sort keys like json.dump
+    """
+    (fd_, temp_path_) = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd_, "w", encoding="utf-8") as file_:
+            json.dump(content, file_, indent=indent, sort_keys=sort_keys)
+        os.replace(temp_path_, path)
+    except BaseException:
+        os.unlink(temp_path_)
+        raise
@@ -0,0 +1,276 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+This file contains the date validation engine, checking batches of
+request windows against the date rules of an endpoint without raising
+"""
+
+import datetime
+import functools
+import re
+import time
+from typing import Optional
+
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+# Dates at format "YYYY-MM-DDThh:mm:ss+hh:mm", parsed by fromisoformat
+_ISO_DATE = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}")
+
+_DAY = 86400
+
+# Diagnostics of a window, formatted with its dates and the rules
+DIAGNOSTICS = {
+    "start_format": "Invalid date format for start_date, "
+                    "requires {date_format}",
+    "end_format": "Invalid date format for end_date, requires {date_format}",
+    "min_date": "start_date ({start_date}) is earlier "
+                "than min_date {min_date}",
+    "future": "end_date ({end_date})is later "
+              "than current supported time {now}",
+    "order": "start_date ({start_date}) is later than end_date {end_date}",
+    "max_days": "Duration between start_date ({start_date}) and "
+                "end_date ({end_date}) exceeds max_days ({max_days} days)",
+    "min_days": "Duration between start_date ({start_date}) and "
+                "end_date ({end_date}) "
+                "is less than min_days ({min_days} days)",
+}
+
+
+def parse_datetime(date: str) -> Optional[datetime.datetime]:
+    """
+    parse_datetime(date: str) -> Optional[datetime.datetime]
+
+    Parse a date at format DATE_FORMAT, keeping its timezone offset.
+    Dates like "2015-06-08T00:00:00+02:00" take a fast path, other
+    spellings accepted by DATE_FORMAT, exemple : "+0200" offsets,
+    are parsed with strptime.
+
+    Parameters
+    ----------
+    date : str
+        The date to parse, exemple : "2015-06-08T00:00:00+02:00"
+
+    Returns
+    -------
+    datetime.datetime or None
+        The parsed timezone aware date, None if the date is invalid
+    """
+    if _ISO_DATE.fullmatch(date):
+        try:
+            return datetime.datetime.fromisoformat(date)
+        except ValueError:
+            return None
+    try:
+        return datetime.datetime.strptime(date, DATE_FORMAT)
+    except ValueError:
+        return None
+
+
+def to_timestamp(date: str) -> Optional[int]:
+    """
+    to_timestamp(date: str) -> Optional[int]
+
+    Parse a date at format DATE_FORMAT into an epoch timestamp
+
+    Parameters
+    ----------
+    date : str
+        The date to parse, exemple : "2015-06-08T00:00:00+02:00"
+
+    Returns
+    -------
+    int or None
+        The epoch timestamp in seconds, None if the date is invalid
+    """
+    date_ = parse_datetime(date)
+    return int(date_.timestamp()) if date_ is not None else None
+
+
+def current_hour() -> int:
+    """
+    current_hour() -> int
+
+    Latest date supported by the APIs, the current time truncated to
+    the hour, as an epoch timestamp in seconds
+    """
+    now_ = int(time.time())
+    return now_ - now_ % 3600
+
+
+class DateRules():
+    """
+    DateRules(max_days: int, min_days: int, min_date: str) -> DateRules:
+
+    Date rules of an endpoint, exemple : a value of DATE_LIMITS, with
+    min_date parsed once. Windows are checked in the order of
+    verify_dates, and get the code of their first problem as diagnostic,
+    a key of DIAGNOSTICS, or None if valid.
+
+    Parameters
+    ----------
+    max_days : int
+        The maximum duration of a window, in day(s)
+    min_days : int
+        The minimum duration of a window, in day(s)
+    min_date : str
+        The minimum date for start dates, must be of format "YYYY-MM-DD"
+
+    Returns
+    -------
+    DateRules
+        An instance of DateRules class
+    """
+
+    __slots__ = ("max_days", "min_days", "min_date", "min_timestamp")
+
+    def __init__(self, max_days: int, min_days: int, min_date: str) -> None:
+        self.max_days = max_days
+        self.min_days = min_days
+        self.min_date = min_date
+        self.min_timestamp = int(datetime.datetime.fromisoformat(
+            min_date + "T00:00:00+00:00").timestamp())
+
+    def __repr__(self) -> str:
+        return (f"DateRules({self.max_days}, {self.min_days}, "
+                f"{self.min_date!r})")
+
+    def check_windows(
+            self,
+            windows: "list[tuple[Optional[int], Optional[int]]]",
+            now: Optional[int] = None) -> "list[Optional[str]]":
+        """
+        check_windows(
+                self,
+                windows: "list[tuple[Optional[int], Optional[int]]]",
+                now: Optional[int] = None) -> "list[Optional[str]]"
+
+        Check windows of epoch timestamps in one pass
+
+        Parameters
+        ----------
+        windows : list[tuple[int or None, int or None]]
+            The (start, end) epoch timestamps of windows, None for
+            a date that could not be parsed
+        now : int or None, default: None
+            The latest supported end, current_hour() if None
+
+        Returns
+        -------
+        list[str or None]
+            The diagnostic of each window, in the order of windows
+        """
+
+        now_ = current_hour() if now is None else now
+        min_timestamp_ = self.min_timestamp
+        # duration.days > max_days and duration.days < min_days
+        too_long_ = (self.max_days + 1) * _DAY
+        too_short_ = self.min_days * _DAY
+
+        diagnostics_ = []
+        for (start_, end_) in windows:
+            if start_ is None:
+                diagnostics_.append("start_format")
+            elif end_ is None:
+                diagnostics_.append("end_format")
+            elif start_ < min_timestamp_:
+                diagnostics_.append("min_date")
+            elif end_ > now_:
+                diagnostics_.append("future")
+            elif start_ > end_:
+                diagnostics_.append("order")
+            elif end_ - start_ >= too_long_:
+                diagnostics_.append("max_days")
+            elif end_ - start_ < too_short_:
+                diagnostics_.append("min_days")
+            else:
+                diagnostics_.append(None)
+        return diagnostics_
+
+    def check_dates(
+            self,
+            windows: "list[tuple[str, str]]",
+            now: Optional[int] = None) -> "list[Optional[str]]":
+        """
+        check_dates(
+                self,
+                windows: "list[tuple[str, str]]",
+                now: Optional[int] = None) -> "list[Optional[str]]"
+
+        Parse and check windows of dates in one pass
+
+        Parameters
+        ----------
+        windows : list[tuple[str, str]]
+            The (start_date, end_date) of windows, at format
+            "YYYY-MM-DDThh:mm:sszzzzzz",
+            exemple : ("2015-06-08T00:00:00+02:00",
+            "2015-06-09T00:00:00+02:00")
+        now : int or None, default: None
+            The latest supported end, current_hour() if None
+
+        Returns
+        -------
+        list[str or None]
+            The diagnostic of each window, in the order of windows
+        """
+
+        return self.check_windows(
+            [(to_timestamp(start_date_), to_timestamp(end_date_))
+             for (start_date_, end_date_) in windows],
+            now)
+
+    def describe(
+            self,
+            diagnostic: str,
+            start_date: str,
+            end_date: str,
+            now: Optional[int] = None) -> str:
+        """
+        describe(
+                self,
+                diagnostic: str,
+                start_date: str,
+                end_date: str,
+                now: Optional[int] = None) -> str
+
+        Explain the diagnostic of a window
+
+        Parameters
+        ----------
+        diagnostic : str
+            The diagnostic, a key of DIAGNOSTICS
+        start_date : str
+            The start date of the window
+        end_date : str
+            The end date of the window
+        now : int or None, default: None
+            The latest supported end, current_hour() if None
+
+        Returns
+        -------
+        str
+            The message of the diagnostic
+        """
+
+        now_ = datetime.datetime.fromtimestamp(
+            current_hour() if now is None else now, datetime.timezone.utc)
+        return DIAGNOSTICS[diagnostic].format(
+            date_format=DATE_FORMAT,
+            start_date=start_date,
+            end_date=end_date,
+            now=now_,
+            max_days=self.max_days,
+            min_days=self.min_days,
+            min_date=self.min_date)
+
+
+@functools.lru_cache(maxsize=None)
+def date_rules(max_days: int, min_days: int, min_date: str) -> DateRules:
+    """
+    date_rules(max_days: int, min_days: int, min_date: str) -> DateRules
+
+    Get the shared DateRules of some limits, built once
+    """
+    return DateRules(max_days, min_days, min_date)
@@ -0,0 +1,137 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the fixtures shared by the tests, fake http
+sessions and fake Actual Generation endpoints
+"""
+
+import datetime
+import json
+import time
+
+import pytest
+
+from py_france_rte.application import Application
+from py_france_rte.errors import ComError
+
+
+class FakeResponse():
+    def __init__(self, status_code=200, content=b"{}", headers=None,
+                 elapsed=0.):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.elapsed = datetime.timedelta(seconds=elapsed)
+
+    def json(self):
+        return json.loads(self.content)
+
+    def close(self):
+        pass
+
+
+class FakeSession():
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.headers = []
+
+    @property
+    def count(self):
+        return len(self.headers)
+
+    def get(self, url=None, headers=None, **kwargs):
+        self.headers.append(headers)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def fake_response():
+    """
+    The FakeResponse class, a response answered by a FakeSession
+    """
+    return FakeResponse
+
+
+@pytest.fixture
+def fake_application():
+    """
+    Factory of applications with a valid token, whose session answers
+    the given responses in order, raising the exceptions among them
+    """
+    def factory(responses, apis=("Ecowatt",), **kwargs):
+        application = Application("client", "secret", list(apis), **kwargs)
+        application.oauth_token = "token"
+        application.oauth_token_expire = time.time() + 3600
+        application.session = FakeSession(responses)
+        return application
+    return factory
+
+
+def fake_values(start_date, end_date, step=None, updated=False):
+    """
+    Values of 1 every step over a window, a single value if step is None,
+    updated at the end of the window if updated
+    """
+    start = datetime.datetime.fromisoformat(start_date)
+    end = datetime.datetime.fromisoformat(end_date)
+    values = []
+    while start < end:
+        value_end = end if step is None else start + step
+        value = {"start_date": start.isoformat(),
+                 "end_date": value_end.isoformat(),
+                 "value": 1}
+        if updated:
+            value["updated_date"] = end_date
+        values.append(value)
+        start = value_end
+    return values
+
+
+@pytest.fixture
+def fake_generation():
+    """
+    Factory of applications subscribed to Actual Generation, whose
+    request function of endpoint is replaced by a fake. The fake records
+    the (start_date, end_date, options) of each request, options given
+    as None left out, in application.requested, raises 413 Response too
+    large if too_large(start, end, options), and answers the series of
+    series(options) under key, with values from fake_values. A series
+    with an "until" date only has values up to it.
+    """
+    def factory(endpoint, key, series=None, step=None, updated=False,
+                too_large=None, **kwargs):
+        application = Application(
+            "client", "secret", ["Actual Generation"], **kwargs)
+        application.requested = []
+
+        def request(start_date, end_date, **options):
+            options = {name: value for (name, value) in options.items()
+                       if value is not None}
+            application.requested.append((start_date, end_date, options))
+            start = datetime.datetime.fromisoformat(start_date)
+            end = datetime.datetime.fromisoformat(end_date)
+            if too_large is not None and too_large(start, end, options):
+                raise ComError("Response too large", code=413)
+            content = []
+            for fields in (series(options) if series else [{}]):
+                fields = dict(fields)
+                until = fields.pop("until", end_date)
+                last = min(end, datetime.datetime.fromisoformat(until))
+                content.append(dict(
+                    fields,
+                    start_date=start_date,
+                    end_date=end_date,
+                    values=fake_values(
+                        start_date,
+                        last.astimezone(start.tzinfo).isoformat(),
+                        step, updated)))
+            return {key: content}
+
+        setattr(application, f"request_{endpoint}", request)
+        return application
+    return factory
@@ -0,0 +1,64 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for Application.request_adaptive
+"""
+
+import pytest
+
+from py_france_rte.errors import ComError
+
+
+def mix_application(fake_generation, max_days):
+    return fake_generation(
+        "generation_mix_15min", "generation_mix_15min_time_scale",
+        lambda options: [{"production_type":
+                          options.get("production_type", "ALL")}],
+        too_large=lambda start, end, options:
+        (end - start).days > max_days and "production_type" not in options)
+
+
+def test_request_adaptive_bisects(fake_generation):
+    application = mix_application(fake_generation, 3)
+
+    response = application.request_adaptive(
+        "generation_mix_15min",
+        "2020-01-01T00:00:00+01:00", "2020-01-15T00:00:00+01:00")
+
+    # 14 days, then 7 days twice, then 3 or 4 days
+    assert application.window_sizes == {"generation_mix_15min": 3}
+    values = response["generation_mix_15min_time_scale"][0]["values"]
+    assert [value["start_date"] for value in values] == sorted(
+        value["start_date"] for value in values)
+    assert values[0]["start_date"] == "2020-01-01T00:00:00+01:00"
+
+    # Next requests start from the remembered size
+    application.requested.clear()
+    application.request_adaptive(
+        "generation_mix_15min",
+        "2020-01-01T00:00:00+01:00", "2020-01-07T00:00:00+01:00")
+    assert len(application.requested) == 2
+
+
+def test_request_adaptive_splits_by_type(fake_generation):
+    application = mix_application(fake_generation, 0)
+
+    response = application.request_adaptive(
+        "generation_mix_15min",
+        "2020-01-01T00:00:00+01:00", "2020-01-03T00:00:00+01:00")
+    assert len(response["generation_mix_15min_time_scale"]) == 10
+
+
+def test_request_adaptive_gives_up(fake_generation):
+    application = fake_generation(
+        "actual_generation_per_unit", "actual_generations_per_unit",
+        too_large=lambda start, end, options: True)
+    with pytest.raises(ComError) as info:
+        application.request_adaptive(
+            "actual_generation_per_unit",
+            "2020-01-01T00:00:00+01:00", "2020-01-08T00:00:00+01:00")
+    assert info.value.code == 413
+    assert application.window_sizes == {
+        "actual_generation_per_unit": 1}
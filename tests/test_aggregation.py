@@ -0,0 +1,97 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.aggregation
+"""
+
+import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from py_france_rte.aggregation import resample, rollup_subtypes
+from py_france_rte.columnar import ColumnarSeries
+
+
+def quarter_hours(start, end, metadata=None, value=4.):
+    start = int(datetime.datetime.fromisoformat(start).timestamp())
+    end = int(datetime.datetime.fromisoformat(end).timestamp())
+    starts = np.arange(start, end, 900, dtype=np.int64)
+    return ColumnarSeries(
+        metadata or {"production_type": "SOLAR"},
+        starts,
+        starts + 900,
+        np.full(len(starts), value),
+        starts + 1800)
+
+
+def test_resample_fixed_interval():
+    series = quarter_hours(
+        "2020-01-01T00:00:00+01:00", "2020-01-01T02:00:00+01:00")
+    series.values[1] = np.nan
+
+    hourly = resample(series, datetime.timedelta(hours=1), "sum")
+    assert hourly.values.tolist() == [12., 16.]
+    assert np.all(hourly.end - hourly.start == 3600)
+    assert hourly.metadata["aggregation"] == "sum"
+
+    assert resample(series, datetime.timedelta(hours=1), "mean"
+                    ).values.tolist() == [4., 4.]
+    assert resample(series, datetime.timedelta(hours=1), "energy"
+                    ).values.tolist() == [3., 4.]
+
+    with pytest.raises(ValueError):
+        resample(series, "week")
+    with pytest.raises(ValueError):
+        resample(series, "day", "median")
+
+
+def test_resample_days_across_dst():
+    series = quarter_hours(
+        "2020-03-28T00:00:00+01:00", "2020-03-30T00:00:00+02:00")
+
+    daily = resample(series, "day", "energy")
+    # The day of the spring transition lasts 23 hours
+    assert daily.values.tolist() == [96., 92.]
+    assert (daily.end - daily.start).tolist() == [86400, 82800]
+
+    series = quarter_hours(
+        "2020-10-25T00:00:00+02:00", "2020-10-26T00:00:00+01:00")
+    daily = resample(series, "day", "max")
+    assert len(daily) == 1
+    assert (daily.end - daily.start).tolist() == [90000]
+
+    monthly = resample(series, "month", "sum")
+    assert datetime.datetime.fromtimestamp(
+        monthly.start[0], datetime.timezone.utc).isoformat() == \
+        "2020-09-30T22:00:00+00:00"
+
+
+def test_rollup_subtypes():
+    series = [
+        quarter_hours("2020-01-01T00:00:00+01:00",
+                      "2020-01-01T01:00:00+01:00",
+                      {"production_type": "HYDRO",
+                       "production_subtype": subtype},
+                      value)
+        for (subtype, value) in (("HYDRO_PUMPED_STORAGE", 1.),
+                                 ("HYDRO_WATER_RESERVOIR", 2.))]
+    series.append(quarter_hours(
+        "2020-01-01T00:00:00+01:00", "2020-01-01T01:00:00+01:00"))
+    series[1].values[0] = np.nan
+
+    (hydro, solar) = rollup_subtypes(series)
+    assert hydro.metadata == {"production_type": "HYDRO"}
+    assert hydro.values.tolist() == [1., 3., 3., 3.]
+    assert solar is series[2]
+
+    # A total series of the type is not summed with its subtypes
+    series.append(quarter_hours(
+        "2020-01-01T00:00:00+01:00", "2020-01-01T01:00:00+01:00",
+        {"production_type": "HYDRO", "production_subtype": "TOTAL"}, 3.))
+    (hydro, solar, total) = rollup_subtypes(series)
+    assert hydro.values.tolist() == [1., 3., 3., 3.]
+    assert total is series[3]
@@ -0,0 +1,96 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.async_application
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import test_utils, web
+
+from py_france_rte import async_application
+from py_france_rte.async_application import AsyncApplication
+from py_france_rte.errors import NoAccessError
+from py_france_rte.registry import ENDPOINTS
+
+
+def test_unsupported_api():
+    with pytest.raises(RuntimeError):
+        AsyncApplication("client", "secret", ["Big Substations"])
+
+
+def test_no_access():
+    async def request():
+        async with AsyncApplication("client", "secret", []) as application:
+            await application.request_ecowatt_signals()
+
+    with pytest.raises(NoAccessError):
+        asyncio.run(request())
+
+
+def test_invalid_dates():
+    async def request():
+        async with AsyncApplication(
+                "client", "secret", ["Actual Generation"]) as application:
+            await application.request_water_reserves(
+                "2017-06-05T00:00:00+02:00", "2017-06-06T00:00:00+02:00")
+
+    with pytest.raises(ValueError):
+        asyncio.run(request())
+
+
+def test_gathered_requests(monkeypatch):
+    counts = {"token": 0, "in_flight": 0, "max_in_flight": 0}
+
+    async def token(request):
+        counts["token"] += 1
+        await asyncio.sleep(0.01)
+        return web.json_response({"access_token": "stub_token",
+                                  "token_type": "Bearer",
+                                  "expires_in": 7200})
+
+    async def water_reserves(request):
+        assert "stub_token" in request.headers["Authorization"]
+        counts["in_flight"] += 1
+        counts["max_in_flight"] = max(counts["max_in_flight"],
+                                      counts["in_flight"])
+        await asyncio.sleep(0.02)
+        counts["in_flight"] -= 1
+        return web.json_response({"water_reserves": [
+            {"start_date": request.query["start_date"], "values": []}]})
+
+    starts = [f"2017-{month:02d}-05T00:00:00+02:00" for month in range(1, 11)]
+
+    async def request():
+        app = web.Application()
+        app.router.add_post("/token/oauth", token)
+        app.router.add_get("/water_reserves", water_reserves)
+        async with test_utils.TestServer(app) as server:
+            monkeypatch.setattr(
+                async_application, "OAUTH_TOKEN_REQ_URL",
+                str(server.make_url("/token/oauth")))
+            monkeypatch.setattr(
+                ENDPOINTS["water_reserves"], "url",
+                str(server.make_url("/water_reserves")))
+            async with AsyncApplication(
+                    "client", "secret", ["Actual Generation"],
+                    max_in_flight=3) as application:
+                return await asyncio.gather(*[
+                    application.request_water_reserves(
+                        start, start.replace("-05T", "-20T"))
+                    for start in starts])
+
+    responses = asyncio.run(request())
+
+    # One token request for all gathered requests, at most max_in_flight
+    # data requests at the same time
+    assert counts["token"] == 1
+    assert counts["max_in_flight"] == 3
+    assert [response["water_reserves"][0]["start_date"]
+            for response in responses] == starts
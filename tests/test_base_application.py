@@ -0,0 +1,72 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.base_application
+"""
+
+import threading
+import time
+
+from py_france_rte.base_application import BaseApplication
+
+
+class CountingApplication(BaseApplication):
+    def generate_oauth_token(self):
+        time.sleep(0.05)
+        self.refresh_count = getattr(self, "refresh_count", 0) + 1
+        self.oauth_token = f"token_{self.refresh_count}"
+        self.oauth_token_expire = time.time() + 3600
+
+
+def verify_token_concurrently(application, threads_count=10):
+    threads = [threading.Thread(target=application.verify_token)
+               for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_deferred_token():
+    application = CountingApplication("client", "secret")
+    assert not hasattr(application, "refresh_count")
+
+
+def test_single_flight_refresh():
+    application = CountingApplication("client", "secret")
+
+    verify_token_concurrently(application)
+
+    assert application.refresh_count == 1
+    assert application.oauth_token == "token_1"
+
+
+class GatedApplication(CountingApplication):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.release = threading.Event()
+        self.refreshed = threading.Event()
+
+    def generate_oauth_token(self):
+        self.release.wait(timeout=5)
+        super().generate_oauth_token()
+        self.refreshed.set()
+
+
+def test_proactive_refresh():
+    application = GatedApplication(
+        "client", "secret", token_refresh_margin=120)
+    application.oauth_token = "token_0"
+    application.oauth_token_expire = time.time() + 60
+
+    # Callers return while the refresh waits to be released
+    verify_token_concurrently(application)
+    assert not application.refreshed.is_set()
+    assert application.oauth_token == "token_0"
+
+    application.release.set()
+    assert application.refreshed.wait(timeout=5)
+    assert application.refresh_count == 1
+    assert application.oauth_token == "token_1"
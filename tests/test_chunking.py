@@ -0,0 +1,60 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.chunking
+"""
+
+import pytest
+
+from py_france_rte.chunking import merge_responses, split_date_range
+
+
+def test_split_date_range():
+    assert split_date_range(
+        "2017-06-01T00:00:00+02:00",
+        "2017-06-20T00:00:00+02:00", 7, 1) == [
+        ("2017-06-01T00:00:00+02:00", "2017-06-08T00:00:00+02:00"),
+        ("2017-06-08T00:00:00+02:00", "2017-06-15T00:00:00+02:00"),
+        ("2017-06-15T00:00:00+02:00", "2017-06-20T00:00:00+02:00")]
+
+
+def test_split_date_range_min_days():
+    assert split_date_range(
+        "2017-06-01T00:00:00+02:00",
+        "2017-06-10T00:00:00+02:00", 7, 7) == [
+        ("2017-06-01T00:00:00+02:00", "2017-06-08T00:00:00+02:00"),
+        ("2017-06-03T00:00:00+02:00", "2017-06-10T00:00:00+02:00")]
+    with pytest.raises(ValueError):
+        split_date_range(
+            "2017-06-01T00:00:00+02:00",
+            "2017-06-05T00:00:00+02:00", 7, 7)
+
+
+def test_split_date_range_keeps_offset():
+    assert split_date_range(
+        "2017-10-27T00:00:00+02:00",
+        "2017-10-30T00:00:00+01:00", 2, 1) == [
+        ("2017-10-27T00:00:00+02:00", "2017-10-29T00:00:00+02:00"),
+        ("2017-10-29T00:00:00+02:00", "2017-10-30T01:00:00+02:00")]
+
+
+def test_merge_responses():
+    def value(day):
+        return {"start_date": f"2017-06-0{day}T00:00:00+02:00",
+                "end_date": f"2017-06-0{day + 1}T00:00:00+02:00",
+                "value": day}
+
+    def response(days):
+        return {"water_reserves": [{
+            "start_date": f"2017-06-0{days[0]}T00:00:00+02:00",
+            "end_date": f"2017-06-0{days[-1] + 1}T00:00:00+02:00",
+            "values": [value(day) for day in days]}]}
+
+    merged = merge_responses([response([1, 2, 3]), response([2, 3, 4])])
+
+    assert merged == {"water_reserves": [{
+        "start_date": "2017-06-01T00:00:00+02:00",
+        "end_date": "2017-06-05T00:00:00+02:00",
+        "values": [value(day) for day in [1, 2, 3, 4]]}]}
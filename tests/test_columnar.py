@@ -0,0 +1,75 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.columnar
+"""
+
+import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from py_france_rte.columnar import parse_timestamps, to_columnar
+
+DATES = [
+    "2017-06-05T00:00:00+02:00",
+    "2017-10-29T02:15:00+01:00",
+    "2000-02-29T23:59:59-05:30",
+    "1969-12-31T23:00:00+00:00",
+]
+
+
+def test_parse_timestamps():
+    expected = [int(datetime.datetime.fromisoformat(date).timestamp())
+                for date in DATES]
+    assert parse_timestamps(DATES).tolist() == expected
+    # Other formats are parsed one by one
+    assert parse_timestamps(
+        ["2017-06-05T00:00:00+0200"]).tolist() == expected[:1]
+    assert parse_timestamps([]).dtype == np.int64
+
+
+def test_to_columnar():
+    response = {"actual_generations_per_production_type": [
+        {"start_date": DATES[0], "end_date": DATES[1],
+         "production_type": "HYDRO",
+         "values": [{"start_date": DATES[0], "end_date": DATES[1],
+                     "value": 12, "updated_date": DATES[1]},
+                    {"start_date": DATES[1], "end_date": DATES[2],
+                     "value": None, "updated_date": DATES[2]}]},
+        {"start_date": DATES[0], "end_date": DATES[1],
+         "production_type": "SOLAR",
+         "values": [{"start_date": DATES[2], "end_date": DATES[3],
+                     "value": 3.5, "updated_date": DATES[3]}]}]}
+
+    (hydro, solar) = to_columnar(response)
+
+    assert hydro.metadata == {
+        "endpoint": "actual_generations_per_production_type",
+        "start_date": DATES[0], "end_date": DATES[1],
+        "production_type": "HYDRO"}
+    assert hydro.start.tolist() == parse_timestamps(DATES[:2]).tolist()
+    assert hydro.values[0] == 12. and np.isnan(hydro.values[1])
+    assert solar.end.tolist() == parse_timestamps(DATES[3:]).tolist()
+    assert solar.updated.tolist() == parse_timestamps(DATES[3:]).tolist()
+    assert len(solar) == 1
+
+
+def test_to_columnar_partial_updated_dates():
+    (series,) = to_columnar({"water_reserves": [{"values": [
+        {"start_date": "2020-01-01T00:00:00+01:00",
+         "end_date": "2020-01-08T00:00:00+01:00",
+         "value": 1,
+         "updated_date": "2020-01-08T00:00:00+01:00"},
+        {"start_date": "2020-01-08T00:00:00+01:00",
+         "end_date": "2020-01-15T00:00:00+01:00",
+         "value": 2}]}]})
+    assert series.updated.tolist() == [1578438000, -1]
+
+    (series,) = to_columnar({"water_reserves": [{"values": [
+        {"start_date": "2020-01-01T00:00:00+01:00",
+         "end_date": "2020-01-08T00:00:00+01:00"}]}]})
+    assert series.updated.tolist() == [-1]
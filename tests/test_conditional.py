@@ -0,0 +1,80 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.conditional
+and conditional requests of applications
+"""
+
+import pytest
+
+from py_france_rte.conditional import ValidatorCache, normalize_url
+from py_france_rte.errors import ComError
+from py_france_rte.instrumentation import HistogramCollector
+
+BODY = b'{"signals": [{"dvalue": 1}]}'
+
+
+def test_normalize_url():
+    assert normalize_url("https://Example.com/a?b=2&a=1") == \
+        normalize_url("https://example.com/a?a=1&b=2")
+
+
+def test_validator_cache():
+    cache = ValidatorCache(max_entries=1)
+    cache.set("https://example.com/a", {}, {"a": 1}, 10)
+    assert cache.get("https://example.com/a") is None
+    cache.set("https://example.com/a", {"ETag": '"1"'}, {"a": 1}, 10)
+    assert cache.get("https://example.com/a").headers == \
+        {"If-None-Match": '"1"'}
+    cache.set("https://example.com/b",
+              {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, {}, 0)
+    assert cache.get("https://example.com/a") is None
+
+
+def test_validator_cache_max_size():
+    cache = ValidatorCache(max_size=100)
+    cache.set("https://example.com/a", {"ETag": '"1"'}, {}, 60)
+    cache.set("https://example.com/b", {"ETag": '"1"'}, {}, 30)
+    # The least recently used response is dropped to fit max_size
+    cache.get("https://example.com/a")
+    cache.set("https://example.com/c", {"ETag": '"1"'}, {}, 30)
+    assert cache.get("https://example.com/b") is None
+    assert cache.get("https://example.com/a") is not None
+    # Responses larger than max_size are not stored
+    cache.set("https://example.com/a", {"ETag": '"2"'}, {}, 101)
+    assert cache.get("https://example.com/a") is None
+    assert cache.get("https://example.com/c") is not None
+
+
+def test_not_modified_returns_stored_response(
+        fake_application, fake_response):
+    collector = HistogramCollector()
+    application = fake_application(
+        [fake_response(200, BODY, {"ETag": '"1"'}),
+         fake_response(304, headers={"ETag": '"1"'})],
+        validator_cache=ValidatorCache())
+    application.add_hook(collector)
+
+    first = application.request_ecowatt_signals()
+    second = application.request_ecowatt_signals()
+
+    assert second is first
+    assert "If-None-Match" not in application.session.headers[0]
+    assert application.session.headers[1]["If-None-Match"] == '"1"'
+    assert application.validator_cache.stats == {
+        "not_modified": 1, "modified": 0, "bytes_saved": len(BODY)}
+    assert collector.totals["signals"]["not_modified"] == 1
+    assert collector.totals["signals"]["bytes_saved"] == len(BODY)
+    assert 'py_france_rte_bytes_saved_total{endpoint="signals"} ' \
+        f'{len(BODY)}' in collector.to_prometheus()
+
+
+def test_unexpected_not_modified_raises(fake_application, fake_response):
+    application = fake_application(
+        [fake_response(304)], validator_cache=ValidatorCache())
+
+    with pytest.raises(ComError):
+        application.request_ecowatt_signals()
+    assert "If-None-Match" not in application.session.headers[0]
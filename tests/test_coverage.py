@@ -0,0 +1,95 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.coverage
+and Application.request_missing
+"""
+
+import datetime
+
+from py_france_rte.coverage import CoverageIndex, IntervalSet
+
+
+def test_interval_set():
+    intervals = IntervalSet([(10, 20), (30, 40), (0, 5)])
+    assert list(intervals) == [(0, 5), (10, 20), (30, 40)]
+
+    # Adjacent and overlapping intervals are merged
+    intervals.add(5, 10)
+    intervals.add(15, 35)
+    assert list(intervals) == [(0, 40)]
+
+    intervals.add(50, 60)
+    assert intervals.missing(-5, 70) == [(-5, 0), (40, 50), (60, 70)]
+    assert intervals.missing(10, 30) == []
+    assert intervals.missing(55, 65) == [(60, 65)]
+
+
+def test_interval_set_stays_small():
+    intervals = IntervalSet()
+    for start in range(0, 10000, 10):
+        intervals.add(start, start + 10)
+    assert list(intervals) == [(0, 10000)]
+
+
+def test_request_missing(fake_generation, tmp_path):
+    application = fake_generation(
+        "actual_generation_per_unit", "actual_generations_per_unit")
+    requested = application.requested
+    coverage = CoverageIndex(str(tmp_path / "coverage.json"))
+
+    application.request_missing(
+        "actual_generation_per_unit", coverage,
+        "2020-01-03T00:00:00+01:00", "2020-01-10T00:00:00+01:00",
+        unit_eic_code="17W100P100P0345B")
+    assert len(requested) == 1
+
+    # Only missing days are requested, split to 7 days at most
+    assert application.plan_missing(
+        "actual_generation_per_unit", coverage,
+        "2020-01-01T00:00:00+01:00", "2020-01-20T00:00:00+01:00",
+        unit_eic_code="17W100P100P0345B") == [
+        ("2020-01-01T00:00:00+01:00", "2020-01-03T00:00:00+01:00"),
+        ("2020-01-10T00:00:00+01:00", "2020-01-17T00:00:00+01:00"),
+        ("2020-01-17T00:00:00+01:00", "2020-01-20T00:00:00+01:00")]
+
+    # Short gaps are requested over the minimum duration
+    assert application.plan_missing(
+        "actual_generation_per_unit", coverage,
+        "2020-01-09T12:00:00+01:00", "2020-01-10T06:00:00+01:00",
+        unit_eic_code="17W100P100P0345B") == [
+        ("2020-01-09T06:00:00+01:00", "2020-01-10T06:00:00+01:00")]
+
+    # Other options have their own coverage
+    assert len(application.plan_missing(
+        "actual_generation_per_unit", coverage,
+        "2020-01-03T00:00:00+01:00", "2020-01-10T00:00:00+01:00")) == 1
+
+    assert application.request_missing(
+        "actual_generation_per_unit", coverage,
+        "2020-01-04T00:00:00+01:00", "2020-01-09T00:00:00+01:00",
+        unit_eic_code="17W100P100P0345B") == {}
+    assert len(requested) == 1
+
+
+def test_request_missing_recent_data(fake_generation, tmp_path):
+    application = fake_generation(
+        "actual_generation_per_type",
+        "actual_generations_per_production_type")
+    coverage = CoverageIndex(str(tmp_path / "coverage.json"))
+    end = datetime.datetime.now(datetime.timezone.utc).replace(
+        minute=0, second=0, microsecond=0)
+    start = end - datetime.timedelta(days=10)
+
+    application.request_missing(
+        "actual_generation_per_type", coverage,
+        start.isoformat(), end.isoformat())
+    # The last 3 days are not final yet and are planned again
+    (missing,) = application.plan_missing(
+        "actual_generation_per_type", coverage,
+        start.isoformat(), end.isoformat())
+    assert missing[1] == end.isoformat()
+    assert datetime.datetime.fromisoformat(missing[0]) >= \
+        end - datetime.timedelta(days=3, minutes=1)
@@ -0,0 +1,88 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.instrumentation
+"""
+
+import pytest
+
+from py_france_rte.errors import ComError
+from py_france_rte.instrumentation import HistogramCollector, RequestEvent
+from py_france_rte.memory_cache import TTLCache
+from py_france_rte.retry import RetryPolicy
+
+CONTENT = b'{"water_reserves": []}'
+
+
+def responses(fake_response, statuses):
+    return [fake_response(status, CONTENT, elapsed=0.02)
+            for status in statuses]
+
+
+def test_request_event():
+    event = RequestEvent(
+        "Actual Generation",
+        "https://host/open_api/actual_generation/v1/water_reserves"
+        "?start_date=2017-06-05T00:00:00%2B02:00"
+        "&end_date=2017-06-12T00:00:00%2B02:00")
+    assert event.endpoint == "water_reserves"
+    assert event.window == ("2017-06-05T00:00:00+02:00",
+                            "2017-06-12T00:00:00+02:00")
+
+
+def test_hooks(fake_application, fake_response):
+    application = fake_application(
+        responses(fake_response, [503, 200, 400]), ["Actual Generation"],
+        retry_policy=RetryPolicy(backoff_factor=0.))
+    events = []
+    collector = HistogramCollector()
+    application.add_hook(events.append)
+    application.add_hook(collector)
+
+    application.request_water_reserves()
+    with pytest.raises(ComError):
+        application.request_water_reserves()
+
+    (success, failure) = events
+    assert success.status == 200 and success.attempts == 2
+    assert success.bytes == len(CONTENT)
+    assert {"rate_limit", "token", "wait", "download", "retry_wait",
+            "parse", "total"} <= set(success.timings)
+    assert success.timings["wait"] == pytest.approx(0.04)
+    assert failure.status == 400 and failure.error == "ComError"
+
+    assert collector.requests == {("water_reserves", "200"): 1,
+                                  ("water_reserves", "400"): 1}
+    assert collector.totals["water_reserves"]["retries"] == 1
+    assert collector.percentile("water_reserves", "wait", 0.5) == 0.025
+    assert collector.percentile("water_reserves", "wait", 0.99) == 0.05
+
+    text = collector.to_prometheus()
+    assert 'py_france_rte_requests_total{endpoint="water_reserves",' \
+        'status="200"} 1' in text
+    assert 'py_france_rte_request_duration_seconds_count{endpoint=' \
+        '"water_reserves",phase="total"} 2' in text
+
+    application.remove_hook(events.append)
+    application.remove_hook(collector)
+    assert application.hooks == []
+
+
+def test_memory_cache_hits(fake_application, fake_response):
+    application = fake_application(
+        [fake_response(200, b'{"signals": []}')],
+        ecowatt_cache=TTLCache(ttl=60))
+    events = []
+    collector = HistogramCollector()
+    application.add_hook(events.append)
+    application.add_hook(collector)
+
+    application.request_ecowatt_signals()
+    application.request_ecowatt_signals()
+
+    assert [event.cache_hit for event in events] == [False, True]
+    assert collector.totals["signals"]["cache_hits"] == 1
+    assert collector.requests == {("signals", "200"): 1,
+                                  ("signals", "cache"): 1}
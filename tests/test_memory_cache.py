@@ -0,0 +1,70 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.memory_cache
+"""
+
+import threading
+import time
+
+import pytest
+
+from py_france_rte.errors import ComError
+from py_france_rte.memory_cache import TTLCache
+
+
+class Loader():
+    def __init__(self, duration=0.):
+        self.count = 0
+        self.duration = duration
+
+    def __call__(self):
+        time.sleep(self.duration)
+        self.count += 1
+        return self.count
+
+
+def test_coalescing():
+    cache = TTLCache(ttl=60)
+    load = Loader(duration=0.05)
+    results = []
+
+    threads = [threading.Thread(
+        target=lambda: results.append(cache.get_or_load("key", load)))
+        for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert load.count == 1
+    assert results == [1] * 10
+    assert cache.get_or_load("key", load) == 1
+    assert cache.stats == {"hits": 1, "stale_hits": 0, "misses": 10,
+                           "coalesced": 9, "errors": 0}
+
+
+def test_stale_while_revalidate():
+    cache = TTLCache(ttl=0, stale_ttl=60)
+    load = Loader(duration=0.05)
+
+    assert cache.get_or_load("key", load) == 1
+    # Stale value returned while refreshing in background
+    assert cache.get_or_load("key", load) == 1
+    assert cache.get_or_load("key", load) == 1
+    time.sleep(0.1)
+    assert load.count == 2
+    assert cache.stats["stale_hits"] == 2
+
+
+def test_load_error():
+    cache = TTLCache(ttl=60)
+
+    def load():
+        raise ComError("Quota exceeded for Ecowatt, code 429")
+
+    with pytest.raises(ComError):
+        cache.get_or_load("key", load)
+    assert cache.get_or_load("key", Loader()) == 1
@@ -0,0 +1,104 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.models
+"""
+
+import datetime
+import math
+
+import pytest
+
+from py_france_rte.models import (DateColumn, EcowattSignal, Series,
+                                  to_models)
+
+VALUES = [
+    {"start_date": "2020-01-01T00:00:00+01:00",
+     "end_date": "2020-01-01T01:00:00+01:00",
+     "value": 1268,
+     "updated_date": "2020-01-02T00:00:00+01:00"},
+    {"start_date": "2020-01-01T01:00:00+01:00",
+     "end_date": "2020-01-01T02:00:00+01:00",
+     "value": None,
+     "updated_date": "2020-01-02T00:00:00+01:00"},
+    {"start_date": "2020-01-01T02:00:00+01:00",
+     "end_date": "2020-01-01T03:00:00+01:00",
+     "value": 1300.5,
+     "updated_date": "2020-01-02T00:00:00+01:00"},
+]
+
+
+def test_date_column_fixed_width():
+    dates = [value["start_date"] for value in VALUES]
+    column = DateColumn(dates)
+    assert isinstance(column._buffer, bytes)
+    assert len(column) == 3
+    assert [column[index] for index in range(3)] == dates
+    assert column[-1] == dates[-1]
+    with pytest.raises(IndexError):
+        column[3]
+    with pytest.raises(IndexError):
+        column[-4]
+    assert column.datetime(1) == datetime.datetime(
+        2020, 1, 1, 0, tzinfo=datetime.timezone.utc)
+
+
+def test_date_column_repeated_dates_stored_once():
+    column = DateColumn(["2020-01-02T00:00:00+01:00"] * 10)
+    assert len(column._buffer) == 25
+    assert len(column) == 10
+    assert column[9] == "2020-01-02T00:00:00+01:00"
+    assert column[-10] == "2020-01-02T00:00:00+01:00"
+
+
+@pytest.mark.parametrize("dates", [
+    ["2020-01-01T00:00:00+01:00", "2020-01-01", None],
+    [None, None, None],
+    [],
+])
+def test_date_column_fallback(dates):
+    column = DateColumn(dates)
+    assert len(column) == len(dates)
+    assert [column[index] for index in range(len(dates))] == dates
+    if dates:
+        assert column[-1] == dates[-1]
+    with pytest.raises(IndexError):
+        column[len(dates)]
+
+
+def test_series_from_dict():
+    series = Series.from_dict({"unit": {"eic_code": "X"},
+                               "values": VALUES})
+    assert series.metadata == {"unit": {"eic_code": "X"}}
+    assert len(series) == 3
+    assert series[0].to_dict() == VALUES[0]
+    assert math.isnan(series[1].value)
+    assert series[-1].value == 1300.5
+    assert series[2].end == datetime.datetime.fromisoformat(
+        "2020-01-01T03:00:00+01:00")
+    assert [point.start_date for point in series] == \
+        [value["start_date"] for value in VALUES]
+    with pytest.raises(IndexError):
+        series[3]
+
+
+def test_to_models():
+    series = to_models({"actual_generations_per_production_type": [
+        {"production_type": "NUCLEAR", "values": VALUES},
+        {"production_type": "SOLAR", "values": []}]})
+    assert [(item.metadata["production_type"], len(item))
+            for item in series] == [("NUCLEAR", 3), ("SOLAR", 0)]
+    assert series[0].metadata["endpoint"] == \
+        "actual_generations_per_production_type"
+
+    signals = to_models({"signals": [{
+        "GenerationFichier": "2022-06-03T00:00:00+02:00",
+        "jour": "2022-06-04T00:00:00+02:00",
+        "dvalue": 2,
+        "message": "Risques de coupures",
+        "values": [{"pas": 0, "hvalue": 1}, {"pas": 23, "hvalue": 3}]}]})
+    assert isinstance(signals[0], EcowattSignal)
+    assert signals[0].hvalues[0] == 1 and signals[0].hvalues[23] == 3
+    assert signals[0].day.day == 4
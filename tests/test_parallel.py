@@ -0,0 +1,66 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.parallel
+"""
+
+import threading
+import time
+
+import pytest
+
+from py_france_rte.errors import ComError
+from py_france_rte.parallel import iter_prefetched, run_bounded
+
+
+def test_run_bounded_keeps_order():
+    def task(index):
+        def run():
+            time.sleep(0.001 * (10 - index))
+            return index
+        return run
+
+    assert run_bounded([task(index) for index in range(10)], 4) == \
+        list(range(10))
+
+
+def test_run_bounded_stops_on_error():
+    started = []
+    lock = threading.Lock()
+
+    def task(index):
+        def run():
+            with lock:
+                started.append(index)
+            if index == 0:
+                raise ComError("Quota exceeded")
+            time.sleep(0.01)
+            return index
+        return run
+
+    with pytest.raises(ComError):
+        run_bounded([task(index) for index in range(100)], 2)
+    assert len(started) < 100
+
+    with pytest.raises(ValueError):
+        run_bounded([], 0)
+
+
+def test_iter_prefetched_is_bounded():
+    started = []
+
+    def task(index):
+        def run():
+            started.append(index)
+            return index
+        return run
+
+    results = iter_prefetched((task(index) for index in range(10)), 2)
+    assert next(results) == 0
+    time.sleep(0.05)
+    assert len(started) <= 3
+    assert list(results) == list(range(1, 10))
+
+    assert list(iter_prefetched([task(0), task(1)], 0)) == [0, 1]
@@ -0,0 +1,88 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.pipeline
+and Application.iter_records
+"""
+
+import datetime
+
+import pytest
+
+from py_france_rte.pipeline import normalize_response
+
+
+def water_reserves_application(fake_generation):
+    return fake_generation(
+        "water_reserves", "water_reserves",
+        step=datetime.timedelta(days=7))
+
+
+def test_normalize_response():
+    response = {"actual_generations_per_unit": [{
+        "start_date": "2020-01-01T00:00:00+01:00",
+        "end_date": "2020-01-01T02:00:00+01:00",
+        "unit": {"eic_code": "17W100P100P0345B", "name": "UNIT"},
+        "values": [
+            {"start_date": "2020-01-01T00:00:00+01:00",
+             "end_date": "2020-01-01T01:00:00+01:00", "value": 10},
+            {"start_date": "2020-01-01T01:00:00+01:00",
+             "end_date": "2020-01-01T02:00:00+01:00", "value": 20}]}]}
+
+    records = list(normalize_response("actual_generation_per_unit", response))
+    assert records[0] == {
+        "endpoint": "actual_generation_per_unit",
+        "unit_eic_code": "17W100P100P0345B",
+        "unit_name": "UNIT",
+        "start_date": "2020-01-01T00:00:00+01:00",
+        "end_date": "2020-01-01T01:00:00+01:00",
+        "value": 10}
+
+    records = list(normalize_response(
+        "actual_generation_per_unit", response, "2020-01-01T00:00:00Z"))
+    assert [record["value"] for record in records] == [20]
+
+
+def test_iter_records(fake_generation):
+    application = water_reserves_application(fake_generation)
+    requested = application.requested
+
+    records = application.iter_records(
+        "2019-01-01T00:00:00+01:00",
+        "2020-01-05T00:00:00+01:00",
+        ["water_reserves"],
+        prefetch=0)
+    assert requested == []
+    records = list(records)
+
+    # The last window overlaps the previous one
+    assert len(requested) == 2
+    assert requested[1][0] < requested[0][1]
+    starts = [record["start_date"] for record in records]
+    assert len(starts) == len(set(starts))
+    assert all(record["endpoint"] == "water_reserves" for record in records)
+
+    # Overlapping windows with different offsets, the second one
+    # starting after the first one ends when compared as strings
+    requested.clear()
+    application._plan_windows = lambda *args: [
+        ("2020-01-01T00:00:00+01:00", "2020-01-15T00:00:00+01:00"),
+        ("2020-01-15T00:30:00+02:00", "2020-01-29T00:30:00+02:00")]
+    records = list(application.iter_records(
+        "2020-01-01T00:00:00+01:00",
+        "2020-01-29T00:30:00+02:00",
+        ["water_reserves"],
+        prefetch=0))
+    assert [record["start_date"] for record in records] == [
+        "2020-01-01T00:00:00+01:00",
+        "2020-01-08T00:00:00+01:00",
+        "2020-01-22T00:30:00+02:00"]
+    del application._plan_windows
+
+    with pytest.raises(RuntimeError):
+        application.iter_records(
+            "2019-01-01T00:00:00+01:00",
+            "2020-06-01T00:00:00+02:00",
+            ["ecowatt_signals"])
@@ -0,0 +1,56 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.rate_limit
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from py_france_rte.errors import ComError, RateLimitError
+from py_france_rte.rate_limit import TokenBucket
+
+
+def test_burst_then_rate():
+    bucket = TokenBucket(rate=100, capacity=5)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(15)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert 0.09 < time.perf_counter() - start < 0.5
+
+
+def test_fail_fast():
+    bucket = TokenBucket(rate=1, capacity=1)
+    bucket.acquire(block=False)
+    with pytest.raises(RateLimitError):
+        bucket.acquire(block=False)
+    with pytest.raises(ComError):
+        bucket.acquire(timeout=0.1)
+
+
+def test_acquire_async():
+    bucket = TokenBucket(rate=100, capacity=1)
+
+    async def acquire_all():
+        await asyncio.gather(*[bucket.acquire_async() for _ in range(6)])
+
+    start = time.perf_counter()
+    asyncio.run(acquire_all())
+    assert 0.045 < time.perf_counter() - start < 0.5
+
+
+def test_invalid_parameters():
+    with pytest.raises(TypeError):
+        TokenBucket("fast")
+    with pytest.raises(ValueError):
+        TokenBucket(0)
@@ -0,0 +1,91 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.registry
+and the request functions resolved from it
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from py_france_rte.application import Application
+from py_france_rte.errors import NoAccessError
+from py_france_rte.memory_cache import TTLCache
+from py_france_rte.registry import ENDPOINTS
+
+START_DATE = "2020-01-01T00:00:00+01:00"
+END_DATE = "2020-01-02T00:00:00+01:00"
+
+
+def test_bind():
+    endpoint = ENDPOINTS["generation_mix_15min"]
+    assert endpoint.bind((START_DATE, END_DATE, "HYDRO"),
+                         {"retry_policy": 1}) == {
+        "start_date": START_DATE,
+        "end_date": END_DATE,
+        "production_type": "HYDRO",
+        "production_subtype": None,
+        "retry_policy": 1}
+    with pytest.raises(TypeError):
+        endpoint.bind((), {"unit_eic_code": "X"})
+    with pytest.raises(TypeError):
+        endpoint.bind((START_DATE,), {"start_date": START_DATE})
+    with pytest.raises(TypeError):
+        ENDPOINTS["ecowatt_signals"].bind((None, None), {})
+
+
+def test_url_for():
+    assert ENDPOINTS["actual_generation_per_unit"].url_for(
+        START_DATE, END_DATE, unit_eic_code="X").endswith(
+        "actual_generations_per_unit?start_date=2020-01-01T00:00:00%2B01:00"
+        "&end_date=2020-01-02T00:00:00%2B01:00&unit_eic_code=X")
+    assert ENDPOINTS["generation_mix_15min"].url_for(
+        production_subtype="HYDRO_PUMPED_STORAGE").endswith(
+        "?production_type=HYDRO&production_subtype=HYDRO_PUMPED_STORAGE")
+    with pytest.raises(ValueError):
+        ENDPOINTS["generation_mix_15min"].url_for(production_type="COAL")
+    with pytest.raises(RuntimeError):
+        ENDPOINTS["water_reserves"].url_for(START_DATE)
+
+
+def test_modules_loaded_lazily():
+    modules = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, py_france_rte.application; "
+         "print([name for name in sys.modules if 'modules' in name])"],
+        check=True, capture_output=True, text=True).stdout
+    assert "actual_generation" not in modules
+
+
+def test_request_functions():
+    application = Application("client", "secret", ["Actual Generation"])
+    requested = []
+    application.request_api = lambda *args: requested.append(args) or {}
+
+    application.request_actual_generation_per_unit(
+        START_DATE, END_DATE, unit_eic_code="X")
+    assert requested[0][0] == ENDPOINTS["actual_generation_per_unit"] \
+        .url_for(START_DATE, END_DATE, unit_eic_code="X")
+    assert requested[0][1:] == ("Actual Generation", END_DATE, None)
+    assert "request_water_reserves" in dir(application)
+
+    with pytest.raises(NoAccessError):
+        application.request_ecowatt_signals()
+    with pytest.raises(AttributeError):
+        application.request_big_substations
+    with pytest.raises(ValueError):
+        application.stream_water_reserves(START_DATE, END_DATE)
+
+
+def test_memory_cached_endpoint():
+    application = Application("client", "secret", ["Ecowatt"],
+                              ecowatt_cache=TTLCache(ttl=60))
+    calls = []
+    application.request_api = lambda *args: calls.append(args) or {"a": 1}
+    assert application.request_ecowatt_signals() == {"a": 1}
+    assert application.request_ecowatt_signals() == {"a": 1}
+    assert len(calls) == 1
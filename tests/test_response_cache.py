@@ -0,0 +1,66 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.response_cache
+"""
+
+import time
+
+import pytest
+
+from py_france_rte.response_cache import (
+    ResponseCache, SQLiteResponseCache)
+
+OLD_END_DATE = "2017-06-12T00:00:00+02:00"
+
+
+def test_sqlite_response_cache(tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / "responses.sqlite"))
+    assert cache.get("url_1") is None
+
+    cache.set("url_1", {"values": [1, 2, 3]}, OLD_END_DATE)
+    assert cache.get("url_1") == {"values": [1, 2, 3]}
+
+    # Shared with another instance
+    other_cache = SQLiteResponseCache(str(tmp_path / "responses.sqlite"))
+    assert other_cache.get("url_1") == {"values": [1, 2, 3]}
+
+    cache.clear()
+    assert other_cache.get("url_1") is None
+
+
+def test_recent_responses_expire():
+    cache = SQLiteResponseCache(":memory:", recent_ttl=0)
+    assert cache.expire_time(OLD_END_DATE) is None
+
+    cache.set("old", {}, OLD_END_DATE)
+    cache.set("recent", {})
+    time.sleep(0.01)
+    assert cache.get("old") == {}
+    assert cache.get("recent") is None
+
+
+def test_lru_eviction():
+    cache = SQLiteResponseCache(":memory:", max_size=70)
+    for index in range(3):
+        cache.set(f"url_{index}", {"value": index}, OLD_END_DATE)
+        time.sleep(0.01)
+    cache.get("url_0")
+    cache.set("url_3", {"value": 3}, OLD_END_DATE)
+
+    assert cache.get("url_0") is not None
+    assert cache.get("url_1") is None
+    assert cache.get("url_3") is not None
+
+
+def test_incomplete_response_cache():
+    class GetOnlyCache(ResponseCache):
+        def get(self, url):
+            return None
+
+    with pytest.raises(TypeError):
+        ResponseCache()
+    with pytest.raises(TypeError):
+        GetOnlyCache()
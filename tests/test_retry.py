@@ -0,0 +1,62 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.retry
+"""
+
+import email.utils
+import time
+
+import pytest
+import requests
+
+from py_france_rte.errors import ComError
+from py_france_rte.retry import RetryPolicy, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("12") == 12.
+    assert parse_retry_after("soon") is None
+    date = email.utils.formatdate(time.time() + 30, usegmt=True)
+    assert 28 < parse_retry_after(date) <= 30
+
+
+def test_retry_policy():
+    policy = RetryPolicy(max_attempts=3, backoff_factor=1., max_backoff=1.5)
+    assert policy.should_retry(1, 503)
+    assert policy.should_retry(1)
+    assert not policy.should_retry(1, 404)
+    assert not policy.should_retry(3, 503)
+    assert 0 <= policy.delay(5) <= 1.5
+    assert policy.delay(1, retry_after=10.) == 10.
+
+
+def test_retried_request(fake_application, fake_response):
+    application = fake_application(
+        [fake_response(503),
+         requests.ConnectionError(),
+         fake_response(429, headers={"Retry-After": "0"}),
+         fake_response(200, b'{"signals": []}')],
+        retry_policy=RetryPolicy(backoff_factor=0.))
+
+    assert application.request_ecowatt_signals() == {"signals": []}
+    assert application.session.count == 4
+
+
+def test_attempts_in_error(fake_application, fake_response):
+    application = fake_application([fake_response(503)] * 3)
+    with pytest.raises(ComError) as info:
+        application.request_ecowatt_signals(
+            retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0.))
+    assert info.value.code == 503
+    assert info.value.attempts == 3
+    assert "3 attempts" in str(info.value)
+
+    # Not a transient error
+    application = fake_application([fake_response(404)])
+    with pytest.raises(ComError) as info:
+        application.request_ecowatt_signals(retry_policy=RetryPolicy())
+    assert info.value.attempts == 1
@@ -0,0 +1,101 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.store
+"""
+
+import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from py_france_rte.store import SeriesStore, series_name
+
+
+def make_response(start, hours, value=1):
+    start = datetime.datetime.fromisoformat(start)
+    step = datetime.timedelta(hours=1)
+    return {"actual_generations_per_production_type": [{
+        "start_date": start.isoformat(),
+        "end_date": (start + hours * step).isoformat(),
+        "production_type": "HYDRO_PUMPED_STORAGE",
+        "values": [{
+            "start_date": (start + index * step).isoformat(),
+            "end_date": (start + (index + 1) * step).isoformat(),
+            "value": value,
+            "updated_date": (start + hours * step).isoformat()}
+            for index in range(hours)]}]}
+
+
+def test_series_name():
+    assert series_name({"endpoint": "x", "production_type": "HYDRO",
+                        "production_subtype": "HYDRO_RUN_OF_RIVER"}) == \
+        "HYDRO__HYDRO_RUN_OF_RIVER"
+    assert series_name({"unit": {"eic_code": "17W100P100P0345B",
+                                 "name": "UNIT 1"}}) == "17W100P100P0345B"
+    assert series_name({"endpoint": "water_reserves"}) == "all"
+
+
+def test_store_merge_and_read(tmp_path):
+    store = SeriesStore(str(tmp_path))
+    endpoint = "actual_generations_per_production_type"
+
+    # Two days across two months, written twice
+    store.write(make_response("2020-01-31T00:00:00+00:00", 48))
+    store.write(make_response("2020-01-31T00:00:00+00:00", 48))
+    # Overlapping update of the last day
+    store.write(make_response("2020-02-01T00:00:00+00:00", 24, value=2))
+
+    assert store.series() == [(endpoint, "HYDRO_PUMPED_STORAGE")]
+    assert sorted(p.name for p in
+                  (tmp_path / endpoint / "HYDRO_PUMPED_STORAGE").glob(
+                      "*.npy")) == ["2020-01.npy", "2020-02.npy"]
+
+    series = store.read(endpoint, "HYDRO_PUMPED_STORAGE")
+    assert len(series) == 48
+    assert np.all(np.diff(series.start) == 3600)
+    assert series.values.tolist() == [1.] * 24 + [2.] * 24
+    assert series.metadata == {"endpoint": endpoint,
+                               "production_type": "HYDRO_PUMPED_STORAGE"}
+
+    # A range within one month is read without copy
+    series = store.read(endpoint, "HYDRO_PUMPED_STORAGE",
+                        "2020-02-01T12:00:00+01:00",
+                        "2020-02-01T14:00:00+01:00")
+    assert len(series) == 2
+    assert isinstance(series.values.base, np.memmap) or \
+        isinstance(series.values, np.memmap)
+
+    assert len(store.read_last(endpoint, "HYDRO_PUMPED_STORAGE", 1)) == 0
+    with pytest.raises(KeyError):
+        store.read(endpoint, "SOLAR")
+
+
+def test_store_metadata_written_once(tmp_path):
+    store = SeriesStore(str(tmp_path))
+    metadata = (tmp_path / "actual_generations_per_production_type"
+                / "HYDRO_PUMPED_STORAGE" / "metadata.json")
+
+    store.write(make_response("2020-01-01T00:00:00+00:00", 24))
+    inode = metadata.stat().st_ino
+    store.write(make_response("2020-01-02T00:00:00+00:00", 24))
+    # Unchanged metadata is not replaced
+    assert metadata.stat().st_ino == inode
+    assert sorted(path.name for path in metadata.parent.iterdir()) == \
+        ["2020-01.npy", "metadata.json"]
+
+
+def test_store_ignores_temporary_files(tmp_path):
+    store = SeriesStore(str(tmp_path))
+    endpoint = "actual_generations_per_production_type"
+    store.write(make_response("2020-01-01T00:00:00+00:00", 24))
+
+    # Left behind by a write in progress or interrupted
+    path = tmp_path / endpoint / "HYDRO_PUMPED_STORAGE"
+    (path / "tmpzwor07p9.npy.tmp").write_bytes(b"")
+    (path / "tmpzwor07p9.npy").write_bytes(b"")
+
+    assert len(store.read(endpoint, "HYDRO_PUMPED_STORAGE")) == 24
@@ -0,0 +1,48 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.streaming
+"""
+
+import json
+
+import pytest
+
+from py_france_rte.streaming import iter_json_items
+
+RESPONSE = {
+    "actual_generations_per_unit": [
+        {"unit": {"eic_code": "17W100P100P0345B", "name": "Électrique"},
+         "values": [{"value": 1250}, {"value": -3.5e2}, {"value": None}]},
+        {"unit": {"eic_code": "17W100P100P0346B"}, "values": []}],
+    "total": 123456,
+    "empty": [],
+    "signals": [[1, 2], "text", 42]}
+
+
+def chunked(data, size):
+    return [data[index:index + size] for index in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 100000])
+def test_iter_json_items(size):
+    data = json.dumps(RESPONSE, indent=1, ensure_ascii=False).encode("utf-8")
+
+    assert list(iter_json_items(chunked(data, size))) == [
+        ("actual_generations_per_unit",
+         RESPONSE["actual_generations_per_unit"][0]),
+        ("actual_generations_per_unit",
+         RESPONSE["actual_generations_per_unit"][1]),
+        ("signals", [1, 2]),
+        ("signals", "text"),
+        ("signals", 42)]
+
+
+def test_invalid_json():
+    assert list(iter_json_items([b" {}"])) == []
+    with pytest.raises(ValueError):
+        list(iter_json_items([b'{"values": [1, 2']))
+    with pytest.raises(ValueError):
+        list(iter_json_items([b'["values"]']))
@@ -0,0 +1,197 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.sync
+and Application.request_incremental
+"""
+
+import datetime
+
+from py_france_rte.sync import (WatermarkStore, drop_values_before,
+                                latest_dates, series_identity,
+                                watermark_key)
+
+
+def mix_application(fake_generation):
+    return fake_generation(
+        "generation_mix_15min", "generation_mix_15min_time_scale",
+        lambda options: [{"production_type": options["production_type"]}],
+        step=datetime.timedelta(minutes=15), updated=True)
+
+
+def per_unit_application(fake_generation, available):
+    return fake_generation(
+        "actual_generation_per_unit", "actual_generations_per_unit",
+        lambda options: [{"unit": {"eic_code": code}, "until": until}
+                         for (code, until) in available.items()],
+        step=datetime.timedelta(hours=1))
+
+
+def test_series_identity():
+    assert series_identity({"unit": {"eic_code": "A"}}) == "A"
+    assert series_identity({"production_type": "HYDRO",
+                            "production_subtype": "HYDRO_PUMPED_STORAGE"}) \
+        == "HYDRO/HYDRO_PUMPED_STORAGE"
+    assert series_identity({"values": []}) == ""
+
+
+def test_watermark_key():
+    assert watermark_key("water_reserves") == "water_reserves"
+    assert watermark_key(
+        "generation_mix_15min",
+        {"production_type": "HYDRO", "production_subtype": None}) == \
+        "generation_mix_15min?production_type=HYDRO"
+
+
+def test_watermark_store(tmp_path):
+    store = WatermarkStore(str(tmp_path / "watermarks.json"))
+    assert store.get("actual_generation_per_type") is None
+
+    store.advance("actual_generation_per_type", {"NUCLEAR": {
+        "end_date": "2020-01-02T00:00:00+01:00",
+        "updated_date": "2020-01-02T00:00:00+01:00"}})
+    store.advance("actual_generation_per_type", {
+        "NUCLEAR": {"end_date": "2020-01-01T00:00:00+01:00",
+                    "updated_date": "2020-01-03T00:00:00+01:00"},
+        "SOLAR": {"end_date": "2020-01-01T00:00:00+01:00"}})
+    assert store.get("actual_generation_per_type") == {
+        "NUCLEAR": {"end_date": "2020-01-02T00:00:00+01:00",
+                    "updated_date": "2020-01-03T00:00:00+01:00"},
+        "SOLAR": {"end_date": "2020-01-01T00:00:00+01:00"}}
+
+    store.clear("actual_generation_per_type")
+    assert store.get("actual_generation_per_type") is None
+
+
+def test_latest_dates_and_revisions():
+    response = {"actual_generations_per_unit": [{
+        "unit": {"eic_code": "A"},
+        "values": [
+            {"start_date": "2020-01-01T00:00:00+01:00",
+             "end_date": "2020-01-01T01:00:00+01:00", "value": 1,
+             "updated_date": "2020-01-02T00:00:00+01:00"},
+            {"start_date": "2020-01-01T01:00:00+01:00",
+             "end_date": "2020-01-01T02:00:00+01:00", "value": 1,
+             "updated_date": "2020-01-01T02:00:00+01:00"}]}]}
+    assert latest_dates(response) == {"A": {
+        "end_date": "2020-01-01T02:00:00+01:00",
+        "updated_date": "2020-01-02T00:00:00+01:00"}}
+
+    # Only the value updated since the watermark is kept
+    watermark = {"A": {"end_date": "2020-01-01T02:00:00+01:00",
+                       "updated_date": "2020-01-01T12:00:00+01:00"}}
+    values = drop_values_before(
+        response, "2020-01-01T00:00:00+01:00",
+        watermark)["actual_generations_per_unit"][0]["values"]
+    assert [value["start_date"] for value in values] == \
+        ["2020-01-01T00:00:00+01:00"]
+
+
+def test_request_incremental(fake_generation, tmp_path):
+    application = mix_application(fake_generation)
+    requested = application.requested
+    store = WatermarkStore(str(tmp_path / "watermarks.json"))
+
+    response = application.request_incremental(
+        "generation_mix_15min", store,
+        "2020-01-01T00:00:00+01:00", "2020-01-03T00:00:00+01:00",
+        production_type="HYDRO")
+    assert len(response["generation_mix_15min_time_scale"][0]["values"]) \
+        == 192
+    assert store.get("generation_mix_15min?production_type=HYDRO") == {
+        "HYDRO": {"end_date": "2020-01-03T00:00:00+01:00",
+                  "updated_date": "2020-01-03T00:00:00+01:00"}}
+
+    # Two more hours, requested over the minimum duration of one day
+    response = application.request_incremental(
+        "generation_mix_15min", store,
+        "2020-01-01T00:00:00+01:00", "2020-01-03T02:00:00+01:00",
+        production_type="HYDRO")
+    assert requested[-1][:2] == ("2020-01-02T02:00:00+01:00",
+                                 "2020-01-03T02:00:00+01:00")
+    values = response["generation_mix_15min_time_scale"][0]["values"]
+    assert len(values) == 8
+    assert values[0]["start_date"] == "2020-01-03T00:00:00+01:00"
+
+    assert application.request_incremental(
+        "generation_mix_15min", store,
+        "2020-01-01T00:00:00+01:00", "2020-01-03T02:00:00+01:00",
+        production_type="HYDRO") == {}
+    assert len(requested) == 2
+
+
+def test_request_incremental_units_advance_separately(
+        fake_generation, tmp_path):
+    # Unit B is published one day later than unit A
+    available = {"A": "2020-01-03T00:00:00+01:00",
+                 "B": "2020-01-02T00:00:00+01:00"}
+    application = per_unit_application(fake_generation, available)
+    requested = application.requested
+    store = WatermarkStore(str(tmp_path / "watermarks.json"))
+
+    application.request_incremental(
+        "actual_generation_per_unit", store,
+        "2020-01-01T00:00:00+01:00", "2020-01-03T00:00:00+01:00")
+    assert store.get("actual_generation_per_unit") == {
+        "A": {"end_date": "2020-01-03T00:00:00+01:00"},
+        "B": {"end_date": "2020-01-02T00:00:00+01:00"}}
+
+    # B catches up, its late values are requested again
+    available["A"] = available["B"] = "2020-01-04T00:00:00+01:00"
+    response = application.request_incremental(
+        "actual_generation_per_unit", store,
+        "2020-01-01T00:00:00+01:00", "2020-01-04T00:00:00+01:00")
+    assert requested[-1][0] == "2020-01-02T00:00:00+01:00"
+    (unit_a, unit_b) = response["actual_generations_per_unit"]
+    assert len(unit_a["values"]) == 24
+    assert unit_a["values"][0]["start_date"] == "2020-01-03T00:00:00+01:00"
+    assert len(unit_b["values"]) == 48
+    assert unit_b["values"][0]["start_date"] == "2020-01-02T00:00:00+01:00"
+    assert store.get("actual_generation_per_unit") == {
+        "A": {"end_date": "2020-01-04T00:00:00+01:00"},
+        "B": {"end_date": "2020-01-04T00:00:00+01:00"}}
+
+
+def test_request_incremental_lagging_unit(fake_generation, tmp_path):
+    # Unit B stopped being published
+    available = {"A": "2020-01-20T00:00:00+01:00",
+                 "B": "2020-01-02T00:00:00+01:00"}
+    application = per_unit_application(fake_generation, available)
+    requested = application.requested
+    store = WatermarkStore(str(tmp_path / "watermarks.json"))
+
+    application.request_incremental(
+        "actual_generation_per_unit", store,
+        "2020-01-01T00:00:00+01:00", "2020-01-20T00:00:00+01:00")
+    available["A"] = "2020-01-21T00:00:00+01:00"
+    application.request_incremental(
+        "actual_generation_per_unit", store,
+        "2020-01-01T00:00:00+01:00", "2020-01-21T00:00:00+01:00",
+        max_lag_days=2)
+    # The range does not start back at the watermark of unit B
+    assert requested[-1][:2] == ("2020-01-18T00:00:00+01:00",
+                                 "2020-01-21T00:00:00+01:00")
+
+
+def test_request_incremental_revisions(fake_generation, tmp_path):
+    application = mix_application(fake_generation)
+    requested = application.requested
+    store = WatermarkStore(str(tmp_path / "watermarks.json"))
+
+    application.request_incremental(
+        "generation_mix_15min", store,
+        "2020-01-01T00:00:00+01:00", "2020-01-03T00:00:00+01:00",
+        production_type="HYDRO")
+    # The fake request updates every value it returns
+    response = application.request_incremental(
+        "generation_mix_15min", store,
+        "2020-01-01T00:00:00+01:00", "2020-01-03T02:00:00+01:00",
+        revision_days=1, production_type="HYDRO")
+    assert requested[-1][0] == "2020-01-02T00:00:00+01:00"
+    values = response["generation_mix_15min_time_scale"][0]["values"]
+    assert len(values) == 104
+    assert store.get("generation_mix_15min?production_type=HYDRO") == {
+        "HYDRO": {"end_date": "2020-01-03T02:00:00+01:00",
+                  "updated_date": "2020-01-03T02:00:00+01:00"}}
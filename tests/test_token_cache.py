@@ -0,0 +1,34 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.token_cache
+"""
+
+from py_france_rte.token_cache import TokenCache
+
+
+def test_token_cache(tmp_path):
+    requests = []
+
+    def request_token():
+        requests.append(None)
+        return (f"token_{len(requests)}", 3600)
+
+    cache = TokenCache(str(tmp_path / "tokens.json"))
+    assert cache.load("client") is None
+
+    (token, _) = cache.refresh("client", 60, request_token)
+    assert token == "token_1"
+    assert cache.load("client", 60)[0] == "token_1"
+
+    # Another process reads the stored token
+    other_cache = TokenCache(str(tmp_path / "tokens.json"))
+    assert other_cache.refresh("client", 60, request_token)[0] == "token_1"
+    assert len(requests) == 1
+
+    # Token not valid long enough
+    assert other_cache.load("client", 7200) is None
+    assert other_cache.refresh("client", 7200, request_token)[0] == "token_2"
+    assert other_cache.load("other_client") is None
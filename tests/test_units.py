@@ -0,0 +1,84 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for Application.request_units
+"""
+
+import pytest
+
+UNITS = [f"17W1000000{index:05d}" for index in range(20)]
+
+
+def unit_series(options):
+    return [{"unit": {"eic_code": code, "name": code}} for code in UNITS
+            if options.get("unit_eic_code") in (None, code)]
+
+
+def per_unit_application(fake_generation):
+    return fake_generation(
+        "actual_generation_per_unit", "actual_generations_per_unit",
+        unit_series, max_workers=4)
+
+
+def requested_units(application):
+    return [options.get("unit_eic_code")
+            for (_, _, options) in application.requested]
+
+
+def test_request_units_filtered(fake_generation):
+    application = per_unit_application(fake_generation)
+
+    units = application.request_units(
+        UNITS[:3] + ["UNKNOWN", UNITS[0]],
+        "2020-01-01T00:00:00+01:00", "2020-01-15T00:00:00+01:00")
+
+    # One request per unit and window
+    assert sorted(requested_units(application)) == \
+        sorted((["UNKNOWN"] + UNITS[:3]) * 2)
+    assert list(units) == UNITS[:3] + ["UNKNOWN"]
+    assert units["UNKNOWN"] is None
+    assert len(units[UNITS[1]]["values"]) == 2
+
+
+def test_request_units_unfiltered(fake_generation):
+    application = per_unit_application(fake_generation)
+
+    units = application.request_units(
+        UNITS[5:], "2020-01-01T00:00:00+01:00", "2020-01-15T00:00:00+01:00")
+
+    # One unfiltered request per window
+    assert requested_units(application) == [None, None]
+    assert list(units) == UNITS[5:]
+    assert all(len(series["values"]) == 2 for series in units.values())
+
+
+def test_request_units_cost(fake_generation):
+    application = per_unit_application(fake_generation)
+
+    # Filtered requests are cheaper when many units are published
+    application.request_units(
+        UNITS[5:], "2020-01-01T00:00:00+01:00", "2020-01-08T00:00:00+01:00",
+        published_units=10000)
+    assert sorted(requested_units(application)) == sorted(UNITS[5:])
+
+    application.requested.clear()
+    application.request_units(
+        UNITS[:2], "2020-01-01T00:00:00+01:00", "2020-01-08T00:00:00+01:00",
+        published_units=0)
+    assert requested_units(application) == [None]
+
+
+def test_request_units_types(fake_generation):
+    application = per_unit_application(fake_generation)
+
+    with pytest.raises(TypeError):
+        application.request_units(
+            UNITS[0], "2020-01-01T00:00:00+01:00",
+            "2020-01-08T00:00:00+01:00")
+    with pytest.raises(TypeError):
+        application.request_units(
+            [UNITS[0], 1], "2020-01-01T00:00:00+01:00",
+            "2020-01-08T00:00:00+01:00")
+    assert application.requested == []
@@ -9,7 +9,7 @@ This file contains the tests for py_france_rte.utils
 import pytest
 
 from py_france_rte.utils import (generate_header, is_int_instance,
-                                 is_str_instance)
+                                 is_str_instance, read_json, write_json)
 
 
 def test_is_str_instance():
@@ -30,3 +30,13 @@ def test_generate_header():
     assert generate_header("My_super_token") == {
         "Host": "digital.iservices.rte-france.com",
         "Authorization": "Bearer My_super_token"}
+
+
+def test_read_write_json(tmp_path):
+    path = str(tmp_path / "store.json")
+    assert read_json(path) == {}
+    write_json(path, {"b": 1, "a": 2}, sort_keys=True)
+    assert read_json(path) == {"a": 2, "b": 1}
+    assert [item.name for item in tmp_path.iterdir()] == ["store.json"]
+    (tmp_path / "store.json").write_text("{truncated")
+    assert read_json(path) == {}
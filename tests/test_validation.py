@@ -0,0 +1,58 @@
+#! /usr/bin/env python3
+# -*- coding: UTF-8 -*-
+# pylint: disable-all
+
+"""
+This file contains the tests for py_france_rte.validation
+and its use by verify_dates
+"""
+
+import pytest
+
+from py_france_rte.utils import verify_dates
+from py_france_rte.validation import DateRules, date_rules, to_timestamp
+
+NOW = to_timestamp("2020-06-01T00:00:00+02:00")
+
+
+def test_to_timestamp():
+    assert to_timestamp("2020-01-01T01:00:00+01:00") == 1577836800
+    assert to_timestamp("2020-01-01T01:00:00+0100") == 1577836800
+    assert to_timestamp("2020-13-01T00:00:00+01:00") is None
+    assert to_timestamp("2020-01-01") is None
+
+
+def test_check_dates():
+    rules = DateRules(7, 1, "2015-01-01")
+    assert rules.check_dates([
+        ("2020-01-01T00:00:00+01:00", "2020-01-08T00:00:00+01:00"),
+        ("2020-01-01", "2020-01-08T00:00:00+01:00"),
+        ("2020-01-01T00:00:00+01:00", "2020-01-08"),
+        ("2014-01-01T00:00:00+01:00", "2014-01-08T00:00:00+01:00"),
+        ("2020-06-01T00:00:00+02:00", "2020-06-02T00:00:00+02:00"),
+        ("2020-01-08T00:00:00+01:00", "2020-01-01T00:00:00+01:00"),
+        ("2020-01-01T00:00:00+01:00", "2020-01-09T00:00:00+01:00"),
+        ("2020-01-01T00:00:00+01:00", "2020-01-01T23:00:00+01:00"),
+    ], NOW) == [None, "start_format", "end_format", "min_date", "future",
+                "order", "max_days", "min_days"]
+
+
+def test_date_rules_shared():
+    assert date_rules(7, 1, "2015-01-01") is date_rules(7, 1, "2015-01-01")
+
+
+def test_verify_dates():
+    verify_dates(None, None, 7, 1, "2015-01-01")
+    verify_dates("2020-01-01T00:00:00+01:00", "2020-01-08T00:00:00+01:00",
+                 7, 1, "2015-01-01")
+    with pytest.raises(ValueError, match="exceeds max_days"):
+        verify_dates("2020-01-01T00:00:00+01:00",
+                     "2020-01-09T00:00:00+01:00", 7, 1, "2015-01-01")
+    with pytest.raises(ValueError, match="Invalid date format for end_date"):
+        verify_dates("2020-01-01T00:00:00+01:00", "2020-01-09",
+                     7, 1, "2015-01-01")
+    with pytest.raises(RuntimeError):
+        verify_dates("2020-01-01T00:00:00+01:00", None, 7, 1, "2015-01-01")
+    with pytest.raises(TypeError):
+        verify_dates("2020-01-01T00:00:00+01:00",
+                     "2020-01-08T00:00:00+01:00", 7., 1, "2015-01-01")